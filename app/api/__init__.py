@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from app.api.health_check import router as healthcheck_router
+from app.api.metrics import router as metrics_router
 from app.api.v1 import v1_router
 
 api_router = APIRouter()
@@ -8,3 +9,4 @@ api_router = APIRouter()
 
 api_router.include_router(healthcheck_router, prefix="/api")
 api_router.include_router(v1_router, prefix="/api")
+api_router.include_router(metrics_router)
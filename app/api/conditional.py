@@ -0,0 +1,95 @@
+"""
+GET condicional (ETag / Last-Modified)
+
+As views calculam os validadores a partir de versões baratas de obter
+(`updated_at` do registro e linhas de versão em entity_counters) e, quando o
+cliente já tem a representação atual (`If-None-Match` / `If-Modified-Since`),
+respondem 304 sem executar a consulta completa nem serializar o output.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import NamedTuple, Optional
+
+from fastapi import Request, Response, status
+
+
+class Validators(NamedTuple):
+    etag: str
+    last_modified: Optional[datetime]
+
+
+def build_validators(*parts, last_modified: Optional[datetime] = None) -> Validators:
+    """
+    Gera os validadores de uma representação
+
+    Args:
+        parts: Valores que identificam a versão (escopo, ids, versões, query)
+        last_modified: Data da última alteração conhecida
+    """
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode())
+    return Validators(
+        etag=f'W/"{digest.hexdigest()[:32]}"', last_modified=last_modified
+    )
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    # Comparação fraca (RFC 9110, 13.1.2): ignora o prefixo W/
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in header.split(",")
+    )
+
+
+def _not_modified_since(header: str, last_modified: Optional[datetime]) -> bool:
+    if last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # Last-Modified tem precisão de segundos
+    return last_modified.replace(microsecond=0) <= since
+
+
+def set_validators(response: Response, validators: Validators) -> None:
+    """Inclui ETag/Last-Modified na resposta e exige revalidação no cliente"""
+    response.headers["ETag"] = validators.etag
+    if validators.last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(
+            validators.last_modified.astimezone(timezone.utc), usegmt=True
+        )
+    response.headers["Cache-Control"] = "private, no-cache"
+
+
+def is_not_modified(
+    headers, etag: Optional[str], last_modified: Optional[datetime]
+) -> bool:
+    """
+    Verifica se o cliente já tem a versão atual
+
+    `If-None-Match` tem precedência sobre `If-Modified-Since`.
+    """
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        return bool(etag) and _etag_matches(if_none_match, etag)
+    if_modified_since = headers.get("if-modified-since")
+    return bool(if_modified_since) and _not_modified_since(
+        if_modified_since, last_modified
+    )
+
+
+def not_modified(request: Request, validators: Validators) -> Optional[Response]:
+    """Retorna uma resposta 304 se o cliente já tem a versão atual"""
+    if not is_not_modified(request.headers, validators.etag, validators.last_modified):
+        return None
+
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, validators)
+    return response
@@ -1,9 +1,25 @@
 from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
 
+from app.services.warmup import readiness
+
 router = APIRouter(tags=["Health Checker"])
 
 
 @router.get(path="/healthcheck", status_code=status.HTTP_200_OK)
 def check_health() -> JSONResponse:
     return JSONResponse(content={"status": "OK"})
+
+
+@router.get(path="/readyz", status_code=status.HTTP_200_OK)
+def check_ready() -> JSONResponse:
+    """Pronto para tráfego: 503 durante o warm-up e no desligamento"""
+    snapshot = readiness.snapshot()
+    return JSONResponse(
+        content=snapshot,
+        status_code=(
+            status.HTTP_200_OK
+            if snapshot["ready"]
+            else status.HTTP_503_SERVICE_UNAVAILABLE
+        ),
+    )
@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Request, Response
+
+from app.core.metrics import render_metrics
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get(path="/metrics", include_in_schema=False)
+def get_metrics(request: Request) -> Response:
+    """Métricas no formato Prometheus (ou OpenMetrics, conforme o Accept)"""
+    body, content_type = render_metrics(request.headers.get("accept", ""))
+    return Response(content=body, media_type=content_type)
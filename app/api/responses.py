@@ -0,0 +1,27 @@
+"""
+Respostas JSON com orjson
+
+`ORJSONResponse` é a response class padrão da aplicação. Serializa UUID,
+datetime, enums e tipos numpy nativamente (sem `str()`/`.isoformat()` nos
+services) e aceita bytes já serializados, que são enviados sem nova
+serialização (payloads vindos de cache).
+
+Rotas que retornam dicts grandes devem devolver `ORJSONResponse(conteudo)`
+diretamente: assim o FastAPI não valida/converte o dict com o
+`response_model` antes de serializar.
+"""
+
+from typing import Any
+
+from fastapi.responses import ORJSONResponse as FastAPIORJSONResponse
+
+from app.core.serialization import dumps
+
+__all__ = ["ORJSONResponse", "dumps"]
+
+
+class ORJSONResponse(FastAPIORJSONResponse):
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return bytes(content)  # pré-serializado
+        return dumps(content)
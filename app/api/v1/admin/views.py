@@ -4,27 +4,40 @@ Admin endpoints para operações administrativas como importação de dados
 
 import csv
 from datetime import datetime
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, Depends, status
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import Session
+from starlette.background import BackgroundTask
 
 from app.api.v1.auth.dependencies import require_admin
+from app.core.profiler import get_profile_path, list_profiles, profile_worker
+from app.core.response_cache import response_cache
 from app.core.settings import get_settings
+from app.core.single_flight import single_flight_stats
+from app.database.exports import MEDIA_TYPES, ExportEntity, ExportFormat, TableExport
 from app.database.models.schemas import Fighter, User
+from app.database.partitions import apply_retention, ensure_partitions
+from app.exceptions.exceptions import NotFoundError
+from app.services.domain.fighter_index import fighter_prefix_index, load_fighter_index
 
 router = APIRouter()
 
-# Criar engine sync para operações de importação
 settings = get_settings()
-sync_engine = create_engine(settings.DATABASE_URL_SYNC)
-SyncSessionLocal = sessionmaker(bind=sync_engine)
+
+
+@lru_cache
+def get_sync_engine() -> Engine:
+    """Engine sync para importações/manutenção (criada no primeiro uso)"""
+    return create_engine(settings.DATABASE_URL_SYNC)
 
 
 def get_sync_session() -> Session:
     """Helper para criar session síncrona para importações"""
-    session = SyncSessionLocal()
+    session = Session(bind=get_sync_engine())
     try:
         return session
     finally:
@@ -33,43 +46,32 @@ def get_sync_session() -> Session:
 
 @router.post("/import/ufc-dataset", status_code=status.HTTP_200_OK)
 async def import_ufc_dataset(
+    force: bool = Query(False, description="Reimporta tudo, ignorando hashes"),
     current_user: User = Depends(require_admin),
 ) -> Dict[str, Any]:
     """
     Importa dataset completo do UFC (fighters, events, fights)
     Requer autenticação de admin
+
+    Incremental: só grava linhas novas ou alteradas e retoma do último
+    checkpoint se a importação anterior falhou.
     """
     session = get_sync_session()
     try:
         from scripts.import_ufc_dataset import UFCDatasetImporter
 
-        importer = UFCDatasetImporter(session)
-
-        # 1. Importar lutadores
-        importer.import_fighters("datasets/fighter_details.csv", current_user)
-
-        # 2. Importar eventos
-        importer.import_events("datasets/event_details.csv", current_user)
-
-        # 3. Importar lutas
-        importer.import_fights("datasets/fight_details.csv")
+        importer = UFCDatasetImporter(session, force=force)
+        importer.run(current_user)
 
-        # 4. Popular vencedores
-        importer.populate_fight_winners("datasets/UFC.csv")
-
-        # 5. Atualizar nomes dos eventos
-        importer.update_event_names()
-
-        # 6. Atualizar cartel dos lutadores
-        importer.update_fighter_cartels()
-
-        # 7. Atualizar categorias de peso
-        importer.update_weight_classes()
+        # Recarregar índice de autocomplete e invalidar o cache de respostas
+        await load_fighter_index()
+        await response_cache.invalidate("fighters", "events")
 
         return {
             "status": "success",
             "message": "Dataset UFC importado com sucesso",
             "stats": importer.stats,
+            "diff": importer.diff_report(),
         }
     except Exception as e:
         return {
@@ -147,6 +149,8 @@ async def update_weight_classes(
                 not_found += 1
 
         session.commit()
+        await load_fighter_index()
+        await response_cache.invalidate("fighters")
 
         return {
             "status": "success",
@@ -162,3 +166,184 @@ async def update_weight_classes(
         }
     finally:
         session.close()
+
+
+@router.post("/maintenance/simulation-partitions", status_code=status.HTTP_200_OK)
+async def maintain_simulation_partitions(
+    current_user: User = Depends(require_admin),
+) -> Dict[str, Any]:
+    """
+    Cria as partições mensais futuras de fight_simulations e aplica a
+    política de retenção configurada (SIMULATION_RETENTION_*)
+    Requer autenticação de admin
+    """
+    try:
+        with get_sync_engine().begin() as connection:
+            created = ensure_partitions(
+                connection, months_ahead=settings.SIMULATION_PARTITIONS_AHEAD
+            )
+            expired = apply_retention(
+                connection,
+                retention_months=settings.SIMULATION_RETENTION_MONTHS,
+                mode=settings.SIMULATION_RETENTION_MODE,
+                archive_schema=settings.SIMULATION_ARCHIVE_SCHEMA,
+            )
+        if expired:
+            await response_cache.invalidate("simulations")
+
+        return {
+            "status": "success",
+            "created_partitions": created,
+            "expired_partitions": expired,
+            "retention_mode": settings.SIMULATION_RETENTION_MODE,
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Erro na manutenção de partições: {str(e)}",
+        }
+
+
+@router.get("/maintenance/autocomplete-index", status_code=status.HTTP_200_OK)
+async def get_autocomplete_index_stats(
+    current_user: User = Depends(require_admin),
+) -> Dict[str, Any]:
+    """
+    Tamanho e memória aproximada do índice de autocomplete deste worker
+    Requer autenticação de admin
+    """
+    return fighter_prefix_index.stats()
+
+
+@router.post("/maintenance/autocomplete-index", status_code=status.HTTP_200_OK)
+async def reload_autocomplete_index(
+    current_user: User = Depends(require_admin),
+) -> Dict[str, Any]:
+    """
+    Reconstrói o índice de autocomplete deste worker a partir do banco
+    Requer autenticação de admin
+    """
+    await load_fighter_index()
+    return fighter_prefix_index.stats()
+
+
+@router.get("/maintenance/response-cache", status_code=status.HTTP_200_OK)
+async def get_response_cache_stats(
+    current_user: User = Depends(require_admin),
+) -> Dict[str, Any]:
+    """
+    Hits/misses e tamanho do cache de respostas HTTP deste worker
+    Requer autenticação de admin
+    """
+    return response_cache.stats()
+
+
+@router.delete("/maintenance/response-cache", status_code=status.HTTP_200_OK)
+async def clear_response_cache(
+    current_user: User = Depends(require_admin),
+) -> Dict[str, Any]:
+    """
+    Remove todas as respostas armazenadas no cache HTTP
+    Requer autenticação de admin
+    """
+    await response_cache.clear()
+    return response_cache.stats()
+
+
+@router.get("/maintenance/single-flight", status_code=status.HTTP_200_OK)
+async def get_single_flight_stats(
+    current_user: User = Depends(require_admin),
+) -> Dict[str, Any]:
+    """
+    Chamadas deduplicadas por grupo de single-flight neste worker
+    Requer autenticação de admin
+    """
+    return single_flight_stats()
+
+
+def _require_profiling() -> None:
+    if not settings.PROFILING_ENABLED:
+        raise NotFoundError("Profiling desabilitado (PROFILING_ENABLED)")
+
+
+@router.post("/maintenance/profile", status_code=status.HTTP_200_OK)
+async def profile_this_worker(
+    seconds: float = Query(
+        10, gt=0, le=settings.PROFILING_MAX_SECONDS, description="Duração"
+    ),
+    all_threads: bool = Query(
+        False, description="Inclui as threads do pool, além do event loop"
+    ),
+    current_user: User = Depends(require_admin),
+) -> Dict[str, Any]:
+    """
+    Profile estatístico do worker que atender esta requisição
+
+    Amostra a pilha durante `seconds` e grava um .folded (flamegraph.pl,
+    speedscope) em PROFILING_DIR. Com vários workers, cada chamada cai em
+    um deles (ver `pid`).
+    Requer autenticação de admin
+    """
+    _require_profiling()
+    return await profile_worker(seconds, all_threads=all_threads)
+
+
+@router.get("/maintenance/profiles", status_code=status.HTTP_200_OK)
+async def get_profiles(
+    current_user: User = Depends(require_admin),
+) -> list[Dict[str, Any]]:
+    """
+    Profiles gravados (do worker e das requisições com X-Profile: 1)
+    Requer autenticação de admin
+    """
+    _require_profiling()
+    return list_profiles()
+
+
+@router.get("/maintenance/profiles/{name}", status_code=status.HTTP_200_OK)
+async def download_profile(
+    name: str,
+    current_user: User = Depends(require_admin),
+) -> FileResponse:
+    """
+    Baixa um profile no formato folded
+    Requer autenticação de admin
+    """
+    _require_profiling()
+    path = get_profile_path(name)
+    if path is None:
+        raise NotFoundError("Profile não encontrado")
+    return FileResponse(path, media_type="text/plain", filename=path.name)
+
+
+@router.get("/export/{entity}", status_code=status.HTTP_200_OK)
+async def export_table(
+    entity: ExportEntity,
+    format: ExportFormat = Query(ExportFormat.ndjson, description="ndjson ou csv"),
+    since: Optional[datetime] = Query(
+        None,
+        description="Apenas linhas criadas/alteradas a partir desta data "
+        "(use o X-Export-Cursor da exportação anterior)",
+    ),
+    current_user: User = Depends(require_admin),
+) -> StreamingResponse:
+    """
+    Exporta uma tabela em streaming (NDJSON ou CSV) com memória constante
+
+    Lê da réplica quando EXPORT_DATABASE_URL está configurada. O header
+    X-Export-Cursor traz o `since` da próxima exportação incremental; ele
+    recua EXPORT_CURSOR_OVERLAP_SECONDS, então deduplique por `id`.
+    Requer autenticação de admin
+    """
+    export = await TableExport(entity, since=since).open()
+    filename = f"{entity.value}-{export.cursor:%Y%m%dT%H%M%S}.{format.value}"
+    return StreamingResponse(
+        export.stream(format),
+        media_type=MEDIA_TYPES[format],
+        # Fecha a conexão mesmo se o corpo nunca for iterado (cliente saiu)
+        background=BackgroundTask(export.close),
+        headers={
+            "X-Export-Cursor": export.cursor.isoformat(),
+            "Content-Disposition": f'attachment; filename="{filename}"',
+        },
+    )
@@ -3,8 +3,9 @@
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
+from app.api.conditional import build_validators, not_modified, set_validators
 from app.api.v1.auth.dependencies import get_current_user
 from app.database.repositories.fight_simulation import FightSimulationRepository
 from app.database.repositories.fighter import FighterRepository
@@ -85,6 +86,8 @@ async def create_event(
     summary="List all events",
 )
 async def list_events(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
     status: Optional[str] = Query(None, description="Filter by status"),
@@ -106,6 +109,13 @@ async def list_events(
     - **search**: Busca por nome do evento (case-insensitive, parcial)
     - **order_by**: Ordenação (created_at, date_desc, date_asc, name_asc, name_desc)
     """
+    version, modified_at = await service.get_events_version()
+    validators = build_validators(
+        "events", request.url.query, version, modified_at, last_modified=modified_at
+    )
+    if cached := not_modified(request, validators):
+        return cached
+
     events = await service.list_events(
         skip=skip,
         limit=limit,
@@ -116,9 +126,9 @@ async def list_events(
     )
 
     # Converte para EventListResponse
-    response = []
+    events_output = []
     for event in events:
-        response.append(
+        events_output.append(
             EventListResponse(
                 id=event.id,
                 name=event.name,
@@ -132,7 +142,8 @@ async def list_events(
             )
         )
 
-    return response
+    set_validators(response, validators)
+    return events_output
 
 
 @router.get(
@@ -142,13 +153,25 @@ async def list_events(
 )
 async def get_event(
     event_id: UUID,
+    request: Request,
+    response: Response,
     service: EventService = Depends(get_event_service),
 ):
     """
     Busca um evento específico pelo ID com todas suas lutas.
+
+    Suporta GET condicional (`If-None-Match` / `If-Modified-Since`).
     """
     try:
+        version, modified_at = await service.get_event_version(event_id)
+        validators = build_validators(
+            "event", event_id, version, modified_at, last_modified=modified_at
+        )
+        if cached := not_modified(request, validators):
+            return cached
+
         event = await service.get_event(event_id)
+        set_validators(response, validators)
         return event
     except Exception as e:
         raise HTTPException(
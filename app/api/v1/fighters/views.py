@@ -2,10 +2,21 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from fastapi.responses import JSONResponse
 
+from app.api.conditional import build_validators, not_modified, set_validators
+from app.api.responses import ORJSONResponse
 from app.api.v1.auth.dependencies import get_current_user
+from app.core.settings import get_settings
 from app.database.models.schemas import User
 from app.database.repositories.fighter import FighterRepository
 from app.database.unit_of_work import UnitOfWorkConnection, get_uow
@@ -15,13 +26,19 @@ from app.schemas.domain.fighters.input import (
     FighterUpdateInput,
 )
 from app.schemas.domain.fighters.output import (
-    FighterListOutput,
+    FIGHTER_FIELDS,
+    FighterCartelOutput,
     FighterOutput,
     FighterStatsOutput,
+    FighterSuggestionOutput,
+    FighterSummaryListOutput,
+    FighterSummaryOutput,
+    parse_fighter_fields,
 )
 from app.services.domain.fighter import FighterService
 
 router = APIRouter(prefix="/fighters", tags=["Fighters"])
+settings = get_settings()
 
 
 def get_fighter_service(uow: UnitOfWorkConnection = Depends(get_uow)) -> FighterService:
@@ -30,6 +47,33 @@ def get_fighter_service(uow: UnitOfWorkConnection = Depends(get_uow)) -> Fighter
     return FighterService(fighter_repo)
 
 
+def get_fighter_fields(
+    fields: str = Query(
+        None,
+        description=(
+            "Campos retornados, separados por vírgula (ex: name,record,overall_rating)."
+            " Sem o parâmetro, retorna todos exceto cartel e bio."
+            f" Disponíveis: {', '.join(FIGHTER_FIELDS)}"
+        ),
+    ),
+) -> tuple[str, ...]:
+    """Dependency que valida o parâmetro `fields` das listagens"""
+    try:
+        return parse_fighter_fields(fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        ) from e
+
+
+async def _fighters_validators(request: Request, service: FighterService, scope: str):
+    """ETag/Last-Modified de leituras derivadas da tabela de lutadores"""
+    version, modified_at = await service.get_fighters_version()
+    return build_validators(
+        scope, request.url.query, version, modified_at, last_modified=modified_at
+    )
+
+
 @router.post(
     "/",
     response_model=FighterOutput,
@@ -56,17 +100,93 @@ async def create_fighter(
     return FighterOutput.model_validate(fighter)
 
 
+# Declarada antes de /{fighter_id} para não ser capturada como ID
+@router.get(
+    "/autocomplete",
+    response_model=list[FighterSuggestionOutput],
+    summary="Autocomplete de lutadores",
+)
+async def autocomplete_fighters(
+    q: str = Query(..., min_length=2, max_length=100, description="Termo buscado"),
+    limit: int = Query(
+        settings.AUTOCOMPLETE_MAX_RESULTS,
+        ge=1,
+        le=settings.AUTOCOMPLETE_MAX_RESULTS,
+        description="Quantidade de sugestões",
+    ),
+    service: FighterService = Depends(get_fighter_service),
+):
+    """
+    Retorna os lutadores com nome ou apelido mais parecidos com o termo.
+
+    A busca ignora acentos e tolera erros de digitação (ex: "makachev"
+    encontra "Islam Makhachev"). Resultados ordenados por similaridade.
+    """
+    suggestions = await service.autocomplete_fighters(term=q, limit=limit)
+    return [FighterSuggestionOutput.model_validate(s) for s in suggestions]
+
+
 @router.get(
     "/{fighter_id}", response_model=FighterOutput, summary="Buscar lutador por ID"
 )
 async def get_fighter(
-    fighter_id: UUID, service: FighterService = Depends(get_fighter_service)
+    fighter_id: UUID,
+    request: Request,
+    response: Response,
+    service: FighterService = Depends(get_fighter_service),
 ):
-    """Retorna os detalhes de um lutador específico"""
+    """
+    Retorna os detalhes de um lutador específico
+
+    Suporta GET condicional (`If-None-Match` / `If-Modified-Since`).
+    """
+    version, modified_at = await service.get_fighter_version(fighter_id)
+    validators = build_validators(
+        "fighter", fighter_id, version, modified_at, last_modified=modified_at
+    )
+    if cached := not_modified(request, validators):
+        return cached
+
     fighter = await service.get_fighter(fighter_id)
+    set_validators(response, validators)
     return FighterOutput.model_validate(fighter)
 
 
+@router.get(
+    "/{fighter_id}/cartel",
+    response_model=FighterCartelOutput,
+    summary="Cartel do lutador (paginado)",
+)
+async def get_fighter_cartel(
+    fighter_id: UUID,
+    request: Request,
+    limit: int = Query(20, ge=1, le=100, description="Lutas por página"),
+    offset: int = Query(0, ge=0, description="Offset para paginação"),
+    service: FighterService = Depends(get_fighter_service),
+):
+    """
+    Retorna o histórico de lutas do lutador, mais recentes primeiro
+
+    Suporta GET condicional (`If-None-Match` / `If-Modified-Since`).
+    """
+    version, modified_at = await service.get_fighter_cartel_version(fighter_id)
+    validators = build_validators(
+        "fighter-cartel",
+        fighter_id,
+        request.url.query,
+        version,
+        modified_at,
+        last_modified=modified_at,
+    )
+    if cached := not_modified(request, validators):
+        return cached
+
+    cartel = await service.get_fighter_cartel(fighter_id, limit=limit, offset=offset)
+    response = ORJSONResponse(cartel.model_dump())
+    set_validators(response, validators)
+    return response
+
+
 @router.put("/{fighter_id}", response_model=FighterOutput, summary="Atualizar lutador")
 async def update_fighter(
     fighter_id: UUID,
@@ -97,8 +217,9 @@ async def delete_fighter(
     )
 
 
-@router.get("/", response_model=FighterListOutput, summary="Buscar lutadores")
+@router.get("/", response_model=FighterSummaryListOutput, summary="Buscar lutadores")
 async def search_fighters(
+    request: Request,
     name: str = Query(None, description="Buscar por nome"),
     last_organization_fight: str = Query(
         None, description="Filtrar por última organização"
@@ -109,13 +230,26 @@ async def search_fighters(
     min_overall: int = Query(None, ge=0, le=100, description="Rating mínimo"),
     limit: int = Query(10, ge=1, le=100, description="Limite de resultados"),
     offset: int = Query(0, ge=0, description="Offset para paginação"),
+    exact: bool = Query(
+        False, description="Total exato (COUNT) ao combinar vários filtros"
+    ),
+    fields: tuple[str, ...] = Depends(get_fighter_fields),
     service: FighterService = Depends(get_fighter_service),
 ):
     """
     Busca lutadores com diversos filtros.
 
     Retorna uma lista paginada de lutadores que correspondem aos critérios.
+    O total vem de contadores mantidos pelo banco; ao combinar filtros ele é
+    estimado, a menos que `exact=true` seja informado.
+
+    `fields` restringe as colunas lidas e devolvidas; cartel e bio só vêm
+    quando pedidos explicitamente.
     """
+    validators = await _fighters_validators(request, service, "fighters")
+    if cached := not_modified(request, validators):
+        return cached
+
     search_params = FighterSearchInput(
         name=name,
         last_organization_fight=last_organization_fight,
@@ -127,30 +261,36 @@ async def search_fighters(
         offset=offset,
     )
 
-    fighters = await service.search_fighters(search_params)
+    fighters = await service.search_fighters(search_params, fields=fields)
 
     # Buscar o total de lutadores (para paginação)
-    total_fighters = await service.get_total_fighters(search_params)
+    total_fighters = await service.get_total_fighters(search_params, exact=exact)
 
-    return FighterListOutput(
-        fighters=[FighterOutput.model_validate(f) for f in fighters],
-        total=total_fighters,
-        limit=limit,
-        offset=offset,
+    response = ORJSONResponse(
+        {
+            "fighters": fighters,
+            "total": total_fighters,
+            "limit": limit,
+            "offset": offset,
+        }
     )
+    set_validators(response, validators)
+    return response
 
 
 @router.get(
     "/rankings/top",
-    response_model=list[FighterOutput],
+    response_model=list[FighterSummaryOutput],
     summary="Top 15 lutadores overall",
 )
 async def get_top_fighters(
+    request: Request,
     last_organization_fight: str = Query(
         None, description="Filtrar por última organização"
     ),
     actual_weight_class: str = Query(None, description="Filtrar por categoria atual"),
     limit: int = Query(15, ge=1, le=50, description="Quantidade de lutadores"),
+    fields: tuple[str, ...] = Depends(get_fighter_fields),
     service: FighterService = Depends(get_fighter_service),
 ):
     """
@@ -159,13 +299,20 @@ async def get_top_fighters(
     Lista unificada masculino + feminino, ordenados por overall rating.
     Pode filtrar por última organização e/ou categoria de peso atual.
     """
+    validators = await _fighters_validators(request, service, "fighters-top")
+    if cached := not_modified(request, validators):
+        return cached
+
     fighters = await service.get_top_fighters(
         last_organization_fight=last_organization_fight,
         actual_weight_class=actual_weight_class,
         limit=limit,
+        fields=fields,
     )
 
-    return [FighterOutput.model_validate(f) for f in fighters]
+    response = ORJSONResponse(fighters)
+    set_validators(response, validators)
+    return response
 
 
 @router.get(
@@ -174,6 +321,11 @@ async def get_top_fighters(
     summary="Estatísticas gerais",
 )
 async def get_fighter_statistics(
+    request: Request,
+    response: Response,
+    exact: bool = Query(
+        False, description="Recalcula com COUNT(*) em vez de usar os contadores"
+    ),
     service: FighterService = Depends(get_fighter_service),
 ):
     """
@@ -185,22 +337,30 @@ async def get_fighter_statistics(
     - Distribuição por categoria de peso
     - Média geral de rating
     """
-    stats = await service.get_fighter_stats()
+    validators = await _fighters_validators(request, service, "fighters-stats")
+    if cached := not_modified(request, validators):
+        return cached
+
+    stats = await service.get_fighter_stats(exact=exact)
+    set_validators(response, validators)
     return FighterStatsOutput(**stats)
 
 
 @router.get(
-    "/my/fighters", response_model=list[FighterOutput], summary="Meus lutadores"
+    "/my/fighters",
+    response_model=list[FighterSummaryOutput],
+    summary="Meus lutadores",
 )
 async def get_my_fighters(
     current_user: User = Depends(get_current_user),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    fields: tuple[str, ...] = Depends(get_fighter_fields),
     service: FighterService = Depends(get_fighter_service),
 ):
-    """Retorna os lutadores criados pelo usuário atual"""
+    """Retorna os lutadores criados pelo usuário atual (aceita `fields`)"""
     fighters = await service.get_fighters_by_creator(
-        creator_id=current_user.id, limit=limit, offset=offset
+        creator_id=current_user.id, limit=limit, offset=offset, fields=fields
     )
 
-    return [FighterOutput.model_validate(f) for f in fighters]
+    return ORJSONResponse(fighters)
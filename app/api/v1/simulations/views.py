@@ -2,8 +2,10 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
+from app.api.conditional import build_validators, not_modified, set_validators
+from app.api.responses import ORJSONResponse
 from app.database.repositories.fight_simulation import FightSimulationRepository
 from app.database.repositories.fighter import FighterRepository
 from app.database.unit_of_work import UnitOfWorkConnection, get_uow
@@ -51,7 +53,10 @@ async def simulate_fight(
         created_by="testeer",  # current_user.email,
     )
 
-    return await service.get_simulation_with_details(simulation)
+    return ORJSONResponse(
+        await service.get_simulation_with_details(simulation),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.get("/predict", response_model=dict, summary="Prever resultado de luta")
@@ -67,7 +72,7 @@ async def predict_fight(
     Útil para ver quem seria o favorito antes de simular.
     """
     prediction = await service.predict_fight(fighter1_id, fighter2_id)
-    return prediction
+    return ORJSONResponse(prediction)
 
 
 @router.get("/compare", response_model=dict, summary="Comparar dois lutadores")
@@ -83,7 +88,7 @@ async def compare_fighters(
     mostrando vantagens e diferenças.
     """
     comparison = await service.compare_fighters(fighter1_id, fighter2_id)
-    return comparison
+    return ORJSONResponse(comparison)
 
 
 @router.get(
@@ -102,7 +107,7 @@ async def get_fighter_simulation_history(
 
     Mostra todas as lutas simuladas, vitórias, derrotas e estatísticas.
     """
-    return await service.get_fighter_history(fighter_id, limit, offset)
+    return ORJSONResponse(await service.get_fighter_history(fighter_id, limit, offset))
 
 
 @router.get(
@@ -121,7 +126,9 @@ async def get_matchup_history(
     Útil para ver quantas vezes eles já se enfrentaram em simulações
     e qual lutador tem vantagem no head-to-head.
     """
-    return await service.get_matchup_history_formatted(fighter1_id, fighter2_id)
+    return ORJSONResponse(
+        await service.get_matchup_history_formatted(fighter1_id, fighter2_id)
+    )
 
 
 @router.get("/recent", response_model=list[dict], summary="Simulações recentes")
@@ -134,7 +141,7 @@ async def get_recent_simulations(
 
     Útil para ver a atividade recente e descobrir lutas interessantes.
     """
-    return await service.get_recent_simulations_formatted(limit)
+    return ORJSONResponse(await service.get_recent_simulations_formatted(limit))
 
 
 @router.get(
@@ -143,11 +150,31 @@ async def get_recent_simulations(
     summary="Estatísticas gerais de simulações",
 )
 async def get_simulation_statistics(
+    request: Request,
+    response: Response,
+    exact: bool = Query(
+        False, description="Recalcula com COUNT(*) em vez de usar o contador"
+    ),
     service: FightSimulationService = Depends(get_simulation_service),
 ):
     """
     Retorna estatísticas agregadas sobre simulações.
 
-    - Total de simulações realizadas
+    - Total de simulações realizadas (contador mantido pelo banco)
+
+    Suporta GET condicional (`If-None-Match` / `If-Modified-Since`).
     """
-    return await service.get_simulation_stats()
+    version, modified_at = await service.get_simulation_stats_version()
+    validators = build_validators(
+        "simulation-stats",
+        request.url.query,
+        version,
+        modified_at,
+        last_modified=modified_at,
+    )
+    if cached := not_modified(request, validators):
+        return cached
+
+    stats = await service.get_simulation_stats(exact=exact)
+    set_validators(response, validators)
+    return stats
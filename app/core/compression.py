@@ -0,0 +1,92 @@
+"""
+Codecs de compressão de respostas (gzip e brotli opcional)
+
+Usados pelo CompressionMiddleware e pelo cache de respostas, que armazena as
+entradas já comprimidas em cada codificação disponível.
+"""
+
+import gzip
+import zlib
+from typing import Optional
+
+from app.core.settings import get_settings
+
+try:  # Brotli é opcional: sem o pacote apenas gzip é negociado
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+settings = get_settings()
+
+# Em ordem de preferência
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/x-ndjson",
+    "image/svg+xml",
+    "text/",
+)
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Escolhe br ou gzip a partir do Accept-Encoding (respeita q=0)"""
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if coding:
+            accepted[coding] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    candidates = list(ENCODINGS)
+    scored = [(accepted.get(coding, wildcard), coding) for coding in candidates]
+    scored = [item for item in scored if item[0] > 0]
+    if not scored:
+        return None
+    # Maior q vence; empate fica com a ordem de preferência (br antes de gzip)
+    return max(scored, key=lambda item: (item[0], -candidates.index(item[1])))[1]
+
+
+class StreamCompressor:
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(
+                quality=settings.COMPRESSION_BROTLI_QUALITY
+            )
+        else:
+            self._zlib = zlib.compressobj(
+                settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+            )
+
+    def compress(self, data: bytes) -> bytes:
+        # Flush a cada pedaço para o cliente receber o stream progressivamente
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._zlib.flush(zlib.Z_FINISH)
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=settings.COMPRESSION_GZIP_LEVEL)
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.decompress(data)
+    return gzip.decompress(data)
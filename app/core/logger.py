@@ -1,10 +1,41 @@
+"""
+Logging da aplicação
+
+Os registros não são escritos na thread que loga: o QueueHandler só
+enfileira o LogRecord e um QueueListener (thread própria) formata e escreve
+no stderr. A mensagem é montada no listener, então prefira o estilo lazy
+(`logger.info("x=%s", x)`) a f-strings nos caminhos quentes.
+
+Configuração (Settings):
+    LOG_ENVIROMENT          nível padrão (INFO)
+    LOG_LEVELS              nível por módulo, ex: "prediction_service=WARNING;
+                            sqlalchemy.engine=INFO" (nomes com ponto são
+                            loggers; sem ponto, o módulo que gerou o registro)
+    LOG_FORMAT              json (uma linha por registro, com os `extra`) | text
+    LOG_SAMPLE_PER_SECOND   máximo de DEBUG/INFO por linha de código por
+                            segundo; o excedente é descartado e contado em
+                            `suppressed` no próximo registro aceito (0 = tudo)
+"""
+
+import atexit
 import logging
-import logging.config
+import queue
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 
+import orjson
+
+from app.core.settings import get_settings
 from app.middlewares.trace_id import get_trace_id
 
+settings = get_settings()
+
 logger = logging.getLogger(__name__)
 
+# Atributos padrão do LogRecord; o resto veio de `extra=` e vai para o JSON
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
 
 class AddTraceIdFilter(logging.Filter):
     def filter(self, record):
@@ -12,29 +43,141 @@ class AddTraceIdFilter(logging.Filter):
         return super().filter(record)
 
 
-custom_filter = AddTraceIdFilter()
-logger.addFilter(custom_filter)
-logger_config = {
-    "version": 1,
-    "disable_existing_loggers": False,
-    "formatters": {
-        "default": {
-            "()": "uvicorn.logging.DefaultFormatter",
-            "fmt": "%(levelprefix)s [%(trace_id)s][%(asctime)s:%(msecs)03d]"
-            "[%(filename)s][%(funcName)s:%(lineno)d][%(message)s]",
-            "datefmt": "%d-%m-%Y %H:%M:%S",
+class ModuleLevelFilter(logging.Filter):
+    """Nível mínimo por módulo (`record.module`), com um nível padrão"""
+
+    def __init__(self, default_level: int, levels: dict[str, int]):
+        super().__init__()
+        self.default_level = default_level
+        self.levels = levels
+
+    def filter(self, record):
+        return record.levelno >= self.levels.get(record.module, self.default_level)
+
+
+class SamplingFilter(logging.Filter):
+    """Limita DEBUG/INFO a `per_second` registros por linha de código"""
+
+    def __init__(self, per_second: int):
+        super().__init__()
+        self.per_second = per_second
+        # (arquivo, linha) -> [segundo, aceitos no segundo, descartados]
+        self._sites: dict[tuple[str, int], list[int]] = {}
+
+    def filter(self, record):
+        if record.levelno > logging.INFO:
+            return True
+        state = self._sites.setdefault((record.pathname, record.lineno), [0, 0, 0])
+        second = int(record.created)
+        if state[0] != second:
+            state[0], state[1] = second, 0
+        if state[1] >= self.per_second:
+            state[2] += 1
+            return False
+        state[1] += 1
+        if state[2]:
+            record.suppressed = state[2]
+            state[2] = 0
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Um objeto JSON por linha, incluindo os campos passados em `extra`"""
+
+    def format(self, record):
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc)
+            .isoformat(timespec="milliseconds")
+            .replace("+00:00", "Z"),
+            "level": record.levelname,
+            "trace_id": getattr(record, "trace_id", None),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "message": record.getMessage(),
         }
-    },
-    "handlers": {
-        "default": {
-            "formatter": "default",
-            "class": "logging.StreamHandler",
-            "stream": "ext://sys.stderr",
-        },
-    },
-    "loggers": {
-        "app": {"handlers": ["default"], "level": "DEBUG"},
-    },
-}
-logging.config.dictConfig(logger_config)
-logger.setLevel(logging.INFO)
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and key not in payload:
+                payload[key] = value
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload, default=str).decode()
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    Enfileira o registro como está
+
+    O QueueHandler padrão formata a mensagem em `prepare` (na thread que
+    loga); aqui isso fica para o listener. Os argumentos são referências:
+    não logue objetos que vão ser alterados logo em seguida.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+def parse_levels(value: str) -> dict[str, int]:
+    """Converte "a=WARNING;b.c=DEBUG" em {"a": 30, "b.c": 10} (aceita ; ou ,)"""
+    levels = {}
+    for item in value.replace(",", ";").split(";"):
+        name, _, level = item.partition("=")
+        number = logging.getLevelName(level.strip().upper())
+        if name.strip() and isinstance(number, int):
+            levels[name.strip()] = number
+    return levels
+
+
+def _stream_handler() -> logging.Handler:
+    handler = logging.StreamHandler(sys.stderr)
+    if settings.LOG_FORMAT == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        from uvicorn.logging import DefaultFormatter
+
+        handler.setFormatter(
+            DefaultFormatter(
+                "%(levelprefix)s [%(trace_id)s][%(asctime)s:%(msecs)03d]"
+                "[%(filename)s][%(funcName)s:%(lineno)d][%(message)s]",
+                datefmt="%d-%m-%Y %H:%M:%S",
+            )
+        )
+    return handler
+
+
+def _configure() -> QueueListener:
+    default_level = logging.getLevelName(settings.LOG_ENVIROMENT.upper())
+    log_queue = queue.SimpleQueue()
+    queue_handler = LazyQueueHandler(log_queue)
+    if settings.LOG_SAMPLE_PER_SECOND > 0:
+        queue_handler.addFilter(SamplingFilter(settings.LOG_SAMPLE_PER_SECOND))
+    queue_handler.addFilter(AddTraceIdFilter())
+
+    app_logger = logging.getLogger("app")
+    app_logger.addHandler(queue_handler)
+    app_logger.setLevel(logging.DEBUG)
+
+    module_levels = {}
+    for name, level in parse_levels(settings.LOG_LEVELS).items():
+        if "." not in name:
+            module_levels[name] = level
+            continue
+        named_logger = logging.getLogger(name)
+        named_logger.setLevel(level)
+        if not name.startswith("app."):
+            # Bibliotecas (ex: sqlalchemy.engine) passam pela mesma fila
+            named_logger.addHandler(queue_handler)
+            named_logger.propagate = False
+
+    # Nível efetivo mais baixo entre o padrão e os por módulo; o filtro
+    # aplica o nível de cada módulo
+    logger.setLevel(min([default_level, *module_levels.values()]))
+    logger.addFilter(ModuleLevelFilter(default_level, module_levels))
+
+    listener = QueueListener(log_queue, _stream_handler())
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+log_listener = _configure()
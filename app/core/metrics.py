@@ -0,0 +1,120 @@
+"""
+Métricas Prometheus/OpenMetrics (expostas em /metrics)
+
+Requisições HTTP (latência por rota/status e em andamento), pool de conexões,
+cache de respostas, inferência ML, simulações por tipo de resultado e
+progresso da importação do dataset. Os valores são atualizados por eventos
+(incrementos e observações em memória), sem trabalho extra na coleta.
+
+Com vários workers (uvicorn --workers WORKERS) defina PROMETHEUS_MULTIPROC_DIR
+com um diretório vazio a cada deploy: cada processo grava seus valores em
+arquivos mmap e o /metrics de qualquer worker agrega todos. O container faz
+isso em scripts/start.sh (variável definida no Dockerfile, diretório
+recriado a cada start). Sem a variável, cada processo expõe só as próprias
+métricas.
+"""
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.openmetrics import exposition as openmetrics
+from sqlalchemy import event
+
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Latência das requisições HTTP",
+    ("method", "route", "status"),
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Requisições HTTP em andamento",
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Tamanho configurado do pool de conexões",
+    ("pool",),
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_connections_checked_out",
+    "Conexões do pool em uso",
+    ("pool",),
+    multiprocess_mode="livesum",
+)
+
+RESPONSE_CACHE_REQUESTS = Counter(
+    "response_cache_requests",
+    "Consultas ao cache de respostas (hit ratio = hit / (hit + miss))",
+    ("result",),
+)
+RESPONSE_CACHE_HITS = RESPONSE_CACHE_REQUESTS.labels("hit")
+RESPONSE_CACHE_MISSES = RESPONSE_CACHE_REQUESTS.labels("miss")
+
+ML_INFERENCE_LATENCY = Histogram(
+    "ml_inference_duration_seconds",
+    "Latência do predict_proba do modelo",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+ML_BATCH_SIZE = Histogram(
+    "ml_inference_batch_size",
+    "Linhas por chamada de inferência",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
+)
+
+SIMULATIONS = Counter(
+    "fight_simulations",
+    "Lutas simuladas por tipo de resultado",
+    ("result_type", "source"),
+)
+
+IMPORT_ROWS = Counter(
+    "dataset_import_rows",
+    "Linhas processadas na importação do dataset UFC",
+    ("entity", "change"),
+)
+IMPORT_PROGRESS = Gauge(
+    "dataset_import_rows_done",
+    "Linhas concluídas (checkpoint) por etapa da importação",
+    ("step",),
+    multiprocess_mode="mostrecent",
+)
+
+
+def instrument_pool(engine, name: str) -> None:
+    """Conexões em uso no pool da engine (para AsyncEngine, use `.sync_engine`)"""
+    pool = engine.pool
+    DB_POOL_SIZE.labels(name).inc(pool.size() if hasattr(pool, "size") else 0)
+    checked_out = DB_POOL_CHECKED_OUT.labels(name)
+    event.listen(pool, "checkout", lambda *args: checked_out.inc())
+    event.listen(pool, "checkin", lambda *args: checked_out.dec())
+
+
+def render_metrics(accept: str = "") -> tuple[bytes, str]:
+    """Corpo e content-type do /metrics (OpenMetrics se o scraper pedir)"""
+    registry = REGISTRY
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    if "application/openmetrics-text" in accept:
+        return openmetrics.generate_latest(registry), openmetrics.CONTENT_TYPE_LATEST
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """Remove os gauges "live" deste worker ao encerrar (modo multiprocess)"""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,217 @@
+"""
+Profiler estatístico (amostragem de pilha) para workers em produção
+
+Uma thread lê a pilha das threads alvo a cada PROFILING_INTERVAL_MS via
+`sys._current_frames()`; nada é instrumentado, então o custo fica restrito
+à janela de profiling. As amostras são agregadas no formato "folded"
+(`func_a;func_b;func_c <n>`), aceito por flamegraph.pl, speedscope e
+inferno, e gravadas em PROFILING_DIR.
+
+Dois modos:
+    - worker: todas as requisições do event loop (e, opcionalmente, das
+      demais threads) durante N segundos (POST /admin/maintenance/profile)
+    - requisição: header `X-Profile: 1` de um admin; só as amostras em que a
+      task da requisição está rodando, mais onde ela está suspensa
+      (prefixo "(await)") enquanto espera I/O
+
+Desligado por padrão (PROFILING_ENABLED).
+"""
+
+import asyncio
+import os
+import re
+import sys
+import sysconfig
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from app.core.settings import get_settings
+
+settings = get_settings()
+
+AWAIT_FRAME = "(await)"
+
+_cwd = os.getcwd() + os.sep
+_stdlib = sysconfig.get_paths()["stdlib"] + os.sep
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    if "site-packages" + os.sep in filename:
+        filename = filename.rsplit("site-packages" + os.sep, 1)[1]
+    elif filename.startswith(_stdlib):
+        filename = filename[len(_stdlib) :]
+    elif filename.startswith(_cwd):
+        filename = filename[len(_cwd) :]
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({filename})".replace(";", ",")
+
+
+def _thread_stack(frame) -> list[str]:
+    stack = []
+    while frame is not None:
+        stack.append(_frame_name(frame))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def _suspended_stack(task: asyncio.Task) -> list[str]:
+    """Cadeia de corrotinas em que a task está parada (cr_await)"""
+    stack = [AWAIT_FRAME]
+    coro = task.get_coro()
+    while coro is not None:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+        if frame is not None:
+            stack.append(_frame_name(frame))
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+    return stack
+
+
+class StackSampler:
+    """
+    Amostra a pilha de uma thread (ou de todas) em intervalos fixos
+
+    Com `task`, conta só as amostras da task (rodando ou suspensa); `loop`
+    é o event loop dela.
+    """
+
+    def __init__(
+        self,
+        thread_id: Optional[int] = None,
+        interval: float = 0.005,
+        task: Optional[asyncio.Task] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.task = task
+        self.loop = loop
+        self.samples: Counter = Counter()
+        self.started_at: Optional[float] = None
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "StackSampler":
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.perf_counter() - self.started_at
+        return self.samples
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            if self.thread_id is not None:
+                frame = frames.get(self.thread_id)
+                if frame is not None:
+                    self._sample_thread(frame)
+                continue
+            for thread_id, frame in frames.items():
+                if thread_id == own_id:
+                    continue
+                if thread_id not in names:
+                    names = {t.ident: t.name for t in threading.enumerate()}
+                stack = _thread_stack(frame)
+                stack.insert(0, names.get(thread_id, str(thread_id)))
+                self.samples[";".join(stack)] += 1
+
+    def _sample_thread(self, frame) -> None:
+        if self.task is None:
+            self.samples[";".join(_thread_stack(frame))] += 1
+            return
+        if self.task.done():
+            return
+        try:
+            if asyncio.current_task(self.loop) is self.task:
+                stack = _thread_stack(frame)
+            else:
+                stack = _suspended_stack(self.task)
+        except (RuntimeError, ValueError):  # task mudando de estado
+            return
+        self.samples[";".join(stack)] += 1
+
+
+def profile_path(label: str) -> Path:
+    """Caminho de um novo arquivo .folded em PROFILING_DIR"""
+    directory = Path(settings.PROFILING_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+    label = re.sub(r"[^A-Za-z0-9_-]+", "_", label).strip("_")[:60] or "profile"
+    return directory / f"{stamp}-{os.getpid()}-{label}.folded"
+
+
+def write_folded(samples: Counter, path: Path) -> Path:
+    """Grava as pilhas agregadas no formato folded (uma por linha)"""
+    lines = "".join(f"{stack} {count}\n" for stack, count in samples.most_common())
+    path.write_text(lines, encoding="utf-8")
+    return path
+
+
+def summarize(samples: Counter, top: int = 15) -> dict:
+    """Total de amostras e as funções com mais amostras próprias (folha)"""
+    leaves: Counter = Counter()
+    for stack, count in samples.items():
+        leaves[stack.rsplit(";", 1)[-1]] += count
+    total = sum(samples.values())
+    return {
+        "samples": total,
+        "top_functions": [
+            {
+                "function": name,
+                "samples": count,
+                "percent": round(100 * count / total, 1),
+            }
+            for name, count in leaves.most_common(top)
+        ],
+    }
+
+
+def list_profiles() -> list[dict]:
+    directory = Path(settings.PROFILING_DIR)
+    if not directory.is_dir():
+        return []
+    files = sorted(directory.glob("*.folded"), reverse=True)
+    return [{"name": file.name, "bytes": file.stat().st_size} for file in files]
+
+
+def get_profile_path(name: str) -> Optional[Path]:
+    """Arquivo de PROFILING_DIR pelo nome (sem permitir sair do diretório)"""
+    path = Path(settings.PROFILING_DIR) / Path(name).name
+    if path.suffix != ".folded" or not path.is_file():
+        return None
+    return path
+
+
+async def profile_worker(seconds: float, all_threads: bool = False) -> dict:
+    """Amostra este worker por `seconds` e grava o .folded"""
+    thread_id = None if all_threads else threading.get_ident()
+    interval = settings.PROFILING_INTERVAL_MS / 1000
+    sampler = StackSampler(thread_id=thread_id, interval=interval).start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        samples = sampler.stop()
+    path = await asyncio.to_thread(write_folded, samples, profile_path("worker"))
+    return {
+        "file": path.name,
+        "pid": os.getpid(),
+        "seconds": round(sampler.duration, 3),
+        **summarize(samples),
+    }
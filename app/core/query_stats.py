@@ -0,0 +1,138 @@
+"""
+Contagem de queries e tempo de banco por requisição
+
+Hooks `before_cursor_execute`/`after_cursor_execute` da engine medem cada
+statement. Dentro de `track_queries()` (aberto pelo ResponseTimeMiddleware
+para cada requisição) o total de queries, o tempo de banco e as repetições
+de cada statement ficam num `QueryStats` guardado em context var, então as
+contagens não se misturam entre requisições concorrentes e os logs saem com
+o trace_id da requisição.
+
+Statements acima de DB_SLOW_QUERY_MS são logados com o SQL normalizado e o
+formato dos parâmetros (tipos, nunca valores).
+"""
+
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from time import perf_counter
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.logger import logger
+from app.core.settings import get_settings
+
+settings = get_settings()
+
+_START_KEY = "query_stats_start"
+
+# Listas de placeholders (IN ($1::UUID, $2::UUID, ...)) viram "(...)"
+_PLACEHOLDER = r"(?:\$\d+|\?|%\(\w+\)s|:\w+)(?:::[\w\[\]]+)?"
+_PLACEHOLDER_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryStats:
+    """Queries executadas numa requisição"""
+
+    __slots__ = ("count", "duration", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0  # segundos
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements[normalize_sql(statement)] += 1
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """Statements executados mais de `threshold` vezes (suspeita de N+1)"""
+        return {
+            statement: count
+            for statement, count in self.statements.most_common()
+            if count > threshold
+        }
+
+
+_query_stats_ctx_var: ContextVar[Optional[QueryStats]] = ContextVar(
+    "query_stats", default=None
+)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Conta as queries executadas no contexto atual (e nas tasks filhas)"""
+    stats = QueryStats()
+    token = _query_stats_ctx_var.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats_ctx_var.reset(token)
+
+
+def get_query_stats() -> Optional[QueryStats]:
+    return _query_stats_ctx_var.get()
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(statement: str) -> str:
+    """SQL em uma linha, com listas de placeholders colapsadas"""
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    return _PLACEHOLDER_LIST.sub("(...)", statement)
+
+
+def parameters_shape(parameters, executemany: bool = False) -> str:
+    """Tipos dos parâmetros, sem os valores (ex: "(UUID, int)")"""
+    if executemany and isinstance(parameters, (list, tuple)) and parameters:
+        return f"{len(parameters)} x {parameters_shape(parameters[0])}"
+    if isinstance(parameters, dict):
+        items = ", ".join(
+            f"{key}: {type(value).__name__}" for key, value in parameters.items()
+        )
+        return "{" + items + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(type(value).__name__ for value in parameters) + ")"
+    return type(parameters).__name__
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_START_KEY, []).append(perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get(_START_KEY)
+    if not starts:
+        return
+    duration = perf_counter() - starts.pop()
+
+    stats = _query_stats_ctx_var.get()
+    if stats is not None:
+        stats.record(statement, duration)
+
+    if settings.DB_SLOW_QUERY_MS and duration * 1000 >= settings.DB_SLOW_QUERY_MS:
+        logger.warning(
+            f"Slow query ({duration * 1000:.1f} ms): {normalize_sql(statement)} "
+            f"| params: {parameters_shape(parameters, executemany)}"
+        )
+
+
+def _handle_error(exception_context):
+    # O statement falhou: descarta o início registrado em before_cursor_execute
+    connection = exception_context.connection
+    if connection is not None and connection.info.get(_START_KEY):
+        connection.info[_START_KEY].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Registra os hooks na engine (para AsyncEngine, use `.sync_engine`)"""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -0,0 +1,227 @@
+"""
+Cache de respostas HTTP
+
+Armazena respostas prontas de GETs idempotentes: status, headers e o corpo
+já comprimido em cada codificação disponível (gzip e, com o pacote brotli,
+br), então hits não gastam CPU com compressão. Cada entrada fica associada a
+tags ("fighters", "events", "simulations"); a invalidação incrementa a geração da tag, que faz parte da
+chave, então entradas antigas simplesmente deixam de ser encontradas e
+expiram pelo TTL/LRU.
+
+Backends:
+    memory: LRU em processo (por worker)
+    redis: compartilhado entre workers (redis.asyncio); gerações também no Redis
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from app.core.compression import ENCODINGS, compress, decompress
+from app.core.logger import logger
+from app.core.metrics import RESPONSE_CACHE_HITS, RESPONSE_CACHE_MISSES
+from app.core.settings import get_settings
+
+settings = get_settings()
+
+KEY_PREFIX = "response-cache"
+
+
+class CachedResponse(NamedTuple):
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    bodies: dict[str, bytes]  # corpo comprimido por codificação (gzip, br)
+
+    @classmethod
+    def build(cls, status: int, headers: list, body: bytes) -> "CachedResponse":
+        # Comprime uma vez por miss; hits servem os bytes prontos
+        return cls(
+            status,
+            headers,
+            {encoding: compress(body, encoding) for encoding in ENCODINGS},
+        )
+
+    @property
+    def size(self) -> int:
+        return sum(len(body) for body in self.bodies.values())
+
+    def body(self, encoding: Optional[str]) -> bytes:
+        """Corpo na codificação pedida (None = sem compressão)"""
+        if encoding in self.bodies:
+            return self.bodies[encoding]
+        return decompress(self.bodies["gzip"], "gzip")
+
+    def dumps(self) -> bytes:
+        meta = {
+            "status": self.status,
+            "headers": [
+                [k.decode("latin-1"), v.decode("latin-1")] for k, v in self.headers
+            ],
+            "bodies": [[encoding, len(body)] for encoding, body in self.bodies.items()],
+        }
+        return json.dumps(meta).encode() + b"\n" + b"".join(self.bodies.values())
+
+    @classmethod
+    def loads(cls, raw: bytes) -> "CachedResponse":
+        meta, payload = raw.split(b"\n", 1)
+        data = json.loads(meta)
+        headers = [
+            (k.encode("latin-1"), v.encode("latin-1")) for k, v in data["headers"]
+        ]
+        bodies, offset = {}, 0
+        for encoding, length in data["bodies"]:
+            bodies[encoding] = payload[offset : offset + length]
+            offset += length
+        return cls(data["status"], headers, bodies)
+
+
+class MemoryCacheBackend:
+    """LRU em processo com TTL por entrada"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, CachedResponse]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, entry = item
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CachedResponse, ttl: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl, entry)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def generations(self, tags: tuple[str, ...]) -> list[int]:
+        return [self._generations.get(tag, 0) for tag in tags]
+
+    async def invalidate(self, tags: tuple[str, ...]) -> None:
+        for tag in tags:
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": sum(entry.size for _, entry in self._entries.values()),
+            "generations": dict(self._generations),
+        }
+
+
+class RedisCacheBackend:
+    """Cache compartilhado entre workers"""
+
+    def __init__(self, host: str, port: int):
+        from redis import asyncio as redis_asyncio
+
+        self.client = redis_asyncio.Redis(host=host, port=port)
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        raw = await self.client.get(f"{KEY_PREFIX}:entry:{key}")
+        return CachedResponse.loads(raw) if raw else None
+
+    async def set(self, key: str, entry: CachedResponse, ttl: int) -> None:
+        await self.client.set(f"{KEY_PREFIX}:entry:{key}", entry.dumps(), ex=ttl)
+
+    async def generations(self, tags: tuple[str, ...]) -> list[int]:
+        values = await self.client.mget([f"{KEY_PREFIX}:tag:{tag}" for tag in tags])
+        return [int(value or 0) for value in values]
+
+    async def invalidate(self, tags: tuple[str, ...]) -> None:
+        async with self.client.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                pipe.incr(f"{KEY_PREFIX}:tag:{tag}")
+            await pipe.execute()
+
+    async def clear(self) -> None:
+        async for key in self.client.scan_iter(f"{KEY_PREFIX}:entry:*"):
+            await self.client.delete(key)
+
+    def stats(self) -> dict:
+        return {"backend": "redis"}
+
+
+class ResponseCache:
+    """
+    Fachada usada pelo middleware e pelos hooks de escrita dos services
+
+    Erros do backend nunca quebram a requisição: viram miss (leitura) ou só
+    são registrados (escrita/invalidação).
+    """
+
+    def __init__(self, backend, ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    async def build_key(self, parts: tuple, tags: tuple[str, ...]) -> Optional[str]:
+        """Chave da entrada: partes da requisição + geração atual de cada tag"""
+        try:
+            generations = await self.backend.generations(tags)
+        except Exception as e:
+            logger.error(f"Erro ao ler gerações do cache de respostas: {e}")
+            return None
+        raw = "|".join(str(part) for part in (*parts, *generations))
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        try:
+            entry = await self.backend.get(key)
+        except Exception as e:
+            logger.error(f"Erro ao ler cache de respostas: {e}")
+            entry = None
+        if entry is None:
+            self.misses += 1
+            RESPONSE_CACHE_MISSES.inc()
+        else:
+            self.hits += 1
+            RESPONSE_CACHE_HITS.inc()
+        return entry
+
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        try:
+            await self.backend.set(key, entry, self.ttl)
+        except Exception as e:
+            logger.error(f"Erro ao gravar cache de respostas: {e}")
+
+    async def invalidate(self, *tags: str) -> None:
+        """Invalida as respostas associadas às tags (hook de escrita)"""
+        try:
+            await self.backend.invalidate(tags)
+        except Exception as e:
+            logger.error(f"Erro ao invalidar cache de respostas {tags}: {e}")
+
+    async def clear(self) -> None:
+        await self.backend.clear()
+
+    def stats(self) -> dict:
+        return {
+            "enabled": settings.RESPONSE_CACHE_ENABLED,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            **self.backend.stats(),
+        }
+
+
+def _build_backend():
+    if settings.RESPONSE_CACHE_BACKEND == "redis":
+        return RedisCacheBackend(settings.REDIS_HOST, settings.REDIS_PORT)
+    return MemoryCacheBackend(settings.RESPONSE_CACHE_MAX_ENTRIES)
+
+
+# Singleton instance
+response_cache = ResponseCache(_build_backend(), settings.RESPONSE_CACHE_TTL_SECONDS)
@@ -0,0 +1,31 @@
+"""
+Serialização JSON com orjson
+
+Regras compartilhadas pelas respostas da API (ORJSONResponse), pelo cache de
+respostas e pelas exportações: UUID, datetime, enums e tipos numpy são
+serializados nativamente.
+"""
+
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import orjson
+
+OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(value: Any) -> Any:
+    # asyncpg devolve sua própria subclasse de UUID, que o orjson não aceita
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serializa para JSON (bytes) com as mesmas regras das respostas"""
+    return orjson.dumps(content, default=_default, option=OPTIONS)
@@ -17,12 +17,74 @@ class Settings(BaseSettings):
 
     APP_ENVIRONMENT: str = "production"
     LOG_ENVIROMENT: str = "INFO"
+    LOG_LEVELS: str = ""  # por módulo, ex: "prediction_service=WARNING"
+    LOG_FORMAT: str = "json"  # json | text
+    LOG_SAMPLE_PER_SECOND: int = 0  # DEBUG/INFO por linha de código; 0 = tudo
     HOST: str = "localhost"
     PORT: str = "8000"
     WORKERS: int = 3
 
+    # Modelo ML (gs:// usa gcsfs; qualquer outro valor é um caminho local)
+    ML_MODEL_PATH: str = "gs://modelo-mma-fightbase/mma_model_v1.joblib"
+
+    # Warm-up antes de ficar pronto (/api/readyz)
+    WARMUP_DB_CONNECTIONS: int = 5  # 0 = não abre conexões antecipadas
+    WARMUP_PREDICTION_BATCH: int = 8  # 0 = só carrega o modelo
+    WARMUP_PRIME_CACHE: bool = True
+    WARMUP_TIMEOUT_SECONDS: int = 120
+
     # Alembic
     APP_MIGRATIONS_FOLDER: str = "./migrations"
+    # check | upgrade | off (o upgrade roda em scripts/migrate.py)
+    MIGRATIONS_ON_STARTUP: str = "check"
+
+    # Fight simulations (particionamento mensal e retenção)
+    SIMULATION_PARTITIONS_AHEAD: int = 3
+    SIMULATION_RETENTION_MONTHS: int = 24  # 0 = manter tudo
+    SIMULATION_RETENTION_MODE: str = "archive"  # archive | drop
+    SIMULATION_ARCHIVE_SCHEMA: str = "archive"
+
+    # Busca por similaridade (pg_trgm)
+    SEARCH_SIMILARITY_THRESHOLD: float = 0.4  # word_similarity mínima (0-1)
+    AUTOCOMPLETE_MAX_RESULTS: int = 10
+    AUTOCOMPLETE_INDEX_REFRESH_SECONDS: int = 300  # 0 = sem recarga periódica
+
+    # Cache de respostas HTTP (GETs idempotentes)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_BACKEND: str = "memory"  # memory | redis
+    RESPONSE_CACHE_TTL_SECONDS: int = 60
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1024  # apenas backend memory
+
+    # Compressão de respostas (gzip/brotli)
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # bytes; corpos menores vão sem compressão
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
+    # Exportações em streaming (NDJSON/CSV)
+    EXPORT_DATABASE_URL: str = ""  # ex: réplica de leitura; vazio = DATABASE_URL
+    EXPORT_BATCH_SIZE: int = 1000  # linhas por lote lido do cursor no servidor
+    EXPORT_CURSOR_OVERLAP_SECONDS: int = 60  # o cursor recua isso (dedupe por id)
+
+    # Instrumentação de queries (por requisição)
+    DB_SLOW_QUERY_MS: int = 200  # loga statements mais lentos; 0 = desligado
+    DB_N_PLUS_ONE_THRESHOLD: int = 0  # avisa acima de N repetições; 0 = desligado
+
+    # Métricas Prometheus (/metrics)
+    METRICS_ENABLED: bool = True
+
+    # Tracing OpenTelemetry (desligado por padrão)
+    TRACING_ENABLED: bool = False
+    TRACING_EXPORTER: str = "otlp"  # otlp | console | file
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    TRACING_FILE_PATH: str = "traces.jsonl"
+    TRACING_SAMPLE_RATIO: float = 1.0
+    TRACING_SERVICE_NAME: str = "fight-base"
+
+    # Profiler por amostragem (endpoints admin e header X-Profile: 1)
+    PROFILING_ENABLED: bool = False
+    PROFILING_DIR: str = "profiles"
+    PROFILING_INTERVAL_MS: int = 5
+    PROFILING_MAX_SECONDS: int = 60
 
     # Mongo
     MONGO_USER: str = "root"
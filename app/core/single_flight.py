@@ -0,0 +1,132 @@
+"""
+Single-flight (coalescência de chamadas concorrentes)
+
+Chamadas idênticas e simultâneas (mesma chave) aguardam um único future em
+andamento em vez de repetir a computação: a primeira executa (líder), as
+demais recebem uma cópia (deepcopy) do resultado ou a mesma exceção; assim
+uma requisição que altera o dict recebido não afeta as outras. Não há
+cache: assim que o líder termina a chave é liberada.
+
+Cada grupo publica métricas (chamadas, execuções, deduplicadas, falhas) em
+`single_flight_stats()`.
+"""
+
+import asyncio
+import copy
+import functools
+import inspect
+from enum import Enum
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+
+_groups: dict[str, "SingleFlight"] = {}
+
+
+class _LeaderCancelled(Exception):
+    """O líder foi cancelado; quem aguardava tenta de novo"""
+
+
+class SingleFlight:
+    """Grupo de chamadas coalescidas por chave"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.executions = 0
+        self.deduplicated = 0
+        self.failures = 0
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        _groups[name] = self
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Executa `fn` ou aguarda a execução já em andamento para a chave"""
+        self.calls += 1
+        while (future := self._inflight.get(key)) is not None:
+            self.deduplicated += 1
+            try:
+                return copy.deepcopy(await asyncio.shield(future))
+            except _LeaderCancelled:
+                self.deduplicated -= 1
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.executions += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            raise
+        except BaseException as e:
+            self.failures += 1
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+            # Evita "Future exception was never retrieved" sem seguidores
+            if future.done() and not future.cancelled():
+                future.exception()
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "deduplicated": self.deduplicated,
+            "failures": self.failures,
+            "inflight": len(self._inflight),
+        }
+
+
+def _normalize(value: Any) -> Hashable:
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_normalize(item) for item in value))
+    if isinstance(value, dict):
+        return tuple(sorted((key, _normalize(item)) for key, item in value.items()))
+    return value
+
+
+def single_flight(name: str):
+    """
+    Decorator para métodos async de services/repositories
+
+    A chave é a tupla normalizada dos argumentos (posicionais e nomeados
+    resolvidos pela assinatura, com defaults), ignorando `self`: instâncias
+    diferentes (uma por requisição) compartilham o mesmo grupo. Use apenas em
+    métodos de leitura cujo retorno são dados simples (dict/list, copiados
+    para os seguidores), nunca objetos ligados à sessão do líder.
+    """
+    group = SingleFlight(name)
+
+    def decorator(method: Callable[..., Awaitable[T]]):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        async def wrapper(*args, **kwargs) -> T:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(
+                (argument, _normalize(value))
+                for argument, value in bound.arguments.items()
+                if argument != "self"
+            )
+            return await group.do(key, lambda: method(*args, **kwargs))
+
+        wrapper.single_flight = group
+        return wrapper
+
+    return decorator
+
+
+def single_flight_stats() -> dict:
+    """Métricas de todos os grupos registrados"""
+    return {name: group.stats() for name, group in sorted(_groups.items())}
@@ -0,0 +1,191 @@
+"""
+Tracing distribuído (OpenTelemetry)
+
+Spans por rota (TracingMiddleware), por método dos services (`traced` /
+`traced_methods`), por query executada na engine e por chamada de
+`predict_proba`. O contexto chega pelo header W3C `traceparent`; sem ele, o
+trace id é aleatório (o sampler por razão depende de ids uniformes, e o
+cliente não pode escolher a amostragem). O `x-trace-id` dos logs vai no
+atributo `app.trace_id` do span da requisição.
+
+Desligado por padrão (TRACING_ENABLED). Exportadores (TRACING_EXPORTER):
+    otlp     coletor OTLP/HTTP (TRACING_OTLP_ENDPOINT)
+    console  spans no stdout
+    file     um span JSON por linha em TRACING_FILE_PATH (uso offline)
+
+Com o tracing desligado os wrappers só checam uma flag e chamam a função.
+"""
+
+import functools
+import inspect
+import threading
+from typing import Callable, Optional, Sequence
+
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from app.core.query_stats import normalize_sql
+from app.core.settings import get_settings
+
+settings = get_settings()
+
+tracer = trace.get_tracer("app")
+
+_SPAN_KEY = "tracing_spans"
+_enabled = False
+_provider = None
+
+
+def tracing_enabled() -> bool:
+    return _enabled
+
+
+def _build_exporter():
+    from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+    if settings.TRACING_EXPORTER == "console":
+        return ConsoleSpanExporter()
+    if settings.TRACING_EXPORTER == "file":
+        return FileSpanExporter(settings.TRACING_FILE_PATH)
+
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+        OTLPSpanExporter,
+    )
+
+    return OTLPSpanExporter(endpoint=settings.TRACING_OTLP_ENDPOINT)
+
+
+def create_provider(sample_ratio: float):
+    """TracerProvider sem exportador (ids aleatórios, amostragem por razão)"""
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    return TracerProvider(
+        resource=Resource.create({"service.name": settings.TRACING_SERVICE_NAME}),
+        sampler=ParentBased(TraceIdRatioBased(sample_ratio)),
+    )
+
+
+def setup_tracing() -> None:
+    """Configura o provider global (uma vez por processo)"""
+    global _enabled, _provider
+    if not settings.TRACING_ENABLED or _provider is not None:
+        return
+
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    _provider = create_provider(settings.TRACING_SAMPLE_RATIO)
+    _provider.add_span_processor(BatchSpanProcessor(_build_exporter()))
+    trace.set_tracer_provider(_provider)
+    _enabled = True
+
+
+def shutdown_tracing() -> None:
+    """Exporta os spans pendentes"""
+    if _provider is not None:
+        _provider.shutdown()
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Decorator: executa a função (sync ou async) dentro de um span"""
+
+    def decorator(fn: Callable) -> Callable:
+        span_name = name or fn.__qualname__
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if not _enabled:
+                    return await fn(*args, **kwargs)
+                with tracer.start_as_current_span(span_name):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with tracer.start_as_current_span(span_name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def traced_methods(exclude: Sequence[str] = ()) -> Callable:
+    """Decorator de classe: um span por método (exceto dunders e `exclude`)"""
+
+    def decorator(cls):
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("__") or attr in exclude:
+                continue
+            if inspect.isfunction(value):
+                setattr(cls, attr, traced(f"{cls.__name__}.{attr}")(value))
+        return cls
+
+    return decorator
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if not _enabled:
+        return
+    statement = normalize_sql(statement)
+    span = tracer.start_span(
+        statement.split(" ", 1)[0].upper() or "query",
+        kind=SpanKind.CLIENT,
+        attributes={"db.system": "postgresql", "db.statement": statement[:2000]},
+    )
+    conn.info.setdefault(_SPAN_KEY, []).append(span)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    spans = conn.info.get(_SPAN_KEY)
+    if spans:
+        spans.pop().end()
+
+
+def _handle_error(exception_context):
+    connection = exception_context.connection
+    if connection is None or not connection.info.get(_SPAN_KEY):
+        return
+    span = connection.info[_SPAN_KEY].pop()
+    span.record_exception(exception_context.original_exception)
+    span.set_status(Status(StatusCode.ERROR))
+    span.end()
+
+
+def trace_engine(engine) -> None:
+    """Um span por statement (para AsyncEngine, use `.sync_engine`)"""
+    from sqlalchemy import event
+
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class FileSpanExporter:
+    """Grava cada span como uma linha JSON (sem coletor, para uso offline)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans):
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        lines = "".join(span.to_json(indent=None) + "\n" for span in spans)
+        with self._lock, open(self.path, "a", encoding="utf-8") as file:
+            file.write(lines)
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        pass
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
@@ -0,0 +1,235 @@
+"""
+Exportação de tabelas em streaming (NDJSON / CSV)
+
+As linhas são lidas com cursor no servidor (`AsyncConnection.stream` +
+`yield_per`) e codificadas em lotes, então a memória usada não depende do
+tamanho da tabela. A leitura roda numa transação REPEATABLE READ somente
+leitura, em uma engine própria que pode apontar para uma réplica
+(EXPORT_DATABASE_URL).
+
+Exportações incrementais usam `since`: linhas criadas, alteradas ou
+removidas (soft delete) a partir do instante informado. O `cursor` retornado
+deve ser usado como `since` da próxima exportação. Ele fica ATRÁS do
+snapshot: created_at/updated_at/deleted_at são preenchidos pelo app antes do
+commit, então uma transação que marcou T0 e commitou depois do snapshot não
+aparece nesta exportação e só é pega na próxima se o cursor for <= T0. O
+cursor é o menor entre o instante do snapshot (na réplica, o último commit
+aplicado) e o início da transação de escrita mais antiga em andamento (só
+visível no primário), menos EXPORT_CURSOR_OVERLAP_SECONDS. Exportações
+consecutivas se sobrepõem nessa janela: o consumidor deve deduplicar por `id`
+(ficando com a versão mais recente).
+"""
+
+import csv
+import io
+from datetime import datetime
+from enum import Enum
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+
+from app.core.logger import logger
+from app.core.metrics import instrument_pool
+from app.core.query_stats import instrument_engine
+from app.core.tracing import trace_engine
+from app.core.serialization import dumps
+from app.core.settings import get_settings
+from app.database.models.base import Event, Fight, Fighter, FightSimulation, User
+
+settings = get_settings()
+
+_engine: Optional[AsyncEngine] = None
+
+
+class ExportEntity(str, Enum):
+    users = "users"
+    fighters = "fighters"
+    events = "events"
+    fights = "fights"
+    simulations = "simulations"
+
+
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv; charset=utf-8",
+}
+
+_MODELS = {
+    ExportEntity.users: User,
+    ExportEntity.fighters: Fighter,
+    ExportEntity.events: Event,
+    ExportEntity.fights: Fight,
+    ExportEntity.simulations: FightSimulation,
+}
+
+# Colunas que nunca saem nas exportações
+_EXCLUDED_COLUMNS = {ExportEntity.users: ("password",)}
+
+# Instante do snapshot (na réplica, o último commit aplicado; no primário, now())
+# ou o início da escrita mais antiga ainda aberta, menos a janela de segurança
+# para timestamps preenchidos pelo app antes do início da transação
+CURSOR_SQL = """
+SELECT least(
+    coalesce(pg_last_xact_replay_timestamp(), now()),
+    (
+        SELECT min(xact_start) FROM pg_stat_activity
+        WHERE backend_xid IS NOT NULL AND pid <> pg_backend_pid()
+    )
+) - make_interval(secs => :overlap)
+"""
+
+
+def get_export_engine() -> AsyncEngine:
+    """Engine das exportações (réplica, se configurada)"""
+    global _engine
+    if _engine is None:
+        _engine = create_async_engine(
+            settings.EXPORT_DATABASE_URL or settings.DATABASE_URL,
+            pool_size=2,
+            max_overflow=0,
+        )
+        instrument_engine(_engine.sync_engine)
+        instrument_pool(_engine.sync_engine, "export")
+        trace_engine(_engine.sync_engine)
+    return _engine
+
+
+def _changed_at(table):
+    # Simulações são imutáveis: created_at também permite poda de partições
+    if table.name == FightSimulation.__tablename__:
+        return table.c.created_at
+    return func.greatest(table.c.created_at, table.c.updated_at, table.c.deleted_at)
+
+
+def export_columns(entity: ExportEntity) -> list:
+    """Colunas exportadas da entidade (ordem da tabela)"""
+    excluded = _EXCLUDED_COLUMNS.get(entity, ())
+    table = _MODELS[entity].__table__
+    return [column for column in table.columns if column.key not in excluded]
+
+
+def build_export_query(entity: ExportEntity, since: Optional[datetime] = None):
+    """SELECT das colunas exportadas, ordenado pela data da última alteração"""
+    table = _MODELS[entity].__table__
+    changed_at = _changed_at(table)
+    query = select(*export_columns(entity)).order_by(changed_at, table.c.id)
+    if since is not None:
+        query = query.filter(changed_at >= since)
+    return query
+
+
+class TableExport:
+    """
+    Leitura em streaming de uma tabela exportável
+
+    Uso:
+        async with TableExport(ExportEntity.fighters, since=...) as export:
+            async for chunk in export.encode(ExportFormat.ndjson):
+                ...
+    """
+
+    def __init__(
+        self,
+        entity: ExportEntity,
+        since: Optional[datetime] = None,
+        batch_size: Optional[int] = None,
+        engine: Optional[AsyncEngine] = None,
+    ):
+        self.entity = ExportEntity(entity)
+        self.since = since
+        self.batch_size = batch_size or settings.EXPORT_BATCH_SIZE
+        self.engine = engine or get_export_engine()
+        self.cursor: Optional[datetime] = None
+        self.rows = 0
+        self._connection: Optional[AsyncConnection] = None
+
+    async def open(self) -> "TableExport":
+        """Abre a transação do snapshot e calcula o cursor"""
+        connection = await self.engine.connect()
+        try:
+            connection = await connection.execution_options(
+                isolation_level="REPEATABLE READ"
+            )
+            await connection.begin()
+            await connection.execute(text("SET TRANSACTION READ ONLY"))
+            self.cursor = await connection.scalar(
+                text(CURSOR_SQL),
+                {"overlap": settings.EXPORT_CURSOR_OVERLAP_SECONDS},
+            )
+        except Exception:
+            await connection.close()
+            raise
+        self._connection = connection
+        return self
+
+    async def close(self) -> None:
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            await connection.close()
+
+    async def __aenter__(self) -> "TableExport":
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def batches(self) -> AsyncIterator[list[dict]]:
+        """Lotes de até `batch_size` linhas, lidos do cursor no servidor"""
+        if self._connection is None:
+            raise RuntimeError("Export not open. Use async context manager.")
+        query = build_export_query(self.entity, self.since).execution_options(
+            yield_per=self.batch_size
+        )
+        result = await self._connection.stream(query)
+        async for partition in result.mappings().partitions():
+            self.rows += len(partition)
+            yield partition
+
+    async def encode(self, export_format: ExportFormat) -> AsyncIterator[bytes]:
+        """Linhas codificadas no formato pedido, um pedaço por lote"""
+        export_format = ExportFormat(export_format)
+        if export_format == ExportFormat.csv:
+            # Cabeçalho mesmo sem linhas (exportação incremental vazia)
+            yield encode_csv([[column.key for column in export_columns(self.entity)]])
+        async for batch in self.batches():
+            if export_format == ExportFormat.csv:
+                yield encode_csv([row.values() for row in batch])
+            else:
+                yield encode_ndjson(batch)
+
+    async def stream(self, export_format: ExportFormat) -> AsyncIterator[bytes]:
+        """`encode` que fecha a exportação ao terminar (StreamingResponse)"""
+        try:
+            async for chunk in self.encode(export_format):
+                yield chunk
+            logger.info(f"Export of {self.entity.value} finished: {self.rows} rows")
+        finally:
+            await self.close()
+
+
+def encode_ndjson(rows) -> bytes:
+    """Uma linha JSON por registro"""
+    return b"".join(dumps(dict(row)) + b"\n" for row in rows)
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return dumps(value).decode()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def encode_csv(rows) -> bytes:
+    """Linhas em CSV; JSONB vai serializado como JSON na célula"""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows([_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode()
@@ -0,0 +1,135 @@
+"""
+Migrations (Alembic) fora do caminho de startup dos workers
+
+O upgrade roda uma vez por deploy, em scripts/migrate.py, protegido por um
+advisory lock do Postgres: execuções concorrentes (vários containers/jobs)
+esperam a primeira terminar e encontram o schema já no head.
+
+Os workers só conferem a versão (MIGRATIONS_ON_STARTUP):
+    check    uma query em alembic_version; recusa subir se o banco está
+             atrás do código (falta alguma revisão head). Banco à frente
+             (revisão desconhecida, de um deploy mais novo, comum em
+             rolling deploy) só gera um aviso: as migrations devem manter
+             compatibilidade com a versão anterior do código
+    upgrade  comportamento antigo (upgrade no startup, agora com o lock)
+    off      não confere nada
+"""
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import ProgrammingError
+
+from app.core.logger import logger
+from app.core.settings import get_settings
+from app.database.unit_of_work import _get_engine_and_factory
+
+if TYPE_CHECKING:
+    from alembic.config import Config
+
+settings = get_settings()
+
+# Chave do pg_advisory_lock das migrations ("FBMI")
+MIGRATION_LOCK_KEY = 0x46424D49
+
+
+class SchemaNotAtHeadError(RuntimeError):
+    """O banco está atrás da revisão head das migrations do código"""
+
+
+def alembic_config() -> "Config":
+    from alembic.config import Config
+
+    # Sem o alembic.ini: o fileConfig do env.py reconfiguraria o logging do app
+    config = Config()
+    config.set_main_option("script_location", settings.APP_MIGRATIONS_FOLDER)
+    config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+    return config
+
+
+def head_revisions(config: "Config | None" = None) -> set[str]:
+    """Revisões head dos arquivos de migration (sem ir ao banco)"""
+    from alembic.script import ScriptDirectory
+
+    return set(ScriptDirectory.from_config(config or alembic_config()).get_heads())
+
+
+def missing_revisions(current: set[str], config: "Config | None" = None) -> set[str]:
+    """
+    Revisões head do código que o banco ainda não aplicou
+
+    Vazio quando o banco está no head ou à frente dele (revisões que este
+    código não conhece).
+    """
+    from alembic.script import ScriptDirectory
+
+    script = ScriptDirectory.from_config(config or alembic_config())
+    heads = set(script.get_heads())
+    if not current:
+        return heads
+    known = {revision.revision for revision in script.walk_revisions()}
+    if not current <= known:
+        logger.warning(
+            "Banco em %s, à frente do código (head %s)", sorted(current), sorted(heads)
+        )
+        return set()
+    applied = {
+        revision.revision
+        for revision in script.iterate_revisions(tuple(current), "base")
+    }
+    return heads - applied
+
+
+def run_migrations(revision: str = "head") -> None:
+    """Upgrade com advisory lock (uma execução por vez no cluster)"""
+    from alembic.command import upgrade
+
+    engine = create_engine(settings.DATABASE_URL_SYNC)
+    try:
+        with engine.connect() as connection:
+            locked = connection.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY}
+            ).scalar()
+            if not locked:
+                logger.info("Outra execução está migrando; aguardando o lock...")
+                connection.execute(
+                    text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY}
+                )
+            try:
+                logger.info("Running database migrations...")
+                upgrade(alembic_config(), revision)
+            finally:
+                connection.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY}
+                )
+    finally:
+        engine.dispose()
+
+
+async def current_revisions() -> set[str]:
+    """Revisões gravadas em alembic_version (vazio se a tabela não existe)"""
+    engine, _ = await _get_engine_and_factory()
+    try:
+        async with engine.connect() as connection:
+            result = await connection.execute(
+                text("SELECT version_num FROM alembic_version")
+            )
+            return set(result.scalars())
+    except ProgrammingError:
+        return set()
+
+
+async def ensure_schema() -> None:
+    """Aplica MIGRATIONS_ON_STARTUP no startup do worker"""
+    mode = settings.MIGRATIONS_ON_STARTUP
+    if mode == "upgrade":
+        await asyncio.to_thread(run_migrations)
+    elif mode == "check":
+        current = await current_revisions()
+        missing = await asyncio.to_thread(missing_revisions, current)
+        if missing:
+            raise SchemaNotAtHeadError(
+                f"Banco em {sorted(current) or 'vazio'}, falta {sorted(missing)}: "
+                "rode `python scripts/migrate.py` antes de subir os workers"
+            )
@@ -1,13 +1,34 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, Column, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    Boolean,
+    Column,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    SmallInteger,
+    String,
+    Text,
+    event,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.ext.mutable import MutableDict, MutableList
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.types import TIMESTAMP
 
+from app.database.models.counters import CREATE_SQL as COUNTERS_CREATE_SQL
+from app.database.models.counters import VERSION_CREATE_SQL
+from app.database.models.fight_history import CREATE_SQL as FIGHT_HISTORY_CREATE_SQL
+from app.database.models.fight_history import DROP_SQL as FIGHT_HISTORY_DROP_SQL
+from app.database.models.search import CREATE_SQL as SEARCH_CREATE_SQL
+from app.database.models.search import normalized
+
 Base = declarative_base()
 
 
@@ -55,6 +76,8 @@ class Fighter(BaseModel):
 
     # ID do ufcstats.com para lutadores reais
     ufcstats_id = Column(String(50), nullable=True, unique=True, index=True)
+    # Hash da linha de origem no dataset (importação incremental)
+    import_hash = Column(String(32), nullable=True)
 
     # Informações básicas
     name = Column(String(350), nullable=False, index=True)
@@ -102,8 +125,11 @@ class Fighter(BaseModel):
     submission_wins = Column(Integer, nullable=True, default=0)
 
     # Cartel completo do lutador (lista de lutas)
-    cartel = Column(
-        MutableList.as_mutable(JSONB), nullable=False, default=list
+    # Deferred: não é carregado nos SELECTs de fighters. A leitura paginada usa
+    # a view fighter_fight_history (ver models/fight_history.py) e cai para
+    # este JSONB apenas em lutadores sem lutas importadas em fights.
+    cartel = deferred(
+        Column(MutableList.as_mutable(JSONB), nullable=False, default=list)
     )  # Lista com histórico de lutas reais
     # Formato: [{"opponent": "Name", "result": "W/L/D", "method": "KO/Sub/Dec", "round": 1, "date": "2024-01-01", "organization": "UFC"}]
 
@@ -164,6 +190,8 @@ class Event(BaseModel):
 
     # ID do ufcstats.com para eventos reais
     ufcstats_id = Column(String(50), nullable=True, unique=True, index=True)
+    # Hash da linha de origem no dataset (importação incremental)
+    import_hash = Column(String(32), nullable=True)
 
     # Informações do evento
     name = Column(String(255), nullable=False)  # Ex: "UFC 233"
@@ -189,14 +217,22 @@ class Fight(BaseModel):
 
     # ID do ufcstats.com para lutas reais
     ufcstats_id = Column(String(50), nullable=True, unique=True, index=True)
+    # Hash da linha de origem no dataset (importação incremental)
+    import_hash = Column(String(32), nullable=True)
 
     # Relacionamento com evento
-    event_id = Column(UUID(as_uuid=True), ForeignKey("events.id"), nullable=False)
+    event_id = Column(
+        UUID(as_uuid=True), ForeignKey("events.id"), nullable=False, index=True
+    )
     event = relationship("Event", back_populates="fights")
 
-    # Lutadores
-    fighter1_id = Column(UUID(as_uuid=True), ForeignKey("fighters.id"), nullable=False)
-    fighter2_id = Column(UUID(as_uuid=True), ForeignKey("fighters.id"), nullable=False)
+    # Lutadores (indexados para o histórico por lutador)
+    fighter1_id = Column(
+        UUID(as_uuid=True), ForeignKey("fighters.id"), nullable=False, index=True
+    )
+    fighter2_id = Column(
+        UUID(as_uuid=True), ForeignKey("fighters.id"), nullable=False, index=True
+    )
 
     # Ordem da luta no card
     fight_order = Column(Integer, nullable=False)  # 1 = main event, 2 = co-main, etc
@@ -270,6 +306,19 @@ class FightSimulation(BaseModel):
     """Simulações de lutas entre lutadores (simulações avulsas, não vinculadas a eventos)"""
 
     __tablename__ = "fight_simulations"
+    # Particionada por mês em created_at (ver app/database/partitions.py).
+    # created_at faz parte da PK: exigência do Postgres para tabelas particionadas
+    __table_args__ = (
+        PrimaryKeyConstraint("id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    created_at = Column(
+        type_=TIMESTAMP(timezone=True),
+        primary_key=True,
+        index=True,
+        default=lambda: datetime.now(timezone.utc),
+    )
 
     # Lutadores envolvidos
     fighter1_id = Column(UUID(as_uuid=True), ForeignKey("fighters.id"), nullable=False)
@@ -304,3 +353,85 @@ class FightSimulation(BaseModel):
     fighter2 = relationship(
         "Fighter", foreign_keys=[fighter2_id], back_populates="fights_as_fighter2"
     )
+
+
+# Partição DEFAULT para ambientes criados via metadata.create_all (ex: testes);
+# as partições mensais são gerenciadas pela migration e por app/database/partitions.py
+event.listen(
+    FightSimulation.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS fight_simulations_default "
+        "PARTITION OF fight_simulations DEFAULT"
+    ),
+)
+
+
+class ImportCheckpoint(Base):
+    """
+    Progresso da importação do dataset UFC por etapa
+
+    Guarda o hash do arquivo de origem e quantas linhas já foram gravadas,
+    para retomar uma importação interrompida e pular arquivos inalterados.
+    """
+
+    __tablename__ = "import_checkpoints"
+
+    step = Column(String(50), primary_key=True)
+    file_hash = Column(String(32), nullable=False)
+    rows_done = Column(Integer, nullable=False, default=0)
+    status = Column(String(20), nullable=False, default="running")  # running, completed
+    updated_at = Column(
+        type_=TIMESTAMP(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+
+class EntityCounter(Base):
+    """
+    Contadores de registros mantidos por triggers (ver models/counters.py)
+    """
+
+    __tablename__ = "entity_counters"
+
+    entity = Column(String(50), primary_key=True)
+    dimension = Column(String(50), primary_key=True)
+    value = Column(String(150), primary_key=True, default="")
+    # O contador é a soma dos shards (ver COUNTER_SHARDS)
+    shard = Column(SmallInteger, primary_key=True, default=0, server_default="0")
+    count = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(
+        type_=TIMESTAMP(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+
+
+# Funções e triggers dos contadores para ambientes criados via create_all
+for statement in [*COUNTERS_CREATE_SQL, *VERSION_CREATE_SQL]:
+    event.listen(Base.metadata, "after_create", DDL(statement))
+
+
+# View de histórico de lutas por lutador (ver models/fight_history.py)
+for statement in FIGHT_HISTORY_CREATE_SQL:
+    event.listen(Base.metadata, "after_create", DDL(statement))
+for statement in FIGHT_HISTORY_DROP_SQL:
+    event.listen(Base.metadata, "before_drop", DDL(statement))
+
+
+# Índices trigram (busca por similaridade/autocomplete, ver models/search.py);
+# a extensão e o f_unaccent são criados antes das tabelas no create_all
+for statement in SEARCH_CREATE_SQL:
+    event.listen(Base.metadata, "before_create", DDL(statement))
+
+for model, column in (
+    (Fighter, Fighter.name),
+    (Fighter, Fighter.nickname),
+    (Event, Event.name),
+):
+    label = f"{column.key}_trgm"
+    Index(
+        f"ix_{model.__tablename__}_{label}",
+        normalized(column).label(label),
+        postgresql_using="gin",
+        postgresql_ops={label: "gin_trgm_ops"},
+    )
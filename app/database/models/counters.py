@@ -0,0 +1,211 @@
+"""
+Contadores mantidos por triggers na tabela entity_counters
+
+Evita COUNT(*) sobre tabelas inteiras nos endpoints de listagem/estatísticas.
+Cada linha guarda a quantidade de registros "vivos" (sem soft delete) de uma
+entidade, opcionalmente agrupada por uma dimensão:
+
+    entity             | dimension               | value
+    -------------------+-------------------------+---------------------
+    fighters           | all                     | ''
+    fighters           | actual_weight_class     | 'Lightweight'
+    fighters           | last_organization_fight | 'UFC'
+    fighters           | is_real                 | 'true' / 'false'
+    fight_simulations  | all                     | ''
+
+Valores NULL das dimensões são armazenados como ''.
+
+Cada contador é dividido em COUNTER_SHARDS linhas (coluna `shard`) e o
+valor é a soma delas. A transação escreve sempre no shard `txid % N`: uma
+importação em lote que fica com o lock da sua linha até o commit só bloqueia
+as escritas da API que caírem no mesmo shard, e transações concorrentes
+(xids próximos) caem em shards diferentes em vez de fazer fila numa linha.
+
+Além dos totais, tabelas lidas com GET condicional têm uma linha de versão
+(`dimension = 'version'`) incrementada por trigger de statement a cada
+escrita; `count` e `updated_at` dessa linha viram ETag/Last-Modified das
+listagens.
+
+Os SQLs ficam aqui para serem usados tanto pela migration quanto pelo
+`metadata.create_all` (testes), garantindo o mesmo comportamento.
+"""
+
+ALL_DIMENSION = "all"
+VERSION_DIMENSION = "version"
+
+FIGHTER_DIMENSIONS = ("actual_weight_class", "last_organization_fight", "is_real")
+
+LIVE_FILTER = "deleted_at IS NULL AND deleted_by IS NULL"
+
+COUNTER_SHARDS = 16
+
+BUMP_FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION entity_counters_bump(
+    p_entity text, p_dimension text, p_value text, p_delta bigint
+) RETURNS void AS $$
+BEGIN
+    INSERT INTO entity_counters (entity, dimension, value, shard, count, updated_at)
+    VALUES (
+        p_entity, p_dimension, coalesce(p_value, ''),
+        (txid_current() % {COUNTER_SHARDS})::smallint, p_delta, now()
+    )
+    ON CONFLICT (entity, dimension, value, shard) DO UPDATE
+    SET count = entity_counters.count + EXCLUDED.count,
+        updated_at = EXCLUDED.updated_at;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+FIGHTERS_TRIGGER_FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION fighters_counters_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE')
+       AND OLD.deleted_at IS NULL AND OLD.deleted_by IS NULL THEN
+        PERFORM entity_counters_bump('fighters', '{ALL_DIMENSION}', '', -1);
+        PERFORM entity_counters_bump(
+            'fighters', 'actual_weight_class', OLD.actual_weight_class, -1);
+        PERFORM entity_counters_bump(
+            'fighters', 'last_organization_fight', OLD.last_organization_fight, -1);
+        PERFORM entity_counters_bump('fighters', 'is_real', OLD.is_real::text, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE')
+       AND NEW.deleted_at IS NULL AND NEW.deleted_by IS NULL THEN
+        PERFORM entity_counters_bump('fighters', '{ALL_DIMENSION}', '', 1);
+        PERFORM entity_counters_bump(
+            'fighters', 'actual_weight_class', NEW.actual_weight_class, 1);
+        PERFORM entity_counters_bump(
+            'fighters', 'last_organization_fight', NEW.last_organization_fight, 1);
+        PERFORM entity_counters_bump('fighters', 'is_real', NEW.is_real::text, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+SIMULATIONS_TRIGGER_FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION fight_simulations_counters_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE')
+       AND OLD.deleted_at IS NULL AND OLD.deleted_by IS NULL THEN
+        PERFORM entity_counters_bump('fight_simulations', '{ALL_DIMENSION}', '', -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE')
+       AND NEW.deleted_at IS NULL AND NEW.deleted_by IS NULL THEN
+        PERFORM entity_counters_bump('fight_simulations', '{ALL_DIMENSION}', '', 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# UPDATE só dispara quando alguma coluna contada muda, evitando disputa de lock
+# nas linhas de contador a cada update comum
+TRIGGERS_SQL = [
+    """
+    CREATE TRIGGER fighters_counters_insert_delete
+    AFTER INSERT OR DELETE ON fighters
+    FOR EACH ROW EXECUTE FUNCTION fighters_counters_trigger()
+    """,
+    """
+    CREATE TRIGGER fighters_counters_update
+    AFTER UPDATE ON fighters
+    FOR EACH ROW WHEN (
+        OLD.deleted_at IS DISTINCT FROM NEW.deleted_at
+        OR OLD.deleted_by IS DISTINCT FROM NEW.deleted_by
+        OR OLD.actual_weight_class IS DISTINCT FROM NEW.actual_weight_class
+        OR OLD.last_organization_fight IS DISTINCT FROM NEW.last_organization_fight
+        OR OLD.is_real IS DISTINCT FROM NEW.is_real
+    )
+    EXECUTE FUNCTION fighters_counters_trigger()
+    """,
+    """
+    CREATE TRIGGER fight_simulations_counters_insert_delete
+    AFTER INSERT OR DELETE ON fight_simulations
+    FOR EACH ROW EXECUTE FUNCTION fight_simulations_counters_trigger()
+    """,
+    """
+    CREATE TRIGGER fight_simulations_counters_update
+    AFTER UPDATE ON fight_simulations
+    FOR EACH ROW WHEN (
+        OLD.deleted_at IS DISTINCT FROM NEW.deleted_at
+        OR OLD.deleted_by IS DISTINCT FROM NEW.deleted_by
+    )
+    EXECUTE FUNCTION fight_simulations_counters_trigger()
+    """,
+]
+
+CREATE_SQL = [
+    BUMP_FUNCTION_SQL,
+    FIGHTERS_TRIGGER_FUNCTION_SQL,
+    SIMULATIONS_TRIGGER_FUNCTION_SQL,
+    *TRIGGERS_SQL,
+]
+
+DROP_SQL = [
+    "DROP TRIGGER IF EXISTS fight_simulations_counters_update ON fight_simulations",
+    "DROP TRIGGER IF EXISTS fight_simulations_counters_insert_delete "
+    "ON fight_simulations",
+    "DROP TRIGGER IF EXISTS fighters_counters_update ON fighters",
+    "DROP TRIGGER IF EXISTS fighters_counters_insert_delete ON fighters",
+    "DROP FUNCTION IF EXISTS fight_simulations_counters_trigger()",
+    "DROP FUNCTION IF EXISTS fighters_counters_trigger()",
+    "DROP FUNCTION IF EXISTS count_estimate(text)",
+    "DROP FUNCTION IF EXISTS entity_counters_bump(text, text, text, bigint)",
+]
+
+# Recalcula todos os contadores a partir das tabelas (carga inicial/reparo)
+REBUILD_SQL = [
+    "DELETE FROM entity_counters WHERE entity IN ('fighters', 'fight_simulations')",
+    f"""
+    INSERT INTO entity_counters (entity, dimension, value, count, updated_at)
+    SELECT 'fighters', '{ALL_DIMENSION}', '', count(*), now()
+    FROM fighters WHERE {LIVE_FILTER}
+    """,
+    *[
+        f"""
+        INSERT INTO entity_counters (entity, dimension, value, count, updated_at)
+        SELECT 'fighters', '{dimension}', coalesce({dimension}::text, ''),
+               count(*), now()
+        FROM fighters WHERE {LIVE_FILTER}
+        GROUP BY coalesce({dimension}::text, '')
+        """
+        for dimension in FIGHTER_DIMENSIONS
+    ],
+    f"""
+    INSERT INTO entity_counters (entity, dimension, value, count, updated_at)
+    SELECT 'fight_simulations', '{ALL_DIMENSION}', '', count(*), now()
+    FROM fight_simulations WHERE {LIVE_FILTER}
+    """,
+]
+
+VERSIONED_TABLES = ("fighters", "events", "fights")
+
+VERSION_TRIGGER_FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION entity_versions_trigger() RETURNS trigger AS $$
+BEGIN
+    PERFORM entity_counters_bump(TG_TABLE_NAME, '{VERSION_DIMENSION}', '', 1);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+VERSION_CREATE_SQL = [
+    VERSION_TRIGGER_FUNCTION_SQL,
+    *[
+        f"""
+        CREATE TRIGGER {table}_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+        FOR EACH STATEMENT EXECUTE FUNCTION entity_versions_trigger()
+        """
+        for table in VERSIONED_TABLES
+    ],
+]
+
+VERSION_DROP_SQL = [
+    *[
+        f"DROP TRIGGER IF EXISTS {table}_version ON {table}"
+        for table in VERSIONED_TABLES
+    ],
+    "DROP FUNCTION IF EXISTS entity_versions_trigger()",
+    f"DELETE FROM entity_counters WHERE dimension = '{VERSION_DIMENSION}'",
+]
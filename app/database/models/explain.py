@@ -0,0 +1,23 @@
+"""
+EXPLAIN (FORMAT JSON) como construção do SQLAlchemy
+
+A consulta é compilada pelo dialeto como qualquer SELECT, com os parâmetros
+ligados pelo driver; nada de renderizar os valores no texto do SQL.
+"""
+
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+
+class ExplainJson(Executable, ClauseElement):
+    """`session.execute(ExplainJson(select(...)))` -> uma linha com o plano"""
+
+    inherit_cache = False
+
+    def __init__(self, query):
+        self.query = query
+
+
+@compiles(ExplainJson)
+def _compile_explain_json(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.query, **kw)
@@ -0,0 +1,82 @@
+"""
+Histórico de lutas por lutador (view fighter_fight_history)
+
+Substitui a leitura do JSONB `fighters.cartel`, que carregava a carreira
+inteira do lutador a cada SELECT em fighters. A view normaliza `fights` +
+`events` em uma linha por (lutador, luta): cada luta aparece duas vezes, uma
+do ponto de vista de cada corner. As duas metades do UNION ALL filtram por
+`fighter1_id` / `fighter2_id`, cobertos pelos índices de fights, então a
+paginação de um lutador não varre a tabela.
+
+Os SQLs ficam aqui para serem usados tanto pela migration quanto pelo
+`metadata.create_all` (testes).
+"""
+
+from sqlalchemy import Boolean, Column, Integer, MetaData, String, Table, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.types import TIMESTAMP
+
+VIEW_NAME = "fighter_fight_history"
+
+
+def _side_sql(corner: str, opponent: str) -> str:
+    return f"""
+    SELECT
+        f.{corner} AS fighter_id,
+        f.id AS fight_id,
+        f.event_id,
+        e.name AS event_name,
+        e.date AS event_date,
+        e.organization,
+        f.{opponent} AS opponent_id,
+        o.name AS opponent_name,
+        CASE
+            WHEN f.result_type = 'Draw' THEN 'D'
+            WHEN f.winner_id IS NULL THEN 'N/A'
+            WHEN f.winner_id = f.{corner} THEN 'W'
+            ELSE 'L'
+        END AS result,
+        coalesce(f.result_type, 'Unknown') AS method,
+        f.method_details,
+        f.finish_round AS round,
+        f.finish_time,
+        f.weight_class,
+        f.is_title_fight
+    FROM fights f
+    JOIN events e ON e.id = f.event_id
+    JOIN fighters o ON o.id = f.{opponent}
+    WHERE f.status = 'completed'
+      AND f.deleted_at IS NULL
+      AND e.deleted_at IS NULL
+    """
+
+
+CREATE_SQL = [
+    f"CREATE OR REPLACE VIEW {VIEW_NAME} AS"
+    f"{_side_sql('fighter1_id', 'fighter2_id')}"
+    "UNION ALL"
+    f"{_side_sql('fighter2_id', 'fighter1_id')}"
+]
+
+DROP_SQL = [f"DROP VIEW IF EXISTS {VIEW_NAME}"]
+
+# Metadata própria: a view não deve ser criada como tabela pelo create_all
+fighter_fight_history = Table(
+    VIEW_NAME,
+    MetaData(),
+    Column("fighter_id", UUID(as_uuid=True)),
+    Column("fight_id", UUID(as_uuid=True)),
+    Column("event_id", UUID(as_uuid=True)),
+    Column("event_name", String(255)),
+    Column("event_date", TIMESTAMP(timezone=True)),
+    Column("organization", String(100)),
+    Column("opponent_id", UUID(as_uuid=True)),
+    Column("opponent_name", String(350)),
+    Column("result", String(3)),
+    Column("method", String(50)),
+    Column("method_details", Text),
+    Column("round", Integer),
+    Column("finish_time", String(10)),
+    Column("weight_class", String(100)),
+    Column("is_title_fight", Boolean),
+)
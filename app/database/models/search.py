@@ -0,0 +1,33 @@
+"""
+Busca textual por similaridade (pg_trgm + unaccent)
+
+Nomes são comparados na forma normalizada `f_unaccent(lower(coluna))`, que é
+a mesma expressão dos índices GIN `gin_trgm_ops`. Assim tanto o LIKE
+'%termo%' quanto o operador de similaridade por palavra (`%>`) usam índice e
+a busca ignora acentos ("jose aldo" encontra "José Aldo").
+
+`unaccent()` é apenas STABLE e não pode ser usada em índices; `f_unaccent`
+é o wrapper IMMUTABLE com dicionário fixo recomendado pela documentação.
+"""
+
+from sqlalchemy import func
+
+EXTENSIONS_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+]
+
+F_UNACCENT_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text AS $$
+    SELECT public.unaccent('public.unaccent'::regdictionary, $1)
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+"""
+
+CREATE_SQL = [*EXTENSIONS_SQL, F_UNACCENT_FUNCTION_SQL]
+
+DROP_SQL = ["DROP FUNCTION IF EXISTS f_unaccent(text)"]
+
+
+def normalized(expression):
+    """Expressão normalizada (minúscula e sem acentos) usada nos índices"""
+    return func.f_unaccent(func.lower(expression))
@@ -0,0 +1,157 @@
+"""
+Formato compacto de armazenamento do campo `simulation_details`
+
+As simulações guardavam cada round como um dict com nomes de lutadores e
+frases completas em português ("X dominou o round"). Aqui os rounds são
+armazenados como listas posicionais, os eventos como códigos inteiros e os
+pontos como inteiros escalados (centésimos). O formato legível é
+reconstruído apenas na hora de montar a resposta da API.
+
+Formato compacto (versão 2):
+    {
+        "v": 2,
+        "r": [[round_number, pontos1, pontos2, lado_dominante, [eventos]], ...],
+        "t": [total1, total2],
+    }
+
+- pontos/totais: int(round(valor * 100))
+- lado_dominante: 1 (fighter1) ou 2 (fighter2); o nome original é mantido
+  como string se não corresponder a nenhum dos lutadores
+- eventos: códigos de `EVENT_TEMPLATES`; textos desconhecidos são mantidos
+  como string para que a conversão nunca perca informação
+"""
+
+from typing import Any, Optional
+
+COMPACT_VERSION = 2
+POINTS_SCALE = 100
+
+# Códigos de eventos gerados por FightSimulationService._simulate_round
+EVENT_DOMINATED = 1
+EVENT_TAKEDOWN = 2
+EVENT_SIGNIFICANT_STRIKES = 3
+EVENT_SUBMISSION_ATTEMPT = 4
+
+EVENT_TEMPLATES = {
+    EVENT_DOMINATED: "{name} dominou o round",
+    EVENT_TAKEDOWN: "{name} conseguiu um takedown",
+    EVENT_SIGNIFICANT_STRIKES: "{name} acertou golpes significativos",
+    EVENT_SUBMISSION_ATTEMPT: "{name} tentou uma finalização",
+}
+
+# Sufixos usados para reconhecer os eventos legados (texto após o nome)
+_EVENT_SUFFIXES = {
+    template.replace("{name}", ""): code for code, template in EVENT_TEMPLATES.items()
+}
+
+
+def is_compact(details: Optional[dict]) -> bool:
+    """Indica se o dict já está no formato compacto"""
+    return bool(details) and details.get("v") == COMPACT_VERSION
+
+
+def _scale(points: Optional[float]) -> int:
+    return int(round((points or 0) * POINTS_SCALE))
+
+
+def _unscale(value: int) -> float:
+    return round(value / POINTS_SCALE, 2)
+
+
+def _encode_event(event: str, dominant: str) -> Any:
+    if event.startswith(dominant):
+        code = _EVENT_SUFFIXES.get(event[len(dominant) :])
+        if code is not None:
+            return code
+    return event
+
+
+def encode_simulation_details(
+    details: Optional[dict], fighter1_name: str, fighter2_name: str
+) -> Optional[dict]:
+    """
+    Converte `simulation_details` do formato legível para o compacto
+
+    Args:
+        details: Dict no formato {"rounds": [...], "total_points": {...}}
+        fighter1_name: Nome do fighter1 da luta
+        fighter2_name: Nome do fighter2 da luta
+
+    Returns:
+        Dict compacto (ou o próprio valor se vazio/já compacto)
+    """
+    if not details or is_compact(details):
+        return details
+
+    rounds = []
+    for round_data in details.get("rounds", []):
+        dominant = round_data.get("dominant_fighter")
+        if dominant == fighter1_name:
+            side = 1
+        elif dominant == fighter2_name:
+            side = 2
+        else:
+            side = dominant
+        rounds.append(
+            [
+                round_data.get("round_number"),
+                _scale(round_data.get("fighter1_points")),
+                _scale(round_data.get("fighter2_points")),
+                side,
+                [
+                    _encode_event(event, dominant or "")
+                    for event in round_data.get("events", [])
+                ],
+            ]
+        )
+
+    total_points = details.get("total_points", {})
+    return {
+        "v": COMPACT_VERSION,
+        "r": rounds,
+        "t": [
+            _scale(total_points.get("fighter1")),
+            _scale(total_points.get("fighter2")),
+        ],
+    }
+
+
+def render_simulation_details(
+    details: Optional[dict], fighter1_name: str, fighter2_name: str
+) -> Optional[dict]:
+    """
+    Reconstrói o formato legível de `simulation_details` a partir do compacto
+
+    Registros legados (ainda não convertidos) são devolvidos sem alteração.
+    """
+    if not is_compact(details):
+        return details
+
+    rounds = []
+    for round_number, points1, points2, side, events in details["r"]:
+        if side == 1:
+            dominant = fighter1_name
+        elif side == 2:
+            dominant = fighter2_name
+        else:
+            dominant = side
+        rounds.append(
+            {
+                "round_number": round_number,
+                "fighter1_points": _unscale(points1),
+                "fighter2_points": _unscale(points2),
+                "dominant_fighter": dominant,
+                "events": [
+                    EVENT_TEMPLATES[event].format(name=dominant)
+                    if isinstance(event, int) and event in EVENT_TEMPLATES
+                    else event
+                    for event in events
+                ],
+            }
+        )
+
+    total1, total2 = details["t"]
+    return {
+        "rounds": rounds,
+        "total_points": {"fighter1": _unscale(total1), "fighter2": _unscale(total2)},
+    }
@@ -0,0 +1,207 @@
+"""
+Gerenciamento das partições mensais da tabela fight_simulations
+
+A tabela é particionada por RANGE (created_at) com uma partição por mês
+(`fight_simulations_pYYYYMM`) e uma partição DEFAULT que recebe qualquer
+linha fora das faixas já criadas.
+
+As funções recebem uma `Connection` síncrona do SQLAlchemy para poderem ser
+usadas tanto nas migrations/scripts quanto no app (via `run_sync`).
+"""
+
+from datetime import date, datetime, timezone
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.core.logger import logger
+from app.database.models.counters import ALL_DIMENSION, LIVE_FILTER
+
+PARENT_TABLE = "fight_simulations"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+PARTITION_PREFIX = f"{PARENT_TABLE}_p"
+
+CREATE_DEFAULT_PARTITION_SQL = (
+    f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} "
+    f"PARTITION OF {PARENT_TABLE} DEFAULT"
+)
+
+
+def _month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def _add_months(value: date, months: int) -> date:
+    month_index = value.year * 12 + (value.month - 1) + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _bump_counter(connection: Connection, delta: int) -> None:
+    connection.execute(
+        text("SELECT entity_counters_bump(:entity, :dimension, '', :delta)"),
+        {"entity": PARENT_TABLE, "dimension": ALL_DIMENSION, "delta": delta},
+    )
+
+
+def partition_name(month: date) -> str:
+    """Nome da partição mensal (ex: fight_simulations_p202610)"""
+    return f"{PARTITION_PREFIX}{month:%Y%m}"
+
+
+def _parse_partition_month(name: str) -> Optional[date]:
+    if not name.startswith(PARTITION_PREFIX):
+        return None
+    try:
+        return datetime.strptime(name[len(PARTITION_PREFIX) :], "%Y%m").date()
+    except ValueError:
+        return None
+
+
+def list_partitions(connection: Connection) -> list[str]:
+    """Lista as partições anexadas à tabela fight_simulations"""
+    result = connection.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :parent ORDER BY child.relname"
+        ),
+        {"parent": PARENT_TABLE},
+    )
+    return [row[0] for row in result]
+
+
+def create_month_partition(connection: Connection, month: date) -> bool:
+    """
+    Cria a partição de um mês, se ainda não existir
+
+    Linhas que já caíram na partição DEFAULT para esse mês são movidas para a
+    nova partição antes de anexá-la (o Postgres recusa o ATTACH caso a DEFAULT
+    contenha linhas da faixa).
+
+    Returns:
+        True se a partição foi criada
+    """
+    month = _month_start(month)
+    name = partition_name(month)
+    if name in list_partitions(connection):
+        return False
+
+    bounds = {
+        "start": datetime.combine(month, datetime.min.time(), timezone.utc),
+        "end": datetime.combine(
+            _add_months(month, 1), datetime.min.time(), timezone.utc
+        ),
+    }
+    range_filter = "created_at >= :start AND created_at < :end"
+
+    connection.execute(
+        text(
+            f"CREATE TABLE {name} "
+            f"(LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+    )
+    moved_live = connection.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+            f"WHERE {range_filter} RETURNING *), "
+            f"inserted AS (INSERT INTO {name} SELECT * FROM moved "
+            "RETURNING deleted_at, deleted_by) "
+            f"SELECT count(*) FROM inserted WHERE {LIVE_FILTER}"
+        ),
+        bounds,
+    ).scalar()
+    # O DELETE na DEFAULT dispara o trigger de contadores, mas o INSERT na
+    # tabela ainda não anexada não: devolve as linhas movidas ao contador
+    if moved_live:
+        _bump_counter(connection, moved_live)
+    connection.execute(
+        text(
+            f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ('{bounds['start'].isoformat()}') "
+            f"TO ('{bounds['end'].isoformat()}')"
+        )
+    )
+    logger.info(f"Partição {name} criada")
+    return True
+
+
+def ensure_partitions(
+    connection: Connection,
+    months_ahead: int,
+    since: Optional[date] = None,
+) -> list[str]:
+    """
+    Garante partições mensais de `since` (padrão: mês atual) até
+    `months_ahead` meses à frente
+
+    Returns:
+        Lista das partições criadas
+    """
+    connection.execute(text(CREATE_DEFAULT_PARTITION_SQL))
+
+    current = _month_start(datetime.now(timezone.utc).date())
+    month = _month_start(since) if since else current
+    last = _add_months(current, months_ahead)
+
+    created = []
+    while month <= last:
+        if create_month_partition(connection, month):
+            created.append(partition_name(month))
+        month = _add_months(month, 1)
+    return created
+
+
+def apply_retention(
+    connection: Connection,
+    retention_months: int,
+    mode: str = "archive",
+    archive_schema: str = "archive",
+) -> list[str]:
+    """
+    Remove ou arquiva partições mais antigas que `retention_months`
+
+    Args:
+        connection: Conexão síncrona
+        retention_months: Meses completos a manter (0 desativa a retenção)
+        mode: "archive" (DETACH + move para `archive_schema`) ou "drop"
+        archive_schema: Schema que recebe as partições arquivadas
+
+    Returns:
+        Lista das partições removidas/arquivadas
+    """
+    if retention_months <= 0:
+        return []
+    if mode not in ("archive", "drop"):
+        raise ValueError(f"Invalid retention mode: {mode}")
+
+    cutoff = _add_months(
+        _month_start(datetime.now(timezone.utc).date()), -retention_months
+    )
+
+    expired = []
+    for name in list_partitions(connection):
+        month = _parse_partition_month(name)
+        if month is None or month >= cutoff:
+            continue
+
+        # DROP/DETACH não disparam triggers: desconta as linhas do contador
+        live_rows = connection.execute(
+            text(f"SELECT count(*) FROM {name} WHERE {LIVE_FILTER}")
+        ).scalar()
+        if live_rows:
+            _bump_counter(connection, -live_rows)
+
+        if mode == "drop":
+            connection.execute(text(f"DROP TABLE {name}"))
+        else:
+            connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {archive_schema}"))
+            connection.execute(
+                text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}")
+            )
+            connection.execute(text(f"ALTER TABLE {name} SET SCHEMA {archive_schema}"))
+        expired.append(name)
+        logger.info(f"Partição {name} removida da tabela ativa (modo: {mode})")
+
+    return expired
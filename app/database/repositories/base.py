@@ -2,16 +2,25 @@ from datetime import datetime, timezone
 from typing import Generic, Optional, Type, TypeVar
 from uuid import UUID
 
+import orjson
 from sqlalchemy import desc, func, or_, select
 
 from app.core.logger import logger
-from app.database.models.base import Base
+from app.core.settings import get_settings
+from app.core.tracing import traced_methods
+from app.database.models.base import Base, EntityCounter
+from app.database.models.counters import ALL_DIMENSION, VERSION_DIMENSION
+from app.database.models.explain import ExplainJson
+from app.database.models.search import normalized
 from app.database.unit_of_work import UnitOfWorkConnection
 from app.exceptions.exceptions import RepositoryError
 
 T = TypeVar("T", bound=Base)  # type: ignore
 
+settings = get_settings()
 
+
+@traced_methods()
 class BaseRepository(Generic[T]):
     def __init__(self, model: Type[T], uow: UnitOfWorkConnection):
         self.model = model
@@ -107,27 +116,7 @@ class BaseRepository(Generic[T]):
             )
 
             # Filtros
-            if filters:
-                if "$or" in filters:
-                    or_conditions = []
-                    for condition in filters["$or"]:
-                        for key, value in condition.items():
-                            if hasattr(self.model, key):
-                                column = getattr(self.model, key)
-                                if isinstance(value, str) and "%" in value:
-                                    or_conditions.append(column.ilike(value))
-                                else:
-                                    or_conditions.append(column == value)
-                    if or_conditions:
-                        query = query.filter(or_(*or_conditions))
-                for key, value in filters.items():
-                    if key == "$or":
-                        continue
-                    if hasattr(self.model, key):
-                        if isinstance(value, str) and "%" in value:
-                            query = query.filter(getattr(self.model, key).ilike(value))
-                        else:
-                            query = query.filter(getattr(self.model, key) == value)
+            query = self._apply_filters(query, filters)
 
             # Ordenação
             query = self._apply_ordering(query, sort_by)
@@ -142,46 +131,205 @@ class BaseRepository(Generic[T]):
             logger.error(f"Error fetching {self.model.__name__} list: {e}")
             raise RepositoryError
 
-    async def count(self, filters: dict = None) -> int:
+    async def count(self, filters: dict = None, exact: bool = True) -> int:
+        """
+        Conta os registros ativos que correspondem aos filtros
+
+        Com `exact=False` retorna a estimativa do planner (EXPLAIN), que não
+        varre a tabela.
+        """
+        try:
+            session = await self.uow.get_session()
+            query = select(self.model.id).filter(
+                self.model.deleted_at.is_(None),
+                self.model.deleted_by.is_(None),
+            )
+            query = self._apply_filters(query, filters)
+
+            if not exact:
+                return await self.estimate_count(query)
+
+            result = await session.execute(
+                select(func.count()).select_from(query.subquery())
+            )
+            return result.scalar()
+        except RepositoryError:
+            raise
+        except Exception as e:
+            logger.error(f"Error counting {self.model.__name__} records: {e}")
+            raise RepositoryError
+
+    async def get_row_version(self, id: UUID) -> Optional[datetime]:
+        """Data da última alteração de um registro ativo (None se não existe)"""
         try:
             session = await self.uow.get_session()
+            query = select(
+                func.coalesce(
+                    self.model.updated_at, self.model.created_at, func.to_timestamp(0)
+                )
+            ).filter(
+                self.model.id == id,
+                self.model.deleted_at.is_(None),
+                self.model.deleted_by.is_(None),
+            )
+            result = await session.execute(query)
+            return result.scalar_one_or_none()
+        except Exception as e:
+            logger.error(f"Error fetching {self.model.__name__} version: {e}")
+            raise RepositoryError
+
+    async def get_table_version(
+        self, *tables: str, dimension: str = VERSION_DIMENSION
+    ) -> tuple[int, Optional[datetime]]:
+        """
+        Versão das tabelas (padrão: a do próprio model) para GET condicional
+
+        Returns:
+            Tupla (número de versão, data da última escrita)
+        """
+        try:
+            session = await self.uow.get_session()
+            query = select(
+                func.coalesce(func.sum(EntityCounter.count), 0),
+                func.max(EntityCounter.updated_at),
+            ).filter(
+                EntityCounter.entity.in_(tables or [self.model.__tablename__]),
+                EntityCounter.dimension == dimension,
+                EntityCounter.value == "",
+            )
+            result = await session.execute(query)
+            version, modified_at = result.one()
+            return int(version), modified_at
+        except Exception as e:
+            logger.error(f"Error fetching {self.model.__name__} table version: {e}")
+            raise RepositoryError
+
+    async def get_counter(
+        self, dimension: str = ALL_DIMENSION, value: str = ""
+    ) -> Optional[int]:
+        """
+        Lê um contador mantido por trigger (ver models/counters.py)
+
+        Returns:
+            Quantidade de registros ativos (soma dos shards) ou None se o
+            contador não existe
+        """
+        try:
+            session = await self.uow.get_session()
+            query = select(func.sum(EntityCounter.count)).filter(
+                EntityCounter.entity == self.model.__tablename__,
+                EntityCounter.dimension == dimension,
+                EntityCounter.value == value,
+            )
+            result = await session.execute(query)
+            count = result.scalar_one_or_none()
+            return None if count is None else int(count)
+        except Exception as e:
+            logger.error(f"Error reading {self.model.__name__} counter: {e}")
+            raise RepositoryError
+
+    async def get_counters_by_dimension(self, dimension: str) -> dict[str, int]:
+        """Lê todos os contadores de uma dimensão (ignora valores nulos/zerados)"""
+        try:
+            session = await self.uow.get_session()
+            total = func.sum(EntityCounter.count)
             query = (
-                select(func.count())
-                .select_from(self.model)
+                select(EntityCounter.value, total)
                 .filter(
-                    self.model.deleted_at.is_(None),
-                    self.model.deleted_by.is_(None),
+                    EntityCounter.entity == self.model.__tablename__,
+                    EntityCounter.dimension == dimension,
+                    EntityCounter.value != "",
                 )
+                .group_by(EntityCounter.value)
+                .having(total > 0)
             )
+            result = await session.execute(query)
+            return {value: int(count) for value, count in result.all()}
+        except Exception as e:
+            logger.error(f"Error reading {self.model.__name__} counters: {e}")
+            raise RepositoryError
 
-            if filters:
-                if "$or" in filters:
-                    or_conditions = []
-                    for condition in filters["$or"]:
-                        for key, value in condition.items():
-                            if hasattr(self.model, key):
-                                column = getattr(self.model, key)
-                                if isinstance(value, str) and "%" in value:
-                                    or_conditions.append(column.ilike(value))
-                                else:
-                                    or_conditions.append(column == value)
-                    if or_conditions:
-                        query = query.filter(or_(*or_conditions))
-                for key, value in filters.items():
-                    if key == "$or":
-                        continue
-                    if hasattr(self.model, key):
-                        if isinstance(value, str) and "%" in value:
-                            query = query.filter(getattr(self.model, key).ilike(value))
-                        else:
-                            query = query.filter(getattr(self.model, key) == value)
+    async def estimate_count(self, query) -> int:
+        """
+        Estimativa de linhas do planner para uma consulta (sem executá-la)
 
-            result = await session.execute(query)
-            return result.scalar()
+        Roda EXPLAIN com os parâmetros da consulta ligados normalmente, sem
+        montar SQL com os valores dos filtros.
+        """
+        try:
+            session = await self.uow.get_session()
+            result = await session.execute(ExplainJson(query))
+            plan = result.scalar()
+            if isinstance(plan, (str, bytes)):
+                plan = orjson.loads(plan)
+            return max(int(plan[0]["Plan"]["Plan Rows"]), 0)
         except Exception as e:
-            logger.error(f"Error counting {self.model.__name__} records: {e}")
+            logger.error(f"Error estimating {self.model.__name__} count: {e}")
             raise RepositoryError
 
+    async def _similarity_match(self, session, columns: list, term: str):
+        """
+        Condição e score de busca por similaridade (pg_trgm) nas colunas
+
+        Casa substrings e termos com erros de digitação sem diferenciar
+        acentos, usando os índices GIN sobre `f_unaccent(lower(coluna))`.
+
+        Returns:
+            Tupla (condição para o WHERE, score 0-1 para ordenação)
+        """
+        await session.execute(
+            select(
+                func.set_config(
+                    "pg_trgm.word_similarity_threshold",
+                    str(settings.SEARCH_SIMILARITY_THRESHOLD),
+                    True,
+                )
+            )
+        )
+        normalized_term = normalized(term)
+        # `%` e `_` do usuário são literais no LIKE. O termo passa por
+        # f_unaccent(lower()) no banco, então `autoescape` (só para strings)
+        # não se aplica: escapa antes com "/", como o autoescape faz
+        escaped_term = normalized(
+            term.replace("/", "//").replace("%", "/%").replace("_", "/_")
+        )
+        conditions, scores = [], []
+        for column in columns:
+            value = normalized(column)
+            conditions.append(value.contains(escaped_term, escape="/"))
+            conditions.append(value.op("%>")(normalized_term))
+            scores.append(
+                func.coalesce(func.word_similarity(normalized_term, value), 0)
+            )
+        score = func.greatest(*scores) if len(scores) > 1 else scores[0]
+        return or_(*conditions), score
+
+    def _apply_filters(self, query, filters: dict = None):
+        if not filters:
+            return query
+
+        if "$or" in filters:
+            or_conditions = []
+            for condition in filters["$or"]:
+                for key, value in condition.items():
+                    if hasattr(self.model, key):
+                        column = getattr(self.model, key)
+                        if isinstance(value, str) and "%" in value:
+                            or_conditions.append(column.ilike(value))
+                        else:
+                            or_conditions.append(column == value)
+            if or_conditions:
+                query = query.filter(or_(*or_conditions))
+        for key, value in filters.items():
+            if key == "$or":
+                continue
+            if hasattr(self.model, key):
+                if isinstance(value, str) and "%" in value:
+                    query = query.filter(getattr(self.model, key).ilike(value))
+                else:
+                    query = query.filter(getattr(self.model, key) == value)
+        return query
+
     def _apply_ordering(self, query, order_by):
         if not order_by:
             return query
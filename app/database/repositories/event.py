@@ -6,11 +6,13 @@ from uuid import UUID
 from sqlalchemy import desc, select
 from sqlalchemy.orm import selectinload
 
+from app.core.tracing import traced_methods
 from app.database.models.base import Event, Fight
 from app.database.repositories.base import BaseRepository
 from app.database.unit_of_work import UnitOfWorkConnection
 
 
+@traced_methods()
 class EventRepository(BaseRepository[Event]):
     """Repository para gerenciar eventos"""
 
@@ -59,7 +61,10 @@ class EventRepository(BaseRepository[Event]):
         )
 
         if search:
-            query = query.filter(self.model.name.ilike(f"%{search}%"))
+            name_match, _ = await self._similarity_match(
+                session, [self.model.name], search
+            )
+            query = query.filter(name_match)
 
         if status:
             query = query.filter(self.model.status == status)
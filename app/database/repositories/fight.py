@@ -6,11 +6,13 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
+from app.core.tracing import traced_methods
 from app.database.models.base import Fight
 from app.database.repositories.base import BaseRepository
 from app.database.unit_of_work import UnitOfWorkConnection
 
 
+@traced_methods()
 class FightRepository(BaseRepository[Fight]):
     """Repository para gerenciar lutas"""
 
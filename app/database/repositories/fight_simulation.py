@@ -5,12 +5,14 @@ from uuid import UUID
 from sqlalchemy import func, or_, select
 
 from app.core.logger import logger
+from app.core.tracing import traced_methods
 from app.database.models.base import FightSimulation
 from app.database.repositories.base import BaseRepository
 from app.database.unit_of_work import UnitOfWorkConnection
 from app.exceptions.exceptions import RepositoryError
 
 
+@traced_methods()
 class FightSimulationRepository(BaseRepository[FightSimulation]):
     """Repositório específico para simulações de lutas"""
 
@@ -181,9 +183,20 @@ class FightSimulationRepository(BaseRepository[FightSimulation]):
             logger.error(f"Error fetching recent simulations: {e}")
             raise RepositoryError
 
-    async def get_total_count(self) -> int:
-        """Retorna o total de simulações no sistema"""
+    async def get_total_count(self, exact: bool = False) -> int:
+        """
+        Retorna o total de simulações no sistema
+
+        Por padrão lê o contador mantido por trigger (ver models/counters.py),
+        sem varrer as partições. Com `exact=True`, ou se o contador ainda não
+        existe, executa o COUNT(*) filtrado.
+        """
         try:
+            if not exact:
+                total = await self.get_counter()
+                if total is not None:
+                    return total
+
             session = await self.uow.get_session()
             query = (
                 select(func.count())
@@ -195,6 +208,8 @@ class FightSimulationRepository(BaseRepository[FightSimulation]):
             )
             result = await session.execute(query)
             return result.scalar() or 0
+        except RepositoryError:
+            raise
         except Exception as e:
             logger.error(f"Error counting simulations: {e}")
             raise RepositoryError
@@ -1,23 +1,45 @@
 """Repository para gerenciar lutadores"""
 
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import Integer, func, select, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import load_only
 
 from app.core.logger import logger
+from app.core.single_flight import single_flight
+from app.core.tracing import traced_methods
 from app.database.models.base import Fighter
+from app.database.models.counters import ALL_DIMENSION
+from app.database.models.fight_history import fighter_fight_history
 from app.database.repositories.base import BaseRepository
 from app.database.unit_of_work import UnitOfWorkConnection
 from app.exceptions.exceptions import RepositoryError
 
 
+@traced_methods()
 class FighterRepository(BaseRepository[Fighter]):
     """Repositório específico para lutadores"""
 
     def __init__(self, uow: UnitOfWorkConnection):
         super().__init__(Fighter, uow)
 
+    def _project(self, query, columns: Optional[Sequence[str]]):
+        """
+        Restringe o SELECT às colunas informadas
+
+        Atributos fora da projeção não são carregados nem sob demanda
+        (raiseload): acessá-los é erro de programação, não uma query extra.
+        """
+        if not columns:
+            return query
+        return query.options(
+            load_only(
+                *(getattr(self.model, column) for column in columns), raiseload=True
+            )
+        )
+
     async def get_by_name(self, name: str) -> Optional[Fighter]:
         """Busca lutador por nome exato"""
         try:
@@ -46,8 +68,13 @@ class FighterRepository(BaseRepository[Fighter]):
         min_overall: Optional[int] = None,
         limit: int = 10,
         offset: int = 0,
+        columns: Optional[Sequence[str]] = None,
     ) -> list[Fighter]:
-        """Busca avançada de lutadores"""
+        """
+        Busca avançada de lutadores
+
+        `columns` limita as colunas lidas (ex: listagens sem cartel/bio)
+        """
         try:
             session = await self.uow.get_session()
             query = select(self.model).filter(
@@ -56,13 +83,12 @@ class FighterRepository(BaseRepository[Fighter]):
             )
 
             # Aplicar filtros
+            name_score = None
             if name:
-                query = query.filter(
-                    or_(
-                        self.model.name.ilike(f"%{name}%"),
-                        self.model.nickname.ilike(f"%{name}%"),
-                    )
+                name_match, name_score = await self._similarity_match(
+                    session, [self.model.name, self.model.nickname], name
                 )
+                query = query.filter(name_match)
 
             if last_organization_fight:
                 query = query.filter(
@@ -95,6 +121,10 @@ class FighterRepository(BaseRepository[Fighter]):
                     >= min_overall
                 )
 
+            # Busca por nome: mais parecidos primeiro
+            if name_score is not None:
+                query = query.order_by(name_score.desc())
+
             # Ordenar por overall rating (decrescente)
             query = query.order_by(
                 (
@@ -111,7 +141,7 @@ class FighterRepository(BaseRepository[Fighter]):
             )
 
             # Paginação
-            query = query.offset(offset).limit(limit)
+            query = self._project(query, columns).offset(offset).limit(limit)
 
             result = await session.execute(query)
             return list(result.scalars().all())
@@ -127,23 +157,50 @@ class FighterRepository(BaseRepository[Fighter]):
         fighting_style: Optional[str] = None,
         is_real: Optional[bool] = None,
         min_overall: Optional[int] = None,
+        exact: bool = False,
     ) -> int:
-        """Conta lutadores que correspondem aos filtros"""
+        """
+        Conta lutadores que correspondem aos filtros
+
+        Sem filtros ou com um único filtro de categoria/organização/real o
+        total vem dos contadores mantidos por trigger (exato e sem varredura).
+        Combinações de filtros usam a estimativa do planner, a menos que
+        `exact=True` seja informado.
+        """
         try:
+            counter_filters = [
+                (dimension, value)
+                for dimension, value in (
+                    ("last_organization_fight", last_organization_fight or None),
+                    ("actual_weight_class", actual_weight_class or None),
+                    ("is_real", None if is_real is None else str(is_real).lower()),
+                )
+                if value is not None
+            ]
+            if (
+                not exact
+                and not (name or fighting_style or min_overall)
+                and len(counter_filters) <= 1
+            ):
+                dimension, value = (
+                    counter_filters[0] if counter_filters else (ALL_DIMENSION, "")
+                )
+                total = await self.get_counter(dimension, value)
+                if total is not None or counter_filters:
+                    return total or 0
+
             session = await self.uow.get_session()
-            query = select(func.count(self.model.id)).filter(
+            query = select(self.model.id).filter(
                 self.model.deleted_at.is_(None),
                 self.model.deleted_by.is_(None),
             )
 
             # Aplicar os mesmos filtros da busca
             if name:
-                query = query.filter(
-                    or_(
-                        self.model.name.ilike(f"%{name}%"),
-                        self.model.nickname.ilike(f"%{name}%"),
-                    )
+                name_match, _ = await self._similarity_match(
+                    session, [self.model.name, self.model.nickname], name
                 )
+                query = query.filter(name_match)
 
             if last_organization_fight:
                 query = query.filter(
@@ -175,20 +232,96 @@ class FighterRepository(BaseRepository[Fighter]):
                     >= min_overall
                 )
 
-            result = await session.execute(query)
+            # Sem contador disponível e sem filtros (ex: tabela recém-criada)
+            # a contagem real é barata; com filtros usa a estimativa
+            if not exact and (counter_filters or name or fighting_style or min_overall):
+                return await self.estimate_count(query)
+
+            result = await session.execute(
+                select(func.count()).select_from(query.subquery())
+            )
             return result.scalar() or 0
+        except RepositoryError:
+            raise
         except Exception as e:
             logger.error(f"Error counting fighters: {e}")
             raise RepositoryError
 
+    async def autocomplete(self, term: str, limit: int = 10) -> list:
+        """
+        Retorna os `limit` lutadores com nome/apelido mais parecidos com o termo
+
+        Seleciona só as colunas exibidas nas sugestões; a ordenação por score
+        é feita sobre as poucas linhas que passam pelo índice trigram.
+        """
+        try:
+            session = await self.uow.get_session()
+            name_match, score = await self._similarity_match(
+                session, [self.model.name, self.model.nickname], term
+            )
+            query = (
+                select(
+                    self.model.id,
+                    self.model.name,
+                    self.model.nickname,
+                    self.model.last_organization_fight,
+                    self.model.actual_weight_class,
+                )
+                .filter(
+                    self.model.deleted_at.is_(None),
+                    self.model.deleted_by.is_(None),
+                    name_match,
+                )
+                .order_by(score.desc(), self.model.name)
+                .limit(limit)
+            )
+            result = await session.execute(query)
+            return list(result.all())
+        except Exception as e:
+            logger.error(f"Error fetching fighter suggestions: {e}")
+            raise RepositoryError
+
+    async def get_index_entries(self) -> list:
+        """Colunas usadas pelo índice de autocomplete em memória"""
+        try:
+            session = await self.uow.get_session()
+            query = select(
+                self.model.id,
+                self.model.name,
+                self.model.nickname,
+                self.model.last_organization_fight,
+                self.model.actual_weight_class,
+                self.model.wins,
+                self.model.losses,
+                self.model.draws,
+                self.model.striking,
+                self.model.grappling,
+                self.model.defense,
+                self.model.stamina,
+                self.model.speed,
+                self.model.strategy,
+            ).filter(
+                self.model.deleted_at.is_(None),
+                self.model.deleted_by.is_(None),
+            )
+            result = await session.execute(query)
+            return list(result.all())
+        except Exception as e:
+            logger.error(f"Error fetching fighter index entries: {e}")
+            raise RepositoryError
+
     async def get_fighters_by_creator(
-        self, creator_id: UUID, limit: int = 50, offset: int = 0
+        self,
+        creator_id: UUID,
+        limit: int = 50,
+        offset: int = 0,
+        columns: Optional[Sequence[str]] = None,
     ) -> list[Fighter]:
         """Busca lutadores criados por um usuário específico"""
         try:
             session = await self.uow.get_session()
             query = (
-                select(self.model)
+                self._project(select(self.model), columns)
                 .filter(self.model.creator_id == creator_id)
                 .filter(
                     self.model.deleted_at.is_(None),
@@ -210,11 +343,12 @@ class FighterRepository(BaseRepository[Fighter]):
         last_organization_fight: Optional[str] = None,
         actual_weight_class: Optional[str] = None,
         limit: int = 10,
+        columns: Optional[Sequence[str]] = None,
     ) -> list[Fighter]:
         """Retorna os melhores lutadores (por overall rating)"""
         try:
             session = await self.uow.get_session()
-            query = select(self.model).filter(
+            query = self._project(select(self.model), columns).filter(
                 self.model.deleted_at.is_(None),
                 self.model.deleted_by.is_(None),
             )
@@ -250,50 +384,106 @@ class FighterRepository(BaseRepository[Fighter]):
             logger.error(f"Error fetching top fighters: {e}")
             raise RepositoryError
 
-    async def get_stats(self) -> dict:
-        """Retorna estatísticas agregadas sobre lutadores"""
+    async def get_fight_history(
+        self, fighter_id: UUID, limit: int = 20, offset: int = 0
+    ) -> tuple[list[dict], int]:
+        """
+        Página do histórico de lutas do lutador (view fighter_fight_history)
+
+        Returns:
+            Tupla (lutas mais recentes primeiro, total de lutas)
+        """
         try:
             session = await self.uow.get_session()
-
-            # Total de lutadores
-            total_query = (
-                select(func.count())
-                .select_from(self.model)
-                .filter(self.model.deleted_at.is_(None))
-            )
-            total_result = await session.execute(total_query)
-            total = total_result.scalar()
-
-            # Total de lutadores reais
-            real_query = (
-                select(func.count())
-                .select_from(self.model)
-                .filter(self.model.deleted_at.is_(None), self.model.is_real.is_(True))
+            history = fighter_fight_history
+            total = await session.scalar(
+                select(func.count()).filter(history.c.fighter_id == fighter_id)
             )
-            real_result = await session.execute(real_query)
-            total_real = real_result.scalar()
-
-            # Lutadores por última organização
-            org_query = (
-                select(self.model.last_organization_fight, func.count(self.model.id))
-                .filter(self.model.deleted_at.is_(None))
-                .group_by(self.model.last_organization_fight)
+            if not total:
+                return [], 0
+
+            query = (
+                select(history)
+                .filter(history.c.fighter_id == fighter_id)
+                .order_by(history.c.event_date.desc(), history.c.fight_id)
+                .offset(offset)
+                .limit(limit)
             )
-            org_result = await session.execute(org_query)
-            last_organizations = {
-                org: count for org, count in org_result.all() if org is not None
-            }
+            result = await session.execute(query)
+            return [dict(row) for row in result.mappings()], total
+        except Exception as e:
+            logger.error(f"Error fetching fight history: {e}")
+            raise RepositoryError
+
+    async def get_legacy_cartel(
+        self, fighter_id: UUID, limit: int = 20, offset: int = 0
+    ) -> tuple[list[dict], int]:
+        """
+        Página do JSONB fighters.cartel, fatiada no banco
 
-            # Lutadores por categoria de peso atual
-            weight_query = (
-                select(self.model.actual_weight_class, func.count(self.model.id))
-                .filter(self.model.deleted_at.is_(None))
-                .group_by(self.model.actual_weight_class)
+        Usado para lutadores sem lutas em fights (ex: importados via CSV).
+        """
+        try:
+            session = await self.uow.get_session()
+            query = text(
+                """
+                SELECT
+                    jsonb_array_length(f.cartel) AS total,
+                    coalesce(
+                        (
+                            SELECT jsonb_agg(page.value ORDER BY page.position)
+                            FROM (
+                                SELECT value, position
+                                FROM jsonb_array_elements(f.cartel)
+                                    WITH ORDINALITY AS e(value, position)
+                                ORDER BY position
+                                OFFSET :offset LIMIT :limit
+                            ) page
+                        ),
+                        '[]'::jsonb
+                    ) AS fights
+                FROM fighters f
+                WHERE f.id = :fighter_id
+                """
+            ).columns(total=Integer, fights=JSONB)
+            result = await session.execute(
+                query, {"fighter_id": fighter_id, "limit": limit, "offset": offset}
             )
-            weight_result = await session.execute(weight_query)
-            weight_classes = {
-                wc: count for wc, count in weight_result.all() if wc is not None
-            }
+            row = result.one_or_none()
+            if row is None:
+                return [], 0
+            return row.fights, row.total
+        except Exception as e:
+            logger.error(f"Error fetching fighter cartel: {e}")
+            raise RepositoryError
+
+    @single_flight("fighters.get_stats")
+    async def get_stats(self, exact: bool = False) -> dict:
+        """
+        Retorna estatísticas agregadas sobre lutadores
+
+        Os totais e distribuições vêm dos contadores mantidos por trigger;
+        com `exact=True` (ou sem contadores) são recalculados via COUNT.
+        """
+        try:
+            session = await self.uow.get_session()
+
+            total = None if exact else await self.get_counter()
+            if total is not None:
+                total_real = await self.get_counter("is_real", "true") or 0
+                last_organizations = await self.get_counters_by_dimension(
+                    "last_organization_fight"
+                )
+                weight_classes = await self.get_counters_by_dimension(
+                    "actual_weight_class"
+                )
+            else:
+                (
+                    total,
+                    total_real,
+                    last_organizations,
+                    weight_classes,
+                ) = await self._count_stats(session)
 
             # Média geral de overall rating
             avg_query = select(
@@ -323,3 +513,45 @@ class FighterRepository(BaseRepository[Fighter]):
         except Exception as e:
             logger.error(f"Error fetching fighter stats: {e}")
             raise RepositoryError
+
+    async def _count_stats(self, session) -> tuple[int, int, dict, dict]:
+        """Totais e distribuições calculados diretamente na tabela"""
+        live = (self.model.deleted_at.is_(None), self.model.deleted_by.is_(None))
+
+        # Total de lutadores
+        total_query = select(func.count()).select_from(self.model).filter(*live)
+        total_result = await session.execute(total_query)
+        total = total_result.scalar()
+
+        # Total de lutadores reais
+        real_query = (
+            select(func.count())
+            .select_from(self.model)
+            .filter(*live, self.model.is_real.is_(True))
+        )
+        real_result = await session.execute(real_query)
+        total_real = real_result.scalar()
+
+        # Lutadores por última organização
+        org_query = (
+            select(self.model.last_organization_fight, func.count(self.model.id))
+            .filter(*live)
+            .group_by(self.model.last_organization_fight)
+        )
+        org_result = await session.execute(org_query)
+        last_organizations = {
+            org: count for org, count in org_result.all() if org is not None
+        }
+
+        # Lutadores por categoria de peso atual
+        weight_query = (
+            select(self.model.actual_weight_class, func.count(self.model.id))
+            .filter(*live)
+            .group_by(self.model.actual_weight_class)
+        )
+        weight_result = await session.execute(weight_query)
+        weight_classes = {
+            wc: count for wc, count in weight_result.all() if wc is not None
+        }
+
+        return total, total_real, last_organizations, weight_classes
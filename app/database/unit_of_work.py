@@ -1,10 +1,15 @@
+import asyncio
 import json
 from typing import Optional
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.logger import logger
+from app.core.metrics import instrument_pool
+from app.core.query_stats import instrument_engine
+from app.core.tracing import trace_engine
 from app.core.settings import get_settings
 
 # Global engine and session factory for reuse
@@ -23,12 +28,37 @@ async def _get_engine_and_factory():
             echo=False,
             json_serializer=lambda obj: json.dumps(obj, ensure_ascii=False),
         )
+        instrument_engine(_engine.sync_engine)
+        instrument_pool(_engine.sync_engine, "default")
+        trace_engine(_engine.sync_engine)
         _session_factory = sessionmaker(
             autocommit=False, autoflush=False, bind=_engine, class_=AsyncSession
         )
     return _engine, _session_factory
 
 
+async def warm_up_pool(connections: Optional[int] = None) -> int:
+    """Abre as conexões do pool antes da primeira requisição
+
+    Args:
+        connections: Quantidade de conexões (padrão: tamanho do pool).
+
+    Returns:
+        int: Conexões abertas.
+    """
+    engine, _ = await _get_engine_and_factory()
+    pool = engine.sync_engine.pool
+    if connections is None:
+        connections = pool.size() if hasattr(pool, "size") else 1
+
+    async def ping() -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(ping() for _ in range(connections)))
+    return connections
+
+
 class UnitOfWorkConnection:
     """Unit of Work pattern for managing database transactions."""
 
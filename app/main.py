@@ -1,39 +1,61 @@
+import asyncio
 import contextlib
 from typing import AsyncIterator
 
-from alembic.command import upgrade
-from alembic.config import Config as alembic_config
 from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from starlette.applications import Starlette
 
 from app.api import api_router
+from app.api.responses import ORJSONResponse
 from app.core.logger import logger
 from app.core.settings import get_settings
+from app.core.metrics import mark_process_dead
+from app.core.tracing import setup_tracing, shutdown_tracing
+from app.database.migrations import ensure_schema
 from app.exceptions.exceptions import DefaultApiException
+from app.middlewares.metrics import MetricsMiddleware
+from app.middlewares.profiling import ProfilingMiddleware
+from app.middlewares.compression import CompressionMiddleware
+from app.middlewares.response_cache import ResponseCacheMiddleware
 from app.middlewares.response_time import ResponseTimeMiddleware
 from app.middlewares.trace_id import CreateTraceIdMiddleware
-from app.services.ml.model_loader import ml_model_loader
+from app.middlewares.tracing import TracingMiddleware
+from app.services.domain.fighter_index import refresh_fighter_index_periodically
+from app.services.warmup import readiness, run_warm_up
 
-config_file = alembic_config()
 settings = get_settings()
 
-config_file.set_main_option("script_location", settings.APP_MIGRATIONS_FOLDER)
-config_file.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
-
 
 @contextlib.asynccontextmanager
 async def lifespan(app: Starlette) -> AsyncIterator:
-    logger.info("Running database migrations...")
-    upgrade(config_file, "head")
+    setup_tracing()
+
+    # Migrations rodam antes (scripts/migrate.py); aqui só a checagem do head
+    await ensure_schema()
 
-    # Carregar modelo ML
-    logger.info("🤖 Inicializando modelo ML...")
-    ml_model_loader.load_model()
+    # Modelo ML, pool, índice de autocomplete e cache em background;
+    # /api/readyz responde 503 até terminar (ver app/services/warmup.py)
+    warm_up_task = asyncio.create_task(run_warm_up(app))
+
+    refresh_task = None
+    if settings.AUTOCOMPLETE_INDEX_REFRESH_SECONDS > 0:
+        refresh_task = asyncio.create_task(
+            refresh_fighter_index_periodically(
+                settings.AUTOCOMPLETE_INDEX_REFRESH_SECONDS
+            )
+        )
 
     yield
 
+    readiness.mark_not_ready()
+    warm_up_task.cancel()
+    if refresh_task:
+        refresh_task.cancel()
+    mark_process_dead()
+    shutdown_tracing()
+
 
 app = FastAPI(
     title="🥊 FightBase API",
@@ -65,6 +87,7 @@ app = FastAPI(
     docs_url="/swagger",
     redoc_url="/docs",
     separate_input_output_schemas=True,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -90,6 +113,10 @@ async def general_exception_handler(request, exc):
     )
 
 
+# Por dentro de tudo: a rota roda na mesma task da requisição perfilada
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+app.add_middleware(ResponseCacheMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"] if settings.APP_CORS == "*" else settings.APP_CORS_LIST,
@@ -97,6 +124,12 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-app.add_middleware(CreateTraceIdMiddleware)
+app.add_middleware(CompressionMiddleware)
+# Trace id por fora: o log de tempo/queries da requisição já sai com ele
 app.add_middleware(ResponseTimeMiddleware)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+# Dentro do trace id: o span raiz reaproveita o x-trace-id como trace id
+app.add_middleware(TracingMiddleware)
+app.add_middleware(CreateTraceIdMiddleware)
 app.include_router(router=api_router)
@@ -0,0 +1,65 @@
+import asyncio
+import threading
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logger import logger
+from app.core.profiler import StackSampler, profile_path, write_folded
+from app.core.settings import get_settings
+from app.middlewares.response_cache import token_role
+from app.schemas.auth import RoleEnum
+
+settings = get_settings()
+
+
+class ProfilingMiddleware:
+    """
+    Profile de uma requisição com `X-Profile: 1` (só para tokens de admin)
+
+    Fica por dentro dos demais middlewares para que a rota rode na mesma task
+    (ver app/core/profiler.py). O nome do arquivo volta no header
+    X-Profile-File; o conteúdo sai em GET /admin/maintenance/profiles/{nome}.
+    Só é registrado com PROFILING_ENABLED.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if headers.get("x-profile") != "1" or (
+            token_role(headers.get("authorization")) != RoleEnum.admin
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        path = profile_path(f"{scope['method']}{scope['path']}")
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"].append((b"x-profile-file", path.name.encode()))
+            await send(message)
+
+        sampler = StackSampler(
+            thread_id=threading.get_ident(),
+            interval=settings.PROFILING_INTERVAL_MS / 1000,
+            task=asyncio.current_task(),
+            loop=asyncio.get_running_loop(),
+        ).start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            samples = sampler.stop()
+            await asyncio.to_thread(write_folded, samples, path)
+            logger.info(
+                "Profile gravado: %s (%d amostras em %.3fs)",
+                path.name,
+                sum(samples.values()),
+                sampler.duration,
+            )
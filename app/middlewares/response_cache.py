@@ -0,0 +1,189 @@
+import re
+from email.utils import parsedate_to_datetime
+from urllib.parse import parse_qsl, urlencode
+
+from jose import JWTError, jwt
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.conditional import is_not_modified
+from app.core.compression import negotiate_encoding
+from app.core.response_cache import CachedResponse, response_cache
+from app.core.settings import get_settings
+from app.core.single_flight import SingleFlight
+
+settings = get_settings()
+
+# Coalescência de misses concorrentes para a mesma chave
+response_flight = SingleFlight("response_cache")
+
+# Rotas cacheadas e as tags que as invalidam
+CACHE_RULES: tuple[tuple[re.Pattern, tuple[str, ...]], ...] = (
+    (re.compile(r"^/api/v1/fighters/rankings/top/?$"), ("fighters",)),
+    (re.compile(r"^/api/v1/fighters/statistics/overview/?$"), ("fighters",)),
+    (re.compile(r"^/api/v1/events(/[^/]+)?/?$"), ("events", "fighters")),
+    (
+        re.compile(r"^/api/v1/simulations/statistics/overview/?$"),
+        ("simulations", "fighters"),
+    ),
+    (re.compile(r"^/api/v1/simulations/predict/?$"), ("fighters",)),
+)
+
+# Headers que não fazem sentido reaproveitar entre requisições
+_SKIPPED_HEADERS = {b"content-length", b"x-response-time", b"x-cache"}
+
+
+def _match_tags(path: str):
+    for pattern, tags in CACHE_RULES:
+        if pattern.match(path):
+            return tags
+    return None
+
+
+def token_role(authorization: str) -> str:
+    """Role do token (sem ir ao banco); tokens inválidos contam como anônimos"""
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return "anonymous"
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, [settings.ALGORITHM])
+    except JWTError:
+        return "anonymous"
+    return payload.get("role") or "user"
+
+
+class ResponseCacheMiddleware:
+    """
+    Cache de respostas para GETs idempotentes selecionados (ver CACHE_RULES)
+
+    A chave combina path, query string normalizada e role do usuário. Apenas
+    respostas 200 são armazenadas. Misses concorrentes para a mesma chave são
+    coalescidos: só a primeira requisição executa a rota, as demais aguardam
+    o resultado dela.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not settings.RESPONSE_CACHE_ENABLED
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        tags = _match_tags(scope["path"])
+        headers = Headers(scope=scope)
+        if tags is None or "no-cache" in headers.get("cache-control", ""):
+            await self.app(scope, receive, send)
+            return
+
+        query = urlencode(
+            sorted(parse_qsl(scope["query_string"].decode(), keep_blank_values=True))
+        )
+        role = token_role(headers.get("authorization"))
+        key = await response_cache.build_key((scope["path"], query, role), tags)
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+
+        entry = await response_cache.get(key)
+        if entry is not None:
+            await self._send_cached(entry, headers, send)
+            return
+
+        leader = False
+
+        async def compute():
+            nonlocal leader
+            leader = True
+            captured = await self._call_and_capture(scope, receive, send)
+            if captured is not None:
+                await response_cache.set(key, captured)
+            return captured
+
+        entry = await response_flight.do(key, compute)
+        if leader:
+            return
+        if entry is None:
+            # Resposta do líder não era cacheável: executa a rota normalmente
+            await self.app(scope, receive, send)
+            return
+        await self._send_cached(entry, headers, send)
+
+    async def _call_and_capture(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> CachedResponse | None:
+        start: Message = {}
+        chunks: list[bytes] = []
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                message = {
+                    **message,
+                    "headers": [*message.get("headers", []), (b"x-cache", b"MISS")],
+                }
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        response_headers = Headers(raw=start.get("headers", []))
+        if (
+            start.get("status") != 200
+            or "content-encoding" in response_headers
+            or "set-cookie" in response_headers
+            or "no-store" in response_headers.get("cache-control", "")
+        ):
+            return None
+        return CachedResponse.build(
+            200,
+            [
+                (name, value)
+                for name, value in start["headers"]
+                if name.lower() not in _SKIPPED_HEADERS
+            ],
+            b"".join(chunks),
+        )
+
+    async def _send_cached(
+        self, entry: CachedResponse, request_headers: Headers, send: Send
+    ) -> None:
+        cached_headers = Headers(raw=entry.headers)
+        last_modified = cached_headers.get("last-modified")
+        if is_not_modified(
+            request_headers,
+            cached_headers.get("etag"),
+            parsedate_to_datetime(last_modified) if last_modified else None,
+        ):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [
+                        (name, value)
+                        for name, value in entry.headers
+                        if name in (b"etag", b"last-modified", b"cache-control")
+                    ]
+                    + [(b"x-cache", b"HIT")],
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        headers = [*entry.headers, (b"x-cache", b"HIT"), (b"vary", b"Accept-Encoding")]
+        encoding = negotiate_encoding(request_headers.get("accept-encoding", ""))
+        body = entry.body(encoding)
+        if encoding in entry.bodies:
+            headers.append((b"content-encoding", encoding.encode()))
+        headers.append((b"content-length", str(len(body)).encode()))
+
+        await send(
+            {"type": "http.response.start", "status": entry.status, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -5,12 +5,20 @@ from starlette.requests import Request
 from starlette.responses import Response
 
 from app.core.logger import logger
+from app.core.query_stats import track_queries
+from app.core.settings import get_settings
+
+settings = get_settings()
 
 
 class ResponseTimeMiddleware(BaseHTTPMiddleware):
     """
     A ideia desse middleware é de retornar o valor de tempo de
     resposta dos endpoints chamados.
+
+    Também conta as queries e o tempo de banco da requisição (ver
+    app/core/query_stats.py); fora de produção eles vão nos headers
+    X-DB-Queries e X-DB-Time.
     """
 
     async def dispatch(
@@ -21,9 +29,11 @@ class ResponseTimeMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
 
         initial_time = time()
-        response = await call_next(request)
+        with track_queries() as stats:
+            response = await call_next(request)
         final_time = time() - initial_time
         elapsed_time = str(round(final_time, 3))
+        db_time = str(round(stats.duration, 4))
         logger.info(
             "Request completed",
             extra={
@@ -31,7 +41,22 @@ class ResponseTimeMiddleware(BaseHTTPMiddleware):
                 "path": request.url.path,
                 "status_code": response.status_code,
                 "response_time": elapsed_time,
+                "db_queries": stats.count,
+                "db_time": db_time,
             },
         )
+
+        threshold = settings.DB_N_PLUS_ONE_THRESHOLD
+        if threshold:
+            for statement, count in stats.repeated(threshold).items():
+                logger.warning(
+                    f"Possible N+1: statement executed {count}x in "
+                    f"{request.method} {request.url.path}: {statement[:300]}"
+                )
+
         response.headers.update({"X-Response-Time": elapsed_time})
+        if settings.APP_ENVIRONMENT != "production":
+            response.headers.update(
+                {"X-DB-Queries": str(stats.count), "X-DB-Time": db_time}
+            )
         return response
@@ -4,7 +4,9 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+from app.database.models.simulation_details import render_simulation_details
 
 
 class FighterSummary(BaseModel):
@@ -44,6 +46,15 @@ class FightResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @model_validator(mode="after")
+    def render_details(self) -> "FightResponse":
+        """Reconstrói os detalhes round a round a partir do formato compacto"""
+        if self.simulation_details and self.fighter1 and self.fighter2:
+            self.simulation_details = render_simulation_details(
+                self.simulation_details, self.fighter1.name, self.fighter2.name
+            )
+        return self
+
 
 class EventResponse(BaseModel):
     """Response schema para um evento"""
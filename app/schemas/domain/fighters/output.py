@@ -1,10 +1,30 @@
 """Schemas de output para Fighters"""
 
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Any, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, computed_field
+from pydantic import BaseModel, computed_field, field_validator
+
+ATTRIBUTE_FIELDS = ("striking", "grappling", "defense", "stamina", "speed", "strategy")
+
+
+def calculate_overall_rating(fighter) -> float:
+    """Nota geral do lutador (média dos atributos)"""
+    return round(sum(getattr(fighter, field) for field in ATTRIBUTE_FIELDS) / 6, 1)
+
+
+def calculate_record(fighter) -> str:
+    """Cartel no formato W-L-D"""
+    return f"{fighter.wins}-{fighter.losses}-{fighter.draws}"
+
+
+def calculate_finish_rate(fighter) -> float:
+    """Taxa de finalização (KO + Submission / Total Wins)"""
+    if not fighter.wins:
+        return 0.0
+    total_finishes = (fighter.ko_wins or 0) + (fighter.submission_wins or 0)
+    return round((total_finishes / fighter.wins) * 100, 1)
 
 
 class FighterOutput(BaseModel):
@@ -40,9 +60,6 @@ class FighterOutput(BaseModel):
     ko_wins: Optional[int] = 0
     submission_wins: Optional[int] = 0
 
-    # Cartel de lutas
-    cartel: Optional[list[dict]] = []
-
     # Informações adicionais
     age: Optional[int] = None
     stance: Optional[str] = None  # Orthodox, Southpaw, Switch
@@ -57,33 +74,87 @@ class FighterOutput(BaseModel):
     @property
     def overall_rating(self) -> float:
         """Calcula a nota geral do lutador (média dos atributos)"""
-        return round(
-            (
-                self.striking
-                + self.grappling
-                + self.defense
-                + self.stamina
-                + self.speed
-                + self.strategy
-            )
-            / 6,
-            1,
-        )
+        return calculate_overall_rating(self)
 
     @computed_field
     @property
     def record(self) -> str:
         """Retorna o cartel no formato W-L-D"""
-        return f"{self.wins}-{self.losses}-{self.draws}"
+        return calculate_record(self)
 
     @computed_field
     @property
     def finish_rate(self) -> float:
         """Taxa de finalização (KO + Submission / Total Wins)"""
-        if self.wins == 0:
-            return 0.0
-        total_finishes = (self.ko_wins or 0) + (self.submission_wins or 0)
-        return round((total_finishes / self.wins) * 100, 1)
+        return calculate_finish_rate(self)
+
+
+# Campos calculados -> colunas de que dependem
+FIGHTER_COMPUTED_FIELDS = {
+    "overall_rating": (ATTRIBUTE_FIELDS, calculate_overall_rating),
+    "record": (("wins", "losses", "draws"), calculate_record),
+    "finish_rate": (("wins", "ko_wins", "submission_wins"), calculate_finish_rate),
+}
+
+# Propriedades do model Fighter -> colunas de que dependem
+FIGHTER_PROPERTY_COLUMNS = {"age": ("date_of_birth",)}
+
+# Colunas pesadas que as listagens só carregam se pedidas em `fields=`
+# (o cartel tem endpoint paginado próprio: /fighters/{id}/cartel)
+FIGHTER_DEFERRED_FIELDS = ("bio",)
+
+FIGHTER_FIELDS = (*FighterOutput.model_fields, *FIGHTER_COMPUTED_FIELDS)
+FIGHTER_LIST_FIELDS = tuple(
+    field for field in FIGHTER_FIELDS if field not in FIGHTER_DEFERRED_FIELDS
+)
+
+
+def parse_fighter_fields(fields: Optional[str]) -> tuple[str, ...]:
+    """
+    Interpreta o parâmetro `fields` (nomes separados por vírgula)
+
+    Sem `fields` retorna os campos padrão das listagens (sem bio).
+    `id` é sempre incluído.
+
+    Raises:
+        ValueError: Se algum campo não existir no FighterOutput
+    """
+    if not fields:
+        return FIGHTER_LIST_FIELDS
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = sorted(set(requested) - set(FIGHTER_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return tuple(dict.fromkeys(["id", *requested]))
+
+
+def fighter_columns(fields: tuple[str, ...]) -> tuple[str, ...]:
+    """Colunas que precisam ser lidas do banco para montar os campos pedidos"""
+    columns = []
+    for field in fields:
+        if field in FIGHTER_COMPUTED_FIELDS:
+            dependencies = FIGHTER_COMPUTED_FIELDS[field][0]
+        else:
+            dependencies = (field,)
+        for column in dependencies:
+            columns.extend(FIGHTER_PROPERTY_COLUMNS.get(column, (column,)))
+    return tuple(dict.fromkeys(columns))
+
+
+def project_fighter(fighter, fields: tuple[str, ...]) -> dict[str, Any]:
+    """
+    Monta o dict de saída só com os campos pedidos
+
+    Lê direto dos atributos carregados (sem validar um FighterOutput por
+    linha); os campos calculados usam as mesmas funções do FighterOutput.
+    """
+    output = {}
+    for field in fields:
+        if field in FIGHTER_COMPUTED_FIELDS:
+            output[field] = FIGHTER_COMPUTED_FIELDS[field][1](fighter)
+        else:
+            output[field] = getattr(fighter, field)
+    return output
 
 
 class FighterListOutput(BaseModel):
@@ -95,6 +166,112 @@ class FighterListOutput(BaseModel):
     offset: int
 
 
+class FighterSummaryOutput(BaseModel):
+    """
+    Lutador em listagens
+
+    Sem bio por padrão; com `fields=` contém apenas os campos pedidos.
+    """
+
+    id: UUID
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    created_by: Optional[str] = None
+    name: Optional[str] = None
+    nickname: Optional[str] = None
+    last_organization_fight: Optional[str] = None
+    actual_weight_class: Optional[str] = None
+    fighting_style: Optional[str] = None
+    striking: Optional[int] = None
+    grappling: Optional[int] = None
+    defense: Optional[int] = None
+    stamina: Optional[int] = None
+    speed: Optional[int] = None
+    strategy: Optional[int] = None
+    wins: Optional[int] = None
+    losses: Optional[int] = None
+    draws: Optional[int] = None
+    ko_wins: Optional[int] = None
+    submission_wins: Optional[int] = None
+    age: Optional[int] = None
+    stance: Optional[str] = None
+    height_cm: Optional[float] = None
+    reach_cm: Optional[float] = None
+    bio: Optional[str] = None
+    image_url: Optional[str] = None
+    is_real: Optional[bool] = None
+    creator_id: Optional[UUID] = None
+    overall_rating: Optional[float] = None
+    record: Optional[str] = None
+    finish_rate: Optional[float] = None
+
+
+class FighterSummaryListOutput(BaseModel):
+    """Listagem paginada de lutadores (campos esparsos)"""
+
+    fighters: list[FighterSummaryOutput]
+    total: int
+    limit: int
+    offset: int
+
+
+class CartelFightOutput(BaseModel):
+    """
+    Uma luta do cartel do lutador
+
+    Mesmo formato para as lutas da view fighter_fight_history e para as
+    entradas do JSONB legado (que guardam a data como "dd/mm/aaaa").
+    """
+
+    opponent: Optional[str] = None
+    result: Optional[str] = None  # W, L, D, N/A
+    method: Optional[str] = None
+    round: Optional[int] = None
+    date: Optional[datetime] = None
+    organization: Optional[str] = None
+    # Nulos nas entradas do JSONB legado (sem fights/events)
+    fight_id: Optional[UUID] = None
+    event_id: Optional[UUID] = None
+    event_name: Optional[str] = None
+    opponent_id: Optional[UUID] = None
+    method_details: Optional[str] = None
+    finish_time: Optional[str] = None
+    weight_class: Optional[str] = None
+    is_title_fight: Optional[bool] = None
+
+    @field_validator("date", mode="before")
+    @classmethod
+    def parse_legacy_date(cls, value):
+        if isinstance(value, str):
+            try:
+                return datetime.strptime(value, "%d/%m/%Y").replace(tzinfo=timezone.utc)
+            except ValueError:
+                return value
+        return value
+
+
+class FighterCartelOutput(BaseModel):
+    """Cartel paginado de um lutador (mais recentes primeiro)"""
+
+    fighter_id: UUID
+    fights: list[CartelFightOutput]
+    total: int
+    limit: int
+    offset: int
+
+
+class FighterSuggestionOutput(BaseModel):
+    """Schema de saída para sugestões do autocomplete"""
+
+    model_config = {"from_attributes": True}
+
+    id: UUID
+    name: str
+    nickname: Optional[str] = None
+    last_organization_fight: Optional[str] = None
+    actual_weight_class: Optional[str] = None
+
+
 class FighterComparisonOutput(BaseModel):
     """Schema para comparação entre dois lutadores"""
 
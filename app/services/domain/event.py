@@ -1,10 +1,15 @@
 """Service for Event operations"""
 
+import random
 from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import UUID
 
+from app.core.metrics import SIMULATIONS
+from app.core.response_cache import response_cache
+from app.core.tracing import traced_methods
 from app.database.models.base import Event, Fight
+from app.database.models.simulation_details import encode_simulation_details
 from app.database.repositories.event import EventRepository
 from app.database.repositories.fight import FightRepository
 from app.database.repositories.fighter import FighterRepository
@@ -15,6 +20,7 @@ from app.schemas.domain.events.output import FightResponse, SimulationResult
 from app.services.domain.fight_simulation import FightSimulationService
 
 
+@traced_methods()
 class EventService:
     """Service para gerenciar eventos de MMA"""
 
@@ -68,9 +74,29 @@ class EventService:
 
         await session.commit()
         await session.refresh(event)
+        await response_cache.invalidate("events")
 
         return event
 
+    async def get_event_version(self, event_id: UUID) -> tuple[int, datetime]:
+        """
+        Versão de um evento para GET condicional (ETag/Last-Modified)
+
+        O card do evento inclui as lutas e os nomes dos lutadores, então a
+        versão considera as três tabelas.
+        """
+        updated_at = await self.event_repo.get_row_version(event_id)
+        if updated_at is None:
+            raise NotFoundError("Event not found")
+        version, modified_at = await self.event_repo.get_table_version(
+            "events", "fights", "fighters"
+        )
+        return version, max(filter(None, (updated_at, modified_at)))
+
+    async def get_events_version(self) -> tuple[int, Optional[datetime]]:
+        """Versão da listagem de eventos"""
+        return await self.event_repo.get_table_version("events", "fights")
+
     async def get_event(self, event_id: UUID) -> Optional[Event]:
         """Busca um evento com suas lutas"""
         event = await self.event_repo.get_with_fights(event_id)
@@ -121,6 +147,7 @@ class EventService:
         session.add(fight)
         await session.commit()
         await session.refresh(fight)
+        await response_cache.invalidate("events")
 
         return fight
 
@@ -153,89 +180,15 @@ class EventService:
             # Garante que os fighters estão carregados na sessão
             await session.refresh(fight, ["fighter1", "fighter2"])
 
-            # Calcula probabilidades
-            prob1, prob2 = self.simulation_service.calculate_win_probability(
-                fight.fighter1, fight.fighter2
-            )
-
-            # Simula a luta (reusa a lógica do FightSimulationService)
-            import random
-
-            # Simula rounds
-            round_details = []
-            fighter1_total_points = 0
-            fighter2_total_points = 0
-
-            for round_num in range(1, fight.rounds + 1):
-                round_result = self.simulation_service._simulate_round(
-                    fight.fighter1, fight.fighter2, round_num
-                )
-                round_details.append(round_result)
-                fighter1_total_points += round_result["fighter1_points"]
-                fighter2_total_points += round_result["fighter2_points"]
-
-            # Determina o vencedor
-            winner_id = (
-                fight.fighter1_id
-                if fighter1_total_points > fighter2_total_points
-                else fight.fighter2_id
-            )
-
-            # Determina o tipo de resultado
-            result_types = self.simulation_service.predict_result_type(
-                fight.fighter1, fight.fighter2
-            )
-
-            rand = random.random() * 100  # nosec B311
-            if rand < result_types["ko"]:
-                result_type = "KO"
-                finish_round = random.randint(1, fight.rounds)  # nosec B311
-                finish_time = f"{random.randint(0, 4)}:{random.randint(10, 59):02d}"  # nosec B311
-            elif rand < result_types["ko"] + result_types["submission"]:
-                result_type = "Submission"
-                finish_round = random.randint(1, fight.rounds)  # nosec B311
-                finish_time = f"{random.randint(0, 4)}:{random.randint(10, 59):02d}"  # nosec B311
-            else:
-                result_type = "Decision"
-                finish_round = None
-                finish_time = None
-
-            # Atualiza a luta com o resultado
-            fight.winner_id = winner_id
-            fight.result_type = result_type
-            fight.finish_round = finish_round
-            fight.finish_time = finish_time
-            fight.fighter1_probability = prob1
-            fight.fighter2_probability = prob2
-            fight.simulation_details = {
-                "rounds": round_details,
-                "total_points": {
-                    "fighter1": round(fighter1_total_points, 2),
-                    "fighter2": round(fighter2_total_points, 2),
-                },
-            }
-            fight.status = "simulated"
-            fight.updated_at = datetime.now(timezone.utc)
-            fight.updated_by = self.user_email
+            self._simulate_fight(fight)
 
             simulated_fights.append(fight)
 
-        # Converte fights para response ANTES do commit (enquanto ainda estão na sessão)
-        import asyncio
-
-        fight_responses = await asyncio.gather(
-            *[self._fight_to_response(f) for f in simulated_fights]
-        )
-
-        # Atualiza o status do evento
-        event.status = "completed"
-        event.updated_at = datetime.now(timezone.utc)
-        event.updated_by = self.user_email
-
-        # Commit das alterações (sessão já obtida no início do método)
-        await session.commit()
+        # Converte fights para response ANTES do commit (enquanto ainda estão na sessão).
+        # Uma por vez: a AsyncSession não aceita operações concorrentes
+        fight_responses = [await self._fight_to_response(f) for f in simulated_fights]
 
-        # Gera estatísticas do evento
+        # Gera estatísticas do evento (o commit expira os atributos carregados)
         ko_count = sum(1 for f in simulated_fights if f.result_type == "KO")
         sub_count = sum(1 for f in simulated_fights if f.result_type == "Submission")
         dec_count = sum(1 for f in simulated_fights if f.result_type == "Decision")
@@ -249,14 +202,97 @@ class EventService:
                 (ko_count + sub_count) / len(simulated_fights) * 100, 2
             ),
         }
+        event_id, event_name = event.id, event.name
+
+        # Atualiza o status do evento
+        event.status = "completed"
+        event.updated_at = datetime.now(timezone.utc)
+        event.updated_by = self.user_email
+
+        # Commit das alterações (sessão já obtida no início do método)
+        await session.commit()
+        await response_cache.invalidate("events")
 
         return SimulationResult(
-            event_id=event.id,
-            event_name=event.name,
+            event_id=event_id,
+            event_name=event_name,
             simulated_fights=fight_responses,
             summary=summary,
         )
 
+    def _simulate_fight(self, fight: Fight) -> None:
+        """
+        Simula uma luta agendada e grava o resultado no próprio objeto
+
+        Não acessa o banco: fighter1 e fighter2 já devem estar carregados.
+        """
+        # Calcula probabilidades
+        prob1, prob2 = self.simulation_service.calculate_win_probability(
+            fight.fighter1, fight.fighter2
+        )
+
+        # Simula rounds (reusa a lógica do FightSimulationService)
+        round_details = []
+        fighter1_total_points = 0
+        fighter2_total_points = 0
+
+        for round_num in range(1, fight.rounds + 1):
+            round_result = self.simulation_service._simulate_round(
+                fight.fighter1, fight.fighter2, round_num
+            )
+            round_details.append(round_result)
+            fighter1_total_points += round_result["fighter1_points"]
+            fighter2_total_points += round_result["fighter2_points"]
+
+        # Determina o vencedor
+        winner_id = (
+            fight.fighter1_id
+            if fighter1_total_points > fighter2_total_points
+            else fight.fighter2_id
+        )
+
+        # Determina o tipo de resultado
+        result_types = self.simulation_service.predict_result_type(
+            fight.fighter1, fight.fighter2
+        )
+
+        rand = random.random() * 100  # nosec B311
+        if rand < result_types["ko"]:
+            result_type = "KO"
+            finish_round = random.randint(1, fight.rounds)  # nosec B311
+            finish_time = f"{random.randint(0, 4)}:{random.randint(10, 59):02d}"  # nosec B311
+        elif rand < result_types["ko"] + result_types["submission"]:
+            result_type = "Submission"
+            finish_round = random.randint(1, fight.rounds)  # nosec B311
+            finish_time = f"{random.randint(0, 4)}:{random.randint(10, 59):02d}"  # nosec B311
+        else:
+            result_type = "Decision"
+            finish_round = None
+            finish_time = None
+
+        # Atualiza a luta com o resultado
+        fight.winner_id = winner_id
+        fight.result_type = result_type
+        fight.finish_round = finish_round
+        fight.finish_time = finish_time
+        fight.fighter1_probability = prob1
+        fight.fighter2_probability = prob2
+        fight.simulation_details = encode_simulation_details(
+            {
+                "rounds": round_details,
+                "total_points": {
+                    "fighter1": round(fighter1_total_points, 2),
+                    "fighter2": round(fighter2_total_points, 2),
+                },
+            },
+            fight.fighter1.name,
+            fight.fighter2.name,
+        )
+        fight.status = "simulated"
+        SIMULATIONS.labels(result_type, "event").inc()
+        fight.updated_at = datetime.now(timezone.utc)
+        fight.updated_by = self.user_email
+
     async def _fight_to_response(self, fight: Fight) -> FightResponse:
         """Converte Fight para FightResponse"""
         from app.schemas.domain.events.output import FighterSummary
@@ -324,4 +360,6 @@ class EventService:
 
     async def delete_event(self, event_id: UUID) -> bool:
         """Deleta um evento (soft delete)"""
-        return await self.event_repo.delete(event_id)
+        deleted = await self.event_repo.delete(event_id)
+        await response_cache.invalidate("events")
+        return deleted
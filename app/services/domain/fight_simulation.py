@@ -1,17 +1,28 @@
 """Serviço para simulação de lutas entre lutadores"""
 
 import random
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
 from app.core.logger import logger
+from app.core.metrics import SIMULATIONS
+from app.core.response_cache import response_cache
+from app.core.tracing import traced_methods
+from app.core.single_flight import single_flight
 from app.database.models.base import Fighter, FightSimulation
+from app.database.models.counters import ALL_DIMENSION
+from app.database.models.simulation_details import (
+    encode_simulation_details,
+    render_simulation_details,
+)
 from app.database.repositories.fight_simulation import FightSimulationRepository
 from app.database.repositories.fighter import FighterRepository
 from app.exceptions.exceptions import ForbiddenError, NotFoundError
 from app.services.ml.prediction_service import ml_prediction_service
 
 
+@traced_methods(exclude=("_calculate_fighter_power", "_simulate_round"))
 class FightSimulationService:
     """Serviço para gerenciar e executar simulações de lutas"""
 
@@ -67,8 +78,12 @@ class FightSimulationService:
             # Converte para porcentagem
             prob1 = ml_prob * 100
             prob2 = (1 - ml_prob) * 100
-            logger.info(
-                f"🤖 Usando predição ML: {fighter1.name} {prob1:.2f}% vs {fighter2.name} {prob2:.2f}%"
+            logger.debug(
+                "🤖 Usando predição ML: %s %.2f%% vs %s %.2f%%",
+                fighter1.name,
+                prob1,
+                fighter2.name,
+                prob2,
             )
             return round(prob1, 2), round(prob2, 2)
 
@@ -319,20 +334,28 @@ class FightSimulationService:
             finish_round=finish_round,
             fighter1_probability=prob1,
             fighter2_probability=prob2,
-            simulation_details={
-                "rounds": round_details,
-                "total_points": {
-                    "fighter1": round(fighter1_total_points, 2),
-                    "fighter2": round(fighter2_total_points, 2),
+            simulation_details=encode_simulation_details(
+                {
+                    "rounds": round_details,
+                    "total_points": {
+                        "fighter1": round(fighter1_total_points, 2),
+                        "fighter2": round(fighter2_total_points, 2),
+                    },
                 },
-            },
+                fighter1.name,
+                fighter2.name,
+            ),
             notes=notes,
             created_by=created_by,
         )
 
         # Salva no banco
-        return await self.simulation_repo.create(simulation)
+        created = await self.simulation_repo.create(simulation)
+        SIMULATIONS.labels(result_type, "simulation").inc()
+        await response_cache.invalidate("simulations")
+        return created
 
+    @single_flight("simulations.predict_fight")
     async def predict_fight(self, fighter1_id: UUID, fighter2_id: UUID) -> dict:
         """
         Faz uma previsão de luta sem executar a simulação
@@ -405,8 +428,8 @@ class FightSimulationService:
             key_factors.append(f"QI de luta de {smart_fighter} pode fazer a diferença")
 
         return {
-            "fighter1_id": str(fighter1_id),
-            "fighter2_id": str(fighter2_id),
+            "fighter1_id": fighter1_id,
+            "fighter2_id": fighter2_id,
             "fighter1_name": fighter1.name,
             "fighter2_name": fighter2.name,
             "fighter1_win_probability": prob1,
@@ -422,6 +445,7 @@ class FightSimulationService:
             "key_factors": key_factors,
         }
 
+    @single_flight("simulations.compare_fighters")
     async def compare_fighters(self, fighter1_id: UUID, fighter2_id: UUID) -> dict:
         """
         Compara dois lutadores em detalhes
@@ -503,24 +527,28 @@ class FightSimulationService:
 
         return {
             "fighter1": {
-                "id": str(fighter1.id),
+                "id": fighter1.id,
                 "name": fighter1.name,
                 "record": f"{fighter1.wins}-{fighter1.losses}-{fighter1.draws}",
             },
             "fighter2": {
-                "id": str(fighter2.id),
+                "id": fighter2.id,
                 "name": fighter2.name,
                 "record": f"{fighter2.wins}-{fighter2.losses}-{fighter2.draws}",
             },
             "comparisons": comparisons,
         }
 
-    async def get_simulation_with_details(self, simulation: FightSimulation) -> dict:
+    async def get_simulation_with_details(
+        self, simulation: FightSimulation, include_details: bool = True
+    ) -> dict:
         """
         Retorna uma simulação com todos os detalhes formatados incluindo nomes dos lutadores.
 
         Args:
             simulation: Objeto FightSimulation
+            include_details: Se True, reconstrói os detalhes round a round a
+                partir do formato compacto armazenado
 
         Returns:
             Dict com simulação formatada
@@ -529,22 +557,28 @@ class FightSimulationService:
         fighter2 = await self.fighter_repo.get_by_id(simulation.fighter2_id)
         winner = fighter1 if simulation.winner_id == fighter1.id else fighter2
 
+        simulation_details = None
+        if include_details:
+            simulation_details = render_simulation_details(
+                simulation.simulation_details, fighter1.name, fighter2.name
+            )
+
         return {
-            "id": str(simulation.id),
-            "fighter1_id": str(simulation.fighter1_id),
-            "fighter2_id": str(simulation.fighter2_id),
+            "id": simulation.id,
+            "fighter1_id": simulation.fighter1_id,
+            "fighter2_id": simulation.fighter2_id,
             "fighter1_name": fighter1.name,
             "fighter2_name": fighter2.name,
-            "winner_id": str(simulation.winner_id),
+            "winner_id": simulation.winner_id,
             "winner_name": winner.name,
             "result_type": simulation.result_type,
             "rounds": simulation.rounds,
             "finish_round": simulation.finish_round,
             "fighter1_probability": simulation.fighter1_probability,
             "fighter2_probability": simulation.fighter2_probability,
-            "simulation_details": simulation.simulation_details,
+            "simulation_details": simulation_details,
             "notes": simulation.notes,
-            "created_at": simulation.created_at.isoformat(),
+            "created_at": simulation.created_at,
         }
 
     async def get_fighter_history(
@@ -577,19 +611,19 @@ class FightSimulationService:
 
             fights.append(
                 {
-                    "id": str(sim.id),
+                    "id": sim.id,
                     "fighter1_name": f1.name,
                     "fighter2_name": f2.name,
                     "winner_name": winner.name,
                     "result_type": sim.result_type,
                     "rounds": sim.rounds,
                     "finish_round": sim.finish_round,
-                    "created_at": sim.created_at.isoformat(),
+                    "created_at": sim.created_at,
                 }
             )
 
         return {
-            "fighter_id": str(fighter_id),
+            "fighter_id": fighter_id,
             "fighter_name": fighter.name,
             "statistics": stats,
             "recent_fights": fights,
@@ -621,7 +655,7 @@ class FightSimulationService:
 
             results.append(
                 {
-                    "id": str(sim.id),
+                    "id": sim.id,
                     "fighter1_name": f1.name,
                     "fighter2_name": f2.name,
                     "winner_name": winner.name,
@@ -630,7 +664,7 @@ class FightSimulationService:
                     "finish_round": sim.finish_round,
                     "fighter1_probability": sim.fighter1_probability,
                     "fighter2_probability": sim.fighter2_probability,
-                    "created_at": sim.created_at.isoformat(),
+                    "created_at": sim.created_at,
                 }
             )
 
@@ -656,27 +690,36 @@ class FightSimulationService:
 
             results.append(
                 {
-                    "id": str(sim.id),
+                    "id": sim.id,
                     "fighter1_name": f1.name,
                     "fighter2_name": f2.name,
                     "winner_name": winner.name,
                     "result_type": sim.result_type,
                     "rounds": sim.rounds,
                     "finish_round": sim.finish_round,
-                    "created_at": sim.created_at.isoformat(),
+                    "created_at": sim.created_at,
                 }
             )
 
         return results
 
-    async def get_simulation_stats(self) -> dict:
+    async def get_simulation_stats_version(self) -> tuple[int, Optional[datetime]]:
+        """Versão das estatísticas (contador de simulações) para GET condicional"""
+        return await self.simulation_repo.get_table_version(dimension=ALL_DIMENSION)
+
+    @single_flight("simulations.get_simulation_stats")
+    async def get_simulation_stats(self, exact: bool = False) -> dict:
         """
         Retorna estatísticas gerais sobre simulações.
 
+        Args:
+            exact: Se True, conta as simulações com COUNT(*) em vez de usar o
+                contador mantido pelo banco
+
         Returns:
             Dict com total de simulações
         """
-        total = await self.simulation_repo.get_total_count()
+        total = await self.simulation_repo.get_total_count(exact=exact)
         return {
             "total_simulations": total,
         }
@@ -1,16 +1,26 @@
 """Serviço de domínio para gerenciar lutadores"""
 
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
+from app.core.response_cache import response_cache
 from app.database.models.base import Fighter
 from app.database.repositories.fighter import FighterRepository
 from app.exceptions.exceptions import ForbiddenError, NotFoundError
+from app.services.domain.fighter_index import fighter_prefix_index
 from app.schemas.domain.fighters.input import (
     FighterCreateInput,
     FighterSearchInput,
     FighterUpdateInput,
 )
+from app.schemas.domain.fighters.output import (
+    FIGHTER_LIST_FIELDS,
+    CartelFightOutput,
+    FighterCartelOutput,
+    fighter_columns,
+    project_fighter,
+)
 
 
 def _estimate_ml_stats_from_attributes(
@@ -152,7 +162,10 @@ class FighterService:
             created_by=created_by,
         )
 
-        return await self.fighter_repo.create(fighter)
+        created = await self.fighter_repo.create(fighter)
+        fighter_prefix_index.upsert(created)
+        await response_cache.invalidate("fighters")
+        return created
 
     async def get_fighter(self, fighter_id: UUID) -> Fighter:
         """Busca um lutador por ID"""
@@ -161,6 +174,65 @@ class FighterService:
             raise NotFoundError("Fighter not found")
         return fighter
 
+    async def get_fighter_version(self, fighter_id: UUID) -> tuple[int, datetime]:
+        """
+        Versão de um lutador para GET condicional (ETag/Last-Modified)
+
+        Combina o updated_at do registro com a versão da tabela, que também
+        muda em escritas que não atualizam updated_at (ex: importações).
+        """
+        updated_at = await self.fighter_repo.get_row_version(fighter_id)
+        if updated_at is None:
+            raise NotFoundError("Fighter not found")
+        version, modified_at = await self.fighter_repo.get_table_version()
+        return version, max(filter(None, (updated_at, modified_at)))
+
+    async def get_fighter_cartel_version(
+        self, fighter_id: UUID
+    ) -> tuple[int, datetime]:
+        """Versão do cartel: o lutador e as tabelas de onde a view lê"""
+        updated_at = await self.fighter_repo.get_row_version(fighter_id)
+        if updated_at is None:
+            raise NotFoundError("Fighter not found")
+        version, modified_at = await self.fighter_repo.get_table_version(
+            "fighters", "events", "fights"
+        )
+        return version, max(filter(None, (updated_at, modified_at)))
+
+    async def get_fighter_cartel(
+        self, fighter_id: UUID, limit: int = 20, offset: int = 0
+    ) -> FighterCartelOutput:
+        """
+        Cartel paginado do lutador
+
+        Lê da view fighter_fight_history (fights + events); lutadores sem
+        lutas importadas usam o JSONB legado, fatiado no banco. As duas
+        fontes saem no formato de CartelFightOutput.
+        """
+        fights, total = await self.fighter_repo.get_fight_history(
+            fighter_id, limit=limit, offset=offset
+        )
+        if total:
+            # Chaves da view -> chaves do cartel
+            for fight in fights:
+                fight["opponent"] = fight.pop("opponent_name")
+                fight["date"] = fight.pop("event_date")
+        else:
+            fights, total = await self.fighter_repo.get_legacy_cartel(
+                fighter_id, limit=limit, offset=offset
+            )
+        return FighterCartelOutput(
+            fighter_id=fighter_id,
+            fights=[CartelFightOutput.model_validate(fight) for fight in fights],
+            total=total,
+            limit=limit,
+            offset=offset,
+        )
+
+    async def get_fighters_version(self) -> tuple[int, Optional[datetime]]:
+        """Versão da tabela de lutadores (listagens, rankings e estatísticas)"""
+        return await self.fighter_repo.get_table_version()
+
     async def update_fighter(
         self, fighter_id: UUID, data: FighterUpdateInput, updated_by: str = "system"
     ) -> Fighter:
@@ -241,6 +313,8 @@ class FighterService:
         if not updated:
             raise NotFoundError("Fighter not found")
 
+        fighter_prefix_index.upsert(updated)
+        await response_cache.invalidate("fighters")
         return updated
 
     async def delete_fighter(
@@ -250,11 +324,17 @@ class FighterService:
         success = await self.fighter_repo.delete(fighter_id, deleted_by)
         if not success:
             raise NotFoundError("Fighter not found")
+        fighter_prefix_index.remove(fighter_id)
+        await response_cache.invalidate("fighters")
         return success
 
-    async def search_fighters(self, search_params: FighterSearchInput) -> list[Fighter]:
-        """Busca lutadores com filtros"""
-        return await self.fighter_repo.search_fighters(
+    async def search_fighters(
+        self,
+        search_params: FighterSearchInput,
+        fields: tuple[str, ...] = FIGHTER_LIST_FIELDS,
+    ) -> list[dict]:
+        """Busca lutadores com filtros, projetando apenas os campos pedidos"""
+        fighters = await self.fighter_repo.search_fighters(
             name=search_params.name,
             last_organization_fight=search_params.last_organization_fight,
             actual_weight_class=search_params.actual_weight_class,
@@ -263,10 +343,32 @@ class FighterService:
             min_overall=search_params.min_overall,
             limit=search_params.limit,
             offset=search_params.offset,
+            columns=fighter_columns(fields),
         )
-
-    async def get_total_fighters(self, search_params: FighterSearchInput) -> int:
-        """Retorna o total de lutadores que correspondem aos filtros"""
+        return [project_fighter(fighter, fields) for fighter in fighters]
+
+    async def autocomplete_fighters(self, term: str, limit: int = 10) -> list:
+        """
+        Sugestões de lutadores por nome/apelido
+
+        Prefixos conhecidos são atendidos pelo índice em memória, sem acesso
+        ao banco. Sem correspondência (ex: erro de digitação) ou com o índice
+        ainda não carregado, usa a busca por similaridade no banco.
+        """
+        if fighter_prefix_index.is_ready:
+            suggestions = fighter_prefix_index.complete(term, limit)
+            if suggestions:
+                return suggestions
+        return await self.fighter_repo.autocomplete(term=term.strip(), limit=limit)
+
+    async def get_total_fighters(
+        self, search_params: FighterSearchInput, exact: bool = False
+    ) -> int:
+        """
+        Retorna o total de lutadores que correspondem aos filtros
+
+        Combinações de filtros retornam uma estimativa, exceto com `exact=True`
+        """
         return await self.fighter_repo.count_fighters(
             name=search_params.name,
             last_organization_fight=search_params.last_organization_fight,
@@ -274,6 +376,7 @@ class FighterService:
             fighting_style=search_params.fighting_style,
             is_real=search_params.is_real,
             min_overall=search_params.min_overall,
+            exact=exact,
         )
 
     async def get_top_fighters(
@@ -281,22 +384,33 @@ class FighterService:
         last_organization_fight: Optional[str] = None,
         actual_weight_class: Optional[str] = None,
         limit: int = 10,
-    ) -> list[Fighter]:
+        fields: tuple[str, ...] = FIGHTER_LIST_FIELDS,
+    ) -> list[dict]:
         """Retorna os melhores lutadores"""
-        return await self.fighter_repo.get_top_fighters(
+        fighters = await self.fighter_repo.get_top_fighters(
             last_organization_fight=last_organization_fight,
             actual_weight_class=actual_weight_class,
             limit=limit,
+            columns=fighter_columns(fields),
         )
+        return [project_fighter(fighter, fields) for fighter in fighters]
 
-    async def get_fighter_stats(self) -> dict:
+    async def get_fighter_stats(self, exact: bool = False) -> dict:
         """Retorna estatísticas gerais sobre lutadores"""
-        return await self.fighter_repo.get_stats()
+        return await self.fighter_repo.get_stats(exact=exact)
 
     async def get_fighters_by_creator(
-        self, creator_id: UUID, limit: int = 50, offset: int = 0
-    ) -> list[Fighter]:
+        self,
+        creator_id: UUID,
+        limit: int = 50,
+        offset: int = 0,
+        fields: tuple[str, ...] = FIGHTER_LIST_FIELDS,
+    ) -> list[dict]:
         """Retorna lutadores criados por um usuário"""
-        return await self.fighter_repo.get_fighters_by_creator(
-            creator_id=creator_id, limit=limit, offset=offset
+        fighters = await self.fighter_repo.get_fighters_by_creator(
+            creator_id=creator_id,
+            limit=limit,
+            offset=offset,
+            columns=fighter_columns(fields),
         )
+        return [project_fighter(fighter, fields) for fighter in fighters]
@@ -0,0 +1,212 @@
+"""Índice em memória para o autocomplete de lutadores"""
+
+import asyncio
+import heapq
+import sys
+import unicodedata
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+from app.core.logger import logger
+from app.database.repositories.fighter import FighterRepository
+from app.database.unit_of_work import UnitOfWorkConnection
+
+
+class FighterSuggestion(NamedTuple):
+    """Lutador como exposto nas sugestões do autocomplete"""
+
+    id: UUID
+    name: str
+    nickname: Optional[str]
+    last_organization_fight: Optional[str]
+    actual_weight_class: Optional[str]
+    weight: float
+
+
+def normalize(text: str) -> str:
+    """Minúsculas, sem acentos e com espaços colapsados"""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.lower().split())
+
+
+def popularity(fighter) -> float:
+    """
+    Peso do lutador nas sugestões
+
+    Lutas no cartel (proxy de popularidade) com o overall como desempate.
+    """
+    fights = (fighter.wins or 0) + (fighter.losses or 0) + (fighter.draws or 0)
+    overall = (
+        (fighter.striking or 0)
+        + (fighter.grappling or 0)
+        + (fighter.defense or 0)
+        + (fighter.stamina or 0)
+        + (fighter.speed or 0)
+        + (fighter.strategy or 0)
+    ) / 6
+    return fights + overall / 100
+
+
+class FighterPrefixIndex:
+    """
+    Autocomplete de lutadores sem acesso ao banco
+
+    Mantém um array ordenado de chaves normalizadas (nome completo, apelido e
+    cada palavra do nome) apontando para os lutadores. Uma busca é um
+    `bisect` até o início do prefixo seguido de um `heapq.nlargest` pelo peso
+    de popularidade entre as chaves que compartilham o prefixo.
+
+    Escritas (`upsert`/`remove`) movem só as chaves do lutador alterado para a
+    posição certa via `bisect`, sem reordenar o array no caminho da consulta.
+    Em ambientes com vários workers o índice também é reconstruído
+    periodicamente a partir do banco.
+    """
+
+    def __init__(self):
+        self._fighters: dict[UUID, FighterSuggestion] = {}
+        self._keys: list[str] = []
+        self._refs: list[UUID] = []
+        self.built_at: Optional[datetime] = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self.built_at is not None
+
+    def load(self, fighters) -> None:
+        """Substitui o conteúdo do índice pelos lutadores informados"""
+        self._fighters = {
+            fighter.id: self._to_suggestion(fighter) for fighter in fighters
+        }
+        self._rebuild()
+        self.built_at = datetime.now(timezone.utc)
+        logger.info(
+            f"Índice de autocomplete carregado: {len(self._fighters)} lutadores, "
+            f"{len(self._keys)} chaves"
+        )
+
+    def upsert(self, fighter) -> None:
+        """Inclui ou atualiza um lutador (hook de escrita)"""
+        suggestion = self._to_suggestion(fighter)
+        previous = self._fighters.get(fighter.id)
+        old_keys = self._index_keys(previous) if previous else set()
+        new_keys = self._index_keys(suggestion)
+        self._fighters[fighter.id] = suggestion
+        for key in old_keys - new_keys:
+            self._remove_key(key, fighter.id)
+        for key in new_keys - old_keys:
+            self._insert_key(key, fighter.id)
+
+    def remove(self, fighter_id: UUID) -> None:
+        """Remove um lutador (hook de exclusão)"""
+        suggestion = self._fighters.pop(fighter_id, None)
+        if suggestion is not None:
+            for key in self._index_keys(suggestion):
+                self._remove_key(key, fighter_id)
+
+    def complete(self, term: str, limit: int = 10) -> list[FighterSuggestion]:
+        """Retorna até `limit` lutadores cujo nome/apelido começa com o termo"""
+        prefix = normalize(term)
+        if not prefix:
+            return []
+
+        matches: dict[UUID, FighterSuggestion] = {}
+        position = bisect_left(self._keys, prefix)
+        while position < len(self._keys) and self._keys[position].startswith(prefix):
+            fighter_id = self._refs[position]
+            matches[fighter_id] = self._fighters[fighter_id]
+            position += 1
+
+        return heapq.nlargest(
+            limit, matches.values(), key=lambda suggestion: suggestion.weight
+        )
+
+    def stats(self) -> dict:
+        """Tamanho e consumo de memória aproximado do índice"""
+        memory = (
+            sys.getsizeof(self._keys)
+            + sys.getsizeof(self._refs)
+            + sys.getsizeof(self._fighters)
+            + sum(sys.getsizeof(key) for key in self._keys)
+            + sum(
+                sys.getsizeof(suggestion)
+                + sys.getsizeof(suggestion.id)
+                + sum(sys.getsizeof(value) for value in suggestion[1:5] if value)
+                for suggestion in self._fighters.values()
+            )
+        )
+        return {
+            "ready": self.is_ready,
+            "fighters": len(self._fighters),
+            "keys": len(self._keys),
+            "memory_bytes": memory,
+            "built_at": self.built_at,
+        }
+
+    @staticmethod
+    def _to_suggestion(fighter) -> FighterSuggestion:
+        return FighterSuggestion(
+            id=fighter.id,
+            name=fighter.name,
+            nickname=fighter.nickname,
+            last_organization_fight=fighter.last_organization_fight,
+            actual_weight_class=fighter.actual_weight_class,
+            weight=popularity(fighter),
+        )
+
+    @staticmethod
+    def _index_keys(suggestion: FighterSuggestion) -> set[str]:
+        name = normalize(suggestion.name)
+        nickname = normalize(suggestion.nickname)
+        keys = {name, *name.split()}
+        if nickname:
+            keys.add(nickname)
+        keys.discard("")
+        return keys
+
+    def _rebuild(self) -> None:
+        pairs = sorted(
+            (key, fighter_id)
+            for fighter_id, suggestion in self._fighters.items()
+            for key in self._index_keys(suggestion)
+        )
+        self._keys = [key for key, _ in pairs]
+        self._refs = [fighter_id for _, fighter_id in pairs]
+
+    def _insert_key(self, key: str, fighter_id: UUID) -> None:
+        position = bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self._refs.insert(position, fighter_id)
+
+    def _remove_key(self, key: str, fighter_id: UUID) -> None:
+        position = bisect_left(self._keys, key)
+        while position < len(self._keys) and self._keys[position] == key:
+            if self._refs[position] == fighter_id:
+                del self._keys[position]
+                del self._refs[position]
+                return
+            position += 1
+
+
+# Singleton instance
+fighter_prefix_index = FighterPrefixIndex()
+
+
+async def load_fighter_index() -> None:
+    """(Re)constrói o índice de autocomplete a partir do banco"""
+    try:
+        async with UnitOfWorkConnection() as uow:
+            entries = await FighterRepository(uow).get_index_entries()
+        fighter_prefix_index.load(entries)
+    except Exception as e:
+        # Sem índice o autocomplete continua funcionando via banco
+        logger.error(f"Erro ao carregar índice de autocomplete: {e}")
+
+
+async def refresh_fighter_index_periodically(interval_seconds: int) -> None:
+    """Reconstrói o índice a cada intervalo (escritas de outros workers/scripts)"""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        await load_fighter_index()
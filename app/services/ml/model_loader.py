@@ -1,18 +1,23 @@
-"""ML Model Loader - Carrega modelo de predição do GCS"""
+"""ML Model Loader - Carrega modelo de predição do GCS (ou de arquivo local)"""
 
 import os
 
-import gcsfs
-import joblib
-
 from app.core.logger import logger
+from app.core.settings import get_settings
+
+settings = get_settings()
 
 
 class MLModelLoader:
-    """Carregador do modelo de ML"""
+    """
+    Carregador do modelo de ML
+
+    joblib e gcsfs (que traz aiohttp/fsspec) só são importados ao carregar o
+    modelo, e gcsfs só quando ML_MODEL_PATH é gs://.
+    """
 
     _model = None
-    _model_path = "gs://modelo-mma-fightbase/mma_model_v1.joblib"
+    _model_path = settings.ML_MODEL_PATH
 
     @classmethod
     def load_model(cls, force_reload=False):
@@ -21,8 +26,17 @@ class MLModelLoader:
             return cls._model
 
         try:
+            import joblib
+
             logger.info(f"🤖 Carregando modelo ML de {cls._model_path}")
 
+            if not cls._model_path.startswith("gs://"):
+                cls._model = joblib.load(cls._model_path)
+                logger.info("✅ Modelo ML carregado com sucesso!")
+                return cls._model
+
+            import gcsfs
+
             # Autenticação GCS
             credentials_path = os.getenv("GCP_CREDENTIALS_PATH", "service_account.json")
 
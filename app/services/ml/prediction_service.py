@@ -1,13 +1,25 @@
 """ML Prediction Service - Predição de lutas usando modelo treinado"""
 
-from typing import Optional
+from time import perf_counter
+from typing import TYPE_CHECKING, Optional
 
-import pandas as pd
+from opentelemetry import trace
 
 from app.core.logger import logger
+from app.core.metrics import ML_BATCH_SIZE, ML_INFERENCE_LATENCY
+from app.core.tracing import traced
 from app.database.models.base import Fighter
 from app.services.ml.model_loader import ml_model_loader
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@traced("ml.predict_proba")
+def _predict_proba(model, X: "pd.DataFrame"):
+    trace.get_current_span().set_attribute("ml.batch_size", len(X))
+    return model.predict_proba(X)
+
 
 class MLPredictionService:
     """Serviço de predição usando modelo ML"""
@@ -85,29 +97,38 @@ class MLPredictionService:
                 fighter1, fighter2
             )
 
-            # Criar DataFrame com features na ordem correta
+            # Criar DataFrame com features na ordem correta (pandas só aqui:
+            # é caro de importar e só a inferência precisa dele)
+            import pandas as pd
+
             X = pd.DataFrame([features_dict], columns=MLPredictionService.FEATURES)
 
-            logger.info(f"📊 Features enviadas: {list(X.columns)}")
-            if hasattr(model, "feature_names_in_"):
-                logger.info(
-                    f"📊 Features esperadas pelo modelo: {list(model.feature_names_in_)}"
-                )
+            logger.debug("📊 Features enviadas: %s", MLPredictionService.FEATURES)
+            logger.debug(
+                "📊 Features esperadas pelo modelo: %s",
+                getattr(model, "feature_names_in_", None),
+            )
 
             # Predição (retorna [prob_classe_0, prob_classe_1])
             # Assumindo que classe 1 = fighter1 vence
-            probabilities = model.predict_proba(X)[0]
+            start = perf_counter()
+            probabilities = _predict_proba(model, X)[0]
+            ML_INFERENCE_LATENCY.observe(perf_counter() - start)
+            ML_BATCH_SIZE.observe(len(X))
             fighter1_win_prob = probabilities[1]
 
             logger.info(
-                f"🤖 ML Prediction: {fighter1.name} vs {fighter2.name} = "
-                f"{fighter1_win_prob:.2%} chance de {fighter1.name} vencer"
+                "🤖 ML Prediction: %s vs %s = %.2f%% chance de %s vencer",
+                fighter1.name,
+                fighter2.name,
+                fighter1_win_prob * 100,
+                fighter1.name,
             )
 
             return float(fighter1_win_prob)
 
         except Exception as e:
-            logger.error(f"❌ Erro na predição ML: {e}")
+            logger.error("❌ Erro na predição ML: %s", e)
             return None
 
 
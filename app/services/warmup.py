@@ -0,0 +1,152 @@
+"""
+Warm-up do worker antes de receber tráfego (readiness em /api/readyz)
+
+Roda em background a partir do lifespan; enquanto isso /api/readyz responde
+503 (o /api/healthcheck continua 200), então o load balancer só manda
+requisições para workers aquecidos. Etapas, em paralelo:
+
+    model           carrega o modelo e roda um predict_proba em lote
+                    (WARMUP_PREDICTION_BATCH linhas; 0 = só carrega)
+    db_pool         abre WARMUP_DB_CONNECTIONS conexões do pool (0 = pula)
+    fighter_index   índice de autocomplete em memória
+
+Em seguida, com banco e modelo quentes, `response_cache` faz GETs internos
+nas rotas cacheadas e públicas: estatísticas e top lutadores (geral e por
+categoria de peso) (WARMUP_PRIME_CACHE). Falhas só são logadas; passado
+WARMUP_TIMEOUT_SECONDS o worker fica pronto mesmo assim.
+"""
+
+import asyncio
+from time import perf_counter
+from typing import Any, Awaitable
+
+import httpx
+
+from app.core.logger import logger
+from app.core.settings import get_settings
+from app.database.unit_of_work import warm_up_pool
+from app.services.domain.fighter_index import load_fighter_index
+from app.services.ml.model_loader import ml_model_loader
+from app.services.ml.prediction_service import MLPredictionService
+
+settings = get_settings()
+
+WARMUP_USER_AGENT = "fightbase-warmup"
+
+
+class Readiness:
+    """Estado do warm-up deste worker"""
+
+    def __init__(self) -> None:
+        self.ready = False
+        self.duration: float | None = None
+        self.steps: dict[str, dict[str, Any]] = {}
+
+    def mark_ready(self, duration: float) -> None:
+        self.ready = True
+        self.duration = round(duration, 3)
+
+    def mark_not_ready(self) -> None:
+        self.ready = False
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "status": "ready" if self.ready else "warming_up",
+            "ready": self.ready,
+            "warm_up_seconds": self.duration,
+            "steps": self.steps,
+        }
+
+
+readiness = Readiness()
+
+
+async def _step(name: str, work: Awaitable) -> None:
+    started = perf_counter()
+    try:
+        result = await work
+        readiness.steps[name] = {"status": "ok", "result": result}
+    except Exception as e:
+        readiness.steps[name] = {"status": "error", "error": str(e)}
+        logger.warning("Warm-up %s falhou: %s", name, e)
+    readiness.steps[name]["seconds"] = round(perf_counter() - started, 3)
+
+
+def _warm_model(batch: int) -> int:
+    """Carrega o modelo e faz uma predição em lote; retorna as linhas preditas"""
+    model = ml_model_loader.load_model()
+    if model is None or batch <= 0:
+        return 0
+    import pandas as pd
+
+    features = MLPredictionService.FEATURES
+    X = pd.DataFrame([[0.0] * len(features)] * batch, columns=features)
+    model.predict_proba(X)
+    return batch
+
+
+async def _warm_pool() -> int:
+    if settings.WARMUP_DB_CONNECTIONS <= 0:
+        return 0
+    return await warm_up_pool(settings.WARMUP_DB_CONNECTIONS)
+
+
+async def _prime_response_cache(app) -> int:
+    """
+    GETs internos (anônimos) nas rotas cacheadas; retorna as respostas 200
+
+    Rotas autenticadas (ex: eventos) ficam de fora: a chave do cache inclui
+    a role do token.
+    """
+    if not (settings.WARMUP_PRIME_CACHE and settings.RESPONSE_CACHE_ENABLED):
+        return 0
+
+    primed = 0
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://warmup",
+        headers={"user-agent": WARMUP_USER_AGENT},
+    ) as client:
+
+        async def get(path: str, **params) -> httpx.Response:
+            nonlocal primed
+            response = await client.get(path, params=params)
+            primed += response.status_code == 200
+            return response
+
+        stats = await get("/api/v1/fighters/statistics/overview")
+        weight_classes = (
+            stats.json().get("weight_classes", {}) if stats.status_code == 200 else {}
+        )
+        await get("/api/v1/simulations/statistics/overview")
+        await get("/api/v1/fighters/rankings/top")
+        for weight_class in weight_classes:
+            await get("/api/v1/fighters/rankings/top", actual_weight_class=weight_class)
+    return primed
+
+
+async def _run_steps(app) -> None:
+    await asyncio.gather(
+        _step(
+            "model",
+            asyncio.to_thread(_warm_model, settings.WARMUP_PREDICTION_BATCH),
+        ),
+        _step("db_pool", _warm_pool()),
+        _step("fighter_index", load_fighter_index()),
+    )
+    await _step("response_cache", _prime_response_cache(app))
+
+
+async def run_warm_up(app) -> None:
+    """Executa o warm-up e marca o worker como pronto"""
+    started = perf_counter()
+    try:
+        await asyncio.wait_for(_run_steps(app), settings.WARMUP_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        logger.warning(
+            "Warm-up passou de %ss; worker pronto sem concluir",
+            settings.WARMUP_TIMEOUT_SECONDS,
+        )
+    readiness.mark_ready(perf_counter() - started)
+    logger.info("Worker pronto: warm-up em %.2fs", readiness.duration)
@@ -105,10 +105,20 @@ class APIClient {
         return this.request(`/fighters/${query ? "?" + query : ""}`);
     }
 
+    async autocompleteFighters(q, limit = 10) {
+        const query = new URLSearchParams({ q, limit }).toString();
+        return this.request(`/fighters/autocomplete?${query}`);
+    }
+
     async getFighter(id) {
         return this.request(`/fighters/${id}`);
     }
 
+    async getFighterCartel(id, limit = 50, offset = 0) {
+        const query = new URLSearchParams({ limit, offset }).toString();
+        return this.request(`/fighters/${id}/cartel?${query}`);
+    }
+
     async getFighterById(id) {
         return this.getFighter(id);
     }
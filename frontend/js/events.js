@@ -1114,10 +1114,7 @@ function setupFighterSearchForFight(fightIndex) {
 
             searchTimeout = setTimeout(async () => {
                 try {
-                    const response = await api.getFighters({
-                        name: query,
-                        limit: 5,
-                    });
+                    const response = await api.autocompleteFighters(query, 5);
 
                     console.log("Response from API:", response);
 
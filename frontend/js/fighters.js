@@ -248,8 +248,12 @@ async function showFighterDetails(id) {
         const content = document.getElementById("fighterDetailsPageContent");
         content.innerHTML = '<div class="loading">Carregando detalhes...</div>';
 
-        // Fetch fighter data
-        const fighter = await api.getFighter(id);
+        // Fetch fighter data (cartel vem paginado de endpoint próprio)
+        const [fighter, cartel] = await Promise.all([
+            api.getFighter(id),
+            api.getFighterCartel(id),
+        ]);
+        const fights = cartel.fights;
 
         // Build details HTML for dedicated page
         content.innerHTML = `
@@ -509,8 +513,8 @@ async function showFighterDetails(id) {
                         <h3>🥊 Cartel de Lutas</h3>
                         <div class="cartel-list">
                             ${
-                                fighter.cartel && fighter.cartel.length > 0
-                                    ? fighter.cartel
+                                fights.length > 0
+                                    ? fights
                                           .map((fight) => {
                                               // Normaliza o resultado (pode vir como "W", "L", "D" ou maiúsculo)
                                               const result = (
@@ -549,7 +553,19 @@ async function showFighterDetails(id) {
                                             }
                                             ${
                                                 fight.date
-                                                    ? `<span class="cartel-date">${fight.date}</span>`
+                                                    ? `<span class="cartel-date">${
+                                                          fight.fight_id
+                                                              ? new Date(
+                                                                    fight.date
+                                                                ).toLocaleDateString(
+                                                                    "pt-BR",
+                                                                    {
+                                                                        timeZone:
+                                                                            "UTC",
+                                                                    }
+                                                                )
+                                                              : fight.date
+                                                      }</span>`
                                                     : ""
                                             }
                                         </div>
@@ -576,13 +592,13 @@ async function showFighterDetails(id) {
                                                     : ""
                                             }
                                             ${
-                                                fight.time
-                                                    ? ` • ${fight.time}`
+                                                fight.finish_time
+                                                    ? ` • ${fight.finish_time}`
                                                     : ""
                                             }
                                             ${
-                                                fight.event
-                                                    ? `<br>${fight.event}`
+                                                fight.event_name
+                                                    ? `<br>${fight.event_name}`
                                                     : ""
                                             }
                                         </div>
@@ -747,7 +763,11 @@ function setupFightersListeners() {
     // Search filters
     const searchName = document.getElementById("searchName");
     if (searchName) {
-        searchName.addEventListener("keyup", searchFighters);
+        let searchTimeout;
+        searchName.addEventListener("input", () => {
+            clearTimeout(searchTimeout);
+            searchTimeout = setTimeout(searchFighters, 300);
+        });
     }
 
     const filterOrg = document.getElementById("filterOrg");
@@ -111,12 +111,9 @@ function debounceSearch(query, resultsId, fighterNum) {
 // Search fighters for simulation
 async function searchFightersForSimulation(query, resultsId, fighterNum) {
     try {
-        const response = await api.getFighters({
-            name: query,
-            limit: 10,
-        });
+        const fighters = await api.autocompleteFighters(query, 10);
 
-        displaySearchResults(response.fighters, resultsId, fighterNum);
+        displaySearchResults(fighters, resultsId, fighterNum);
     } catch (error) {
         console.error("Error searching fighters:", error);
         const resultsContainer = document.getElementById(resultsId);
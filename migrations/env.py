@@ -26,9 +26,18 @@ from app.database.models.base import (  # noqa
     User,
 )
 
+from app.database.partitions import DEFAULT_PARTITION, PARTITION_PREFIX  # noqa
+
 target_metadata = Base.metadata
 
 
+def include_name(name, type_, parent_names) -> bool:
+    """Ignora as partições de fight_simulations no autogenerate"""
+    if type_ == "table" and name:
+        return not (name == DEFAULT_PARTITION or name.startswith(PARTITION_PREFIX))
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -51,6 +60,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -60,7 +70,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_name=include_name,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -93,7 +107,11 @@ def run_migrations_online() -> None:
     """
     connectable = create_engine(settings.DATABASE_URL_SYNC)
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_name=include_name,
+        )
         with context.begin_transaction():
             context.run_migrations()
 
@@ -0,0 +1,218 @@
+"""compact_simulation_details
+
+Converte `simulation_details` de fight_simulations e fights para o formato
+compacto, em lotes. Os conversores estão copiados aqui como eram nesta
+revisão, para que mudanças no formato do app não alterem esta migração.
+
+Revision ID: 8c1f2a4b7d31
+Revises: 5498edf5c956
+Create Date: 2026-10-19 09:12:41.220517
+
+"""
+
+import json
+from typing import Any, Callable, Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "8c1f2a4b7d31"
+down_revision: Union[str, None] = "5498edf5c956"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Conversores do formato compacto (versão 2), congelados nesta revisão
+COMPACT_VERSION = 2
+POINTS_SCALE = 100
+
+# Códigos de eventos gerados por FightSimulationService._simulate_round
+EVENT_DOMINATED = 1
+EVENT_TAKEDOWN = 2
+EVENT_SIGNIFICANT_STRIKES = 3
+EVENT_SUBMISSION_ATTEMPT = 4
+
+EVENT_TEMPLATES = {
+    EVENT_DOMINATED: "{name} dominou o round",
+    EVENT_TAKEDOWN: "{name} conseguiu um takedown",
+    EVENT_SIGNIFICANT_STRIKES: "{name} acertou golpes significativos",
+    EVENT_SUBMISSION_ATTEMPT: "{name} tentou uma finalização",
+}
+
+# Sufixos usados para reconhecer os eventos legados (texto após o nome)
+_EVENT_SUFFIXES = {
+    template.replace("{name}", ""): code for code, template in EVENT_TEMPLATES.items()
+}
+
+
+def is_compact(details: Optional[dict]) -> bool:
+    """Indica se o dict já está no formato compacto"""
+    return bool(details) and details.get("v") == COMPACT_VERSION
+
+
+def _scale(points: Optional[float]) -> int:
+    return int(round((points or 0) * POINTS_SCALE))
+
+
+def _unscale(value: int) -> float:
+    return round(value / POINTS_SCALE, 2)
+
+
+def _encode_event(event: str, dominant: str) -> Any:
+    if event.startswith(dominant):
+        code = _EVENT_SUFFIXES.get(event[len(dominant) :])
+        if code is not None:
+            return code
+    return event
+
+
+def encode_simulation_details(
+    details: Optional[dict], fighter1_name: str, fighter2_name: str
+) -> Optional[dict]:
+    """
+    Converte `simulation_details` do formato legível para o compacto
+
+    Args:
+        details: Dict no formato {"rounds": [...], "total_points": {...}}
+        fighter1_name: Nome do fighter1 da luta
+        fighter2_name: Nome do fighter2 da luta
+
+    Returns:
+        Dict compacto (ou o próprio valor se vazio/já compacto)
+    """
+    if not details or is_compact(details):
+        return details
+
+    rounds = []
+    for round_data in details.get("rounds", []):
+        dominant = round_data.get("dominant_fighter")
+        if dominant == fighter1_name:
+            side = 1
+        elif dominant == fighter2_name:
+            side = 2
+        else:
+            side = dominant
+        rounds.append(
+            [
+                round_data.get("round_number"),
+                _scale(round_data.get("fighter1_points")),
+                _scale(round_data.get("fighter2_points")),
+                side,
+                [
+                    _encode_event(event, dominant or "")
+                    for event in round_data.get("events", [])
+                ],
+            ]
+        )
+
+    total_points = details.get("total_points", {})
+    return {
+        "v": COMPACT_VERSION,
+        "r": rounds,
+        "t": [
+            _scale(total_points.get("fighter1")),
+            _scale(total_points.get("fighter2")),
+        ],
+    }
+
+
+def render_simulation_details(
+    details: Optional[dict], fighter1_name: str, fighter2_name: str
+) -> Optional[dict]:
+    """
+    Reconstrói o formato legível de `simulation_details` a partir do compacto
+
+    Registros legados (ainda não convertidos) são devolvidos sem alteração.
+    """
+    if not is_compact(details):
+        return details
+
+    rounds = []
+    for round_number, points1, points2, side, events in details["r"]:
+        if side == 1:
+            dominant = fighter1_name
+        elif side == 2:
+            dominant = fighter2_name
+        else:
+            dominant = side
+        rounds.append(
+            {
+                "round_number": round_number,
+                "fighter1_points": _unscale(points1),
+                "fighter2_points": _unscale(points2),
+                "dominant_fighter": dominant,
+                "events": [
+                    EVENT_TEMPLATES[event].format(name=dominant)
+                    if isinstance(event, int) and event in EVENT_TEMPLATES
+                    else event
+                    for event in events
+                ],
+            }
+        )
+
+    total1, total2 = details["t"]
+    return {
+        "rounds": rounds,
+        "total_points": {"fighter1": _unscale(total1), "fighter2": _unscale(total2)},
+    }
+
+
+BATCH_SIZE = 500
+
+SELECT_BATCH = """
+    SELECT t.id, t.simulation_details, f1.name, f2.name
+    FROM {table} t
+    JOIN fighters f1 ON f1.id = t.fighter1_id
+    JOIN fighters f2 ON f2.id = t.fighter2_id
+    WHERE t.simulation_details IS NOT NULL
+      AND t.simulation_details <> '{{}}'::jsonb
+      AND (t.simulation_details ->> 'v') IS {compact} NULL
+      AND t.id > :last_id
+    ORDER BY t.id
+    LIMIT :batch_size
+"""
+
+
+def _convert_table(table: str, converter: Callable, to_compact: bool) -> None:
+    """Converte uma tabela em lotes ordenados por id (keyset pagination)"""
+    connection = op.get_bind()
+    select_batch = sa.text(
+        SELECT_BATCH.format(table=table, compact="" if to_compact else "NOT")
+    )
+    update_row = sa.text(
+        f"UPDATE {table} SET simulation_details = CAST(:details AS jsonb) "
+        "WHERE id = :id"
+    )
+
+    last_id = "00000000-0000-0000-0000-000000000000"
+    while True:
+        rows = connection.execute(
+            select_batch, {"last_id": last_id, "batch_size": BATCH_SIZE}
+        ).fetchall()
+        if not rows:
+            break
+
+        connection.execute(
+            update_row,
+            [
+                {
+                    "id": row_id,
+                    "details": json.dumps(
+                        converter(details, fighter1_name, fighter2_name),
+                        ensure_ascii=False,
+                    ),
+                }
+                for row_id, details, fighter1_name, fighter2_name in rows
+            ],
+        )
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    for table in ("fight_simulations", "fights"):
+        _convert_table(table, encode_simulation_details, to_compact=True)
+
+
+def downgrade() -> None:
+    for table in ("fight_simulations", "fights"):
+        _convert_table(table, render_simulation_details, to_compact=False)
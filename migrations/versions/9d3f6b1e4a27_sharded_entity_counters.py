@@ -0,0 +1,108 @@
+"""sharded_entity_counters
+
+Divide cada linha de entity_counters em shards (coluna `shard`, somados na
+leitura) para que escritas concorrentes não façam fila no lock de uma única
+linha, e remove count_estimate(text), que executava SQL montado em texto.
+
+Revision ID: 9d3f6b1e4a27
+Revises: c2e8b4f6a913
+Create Date: 2026-10-19 20:14:51.402318
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "9d3f6b1e4a27"
+down_revision: Union[str, None] = "c2e8b4f6a913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# SQL desta revisão (congelado aqui, não importado do app)
+COUNTER_SHARDS = 16
+
+BUMP_FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION entity_counters_bump(
+    p_entity text, p_dimension text, p_value text, p_delta bigint
+) RETURNS void AS $$
+BEGIN
+    INSERT INTO entity_counters (entity, dimension, value, shard, count, updated_at)
+    VALUES (
+        p_entity, p_dimension, coalesce(p_value, ''),
+        (txid_current() % {COUNTER_SHARDS})::smallint, p_delta, now()
+    )
+    ON CONFLICT (entity, dimension, value, shard) DO UPDATE
+    SET count = entity_counters.count + EXCLUDED.count,
+        updated_at = EXCLUDED.updated_at;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# Versões anteriores das funções (para o downgrade)
+UNSHARDED_BUMP_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION entity_counters_bump(
+    p_entity text, p_dimension text, p_value text, p_delta bigint
+) RETURNS void AS $$
+BEGIN
+    INSERT INTO entity_counters (entity, dimension, value, count, updated_at)
+    VALUES (p_entity, p_dimension, coalesce(p_value, ''), p_delta, now())
+    ON CONFLICT (entity, dimension, value) DO UPDATE
+    SET count = entity_counters.count + EXCLUDED.count,
+        updated_at = EXCLUDED.updated_at;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+COUNT_ESTIMATE_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION count_estimate(query text) RETURNS bigint AS $$
+DECLARE
+    plan jsonb;
+BEGIN
+    EXECUTE 'EXPLAIN (FORMAT JSON) ' || query INTO plan;
+    RETURN (plan->0->'Plan'->>'Plan Rows')::bigint;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.add_column(
+        "entity_counters",
+        sa.Column("shard", sa.SmallInteger(), nullable=False, server_default="0"),
+    )
+    op.drop_constraint("entity_counters_pkey", "entity_counters", type_="primary")
+    op.create_primary_key(
+        "entity_counters_pkey",
+        "entity_counters",
+        ["entity", "dimension", "value", "shard"],
+    )
+    op.execute(BUMP_FUNCTION_SQL)
+    op.execute("DROP FUNCTION IF EXISTS count_estimate(text)")
+
+
+def downgrade() -> None:
+    op.execute(COUNT_ESTIMATE_FUNCTION_SQL)
+    op.execute(UNSHARDED_BUMP_FUNCTION_SQL)
+    # Junta os shards no shard 0 antes de voltar à chave sem shard
+    op.execute(
+        """
+        WITH moved AS (
+            DELETE FROM entity_counters WHERE shard <> 0 RETURNING *
+        )
+        INSERT INTO entity_counters (entity, dimension, value, shard, count, updated_at)
+        SELECT entity, dimension, value, 0, sum(count), max(updated_at)
+        FROM moved
+        GROUP BY entity, dimension, value
+        ON CONFLICT (entity, dimension, value, shard) DO UPDATE
+        SET count = entity_counters.count + EXCLUDED.count,
+            updated_at = greatest(entity_counters.updated_at, EXCLUDED.updated_at)
+        """
+    )
+    op.drop_constraint("entity_counters_pkey", "entity_counters", type_="primary")
+    op.create_primary_key(
+        "entity_counters_pkey", "entity_counters", ["entity", "dimension", "value"]
+    )
+    op.drop_column("entity_counters", "shard")
@@ -0,0 +1,78 @@
+"""fighter_fight_history
+
+Índices de fights por lutador/evento e view fighter_fight_history, usada pelo
+endpoint paginado /fighters/{id}/cartel no lugar do JSONB fighters.cartel.
+
+Revision ID: a7d3e91f4c2b
+Revises: f1c4a7d2e8b6
+Create Date: 2026-10-19 18:10:41.512907
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d3e91f4c2b"
+down_revision: Union[str, None] = "f1c4a7d2e8b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# View desta revisão (congelada aqui, não importada do app): uma linha por
+# (lutador, luta), cada metade do UNION ALL a partir de um corner
+def _side_sql(corner: str, opponent: str) -> str:
+    return f"""
+    SELECT
+        f.{corner} AS fighter_id,
+        f.id AS fight_id,
+        f.event_id,
+        e.name AS event_name,
+        e.date AS event_date,
+        e.organization,
+        f.{opponent} AS opponent_id,
+        o.name AS opponent_name,
+        CASE
+            WHEN f.result_type = 'Draw' THEN 'D'
+            WHEN f.winner_id IS NULL THEN 'N/A'
+            WHEN f.winner_id = f.{corner} THEN 'W'
+            ELSE 'L'
+        END AS result,
+        coalesce(f.result_type, 'Unknown') AS method,
+        f.method_details,
+        f.finish_round AS round,
+        f.finish_time,
+        f.weight_class,
+        f.is_title_fight
+    FROM fights f
+    JOIN events e ON e.id = f.event_id
+    JOIN fighters o ON o.id = f.{opponent}
+    WHERE f.status = 'completed'
+      AND f.deleted_at IS NULL
+      AND e.deleted_at IS NULL
+    """
+
+
+VIEW_SQL = (
+    "CREATE OR REPLACE VIEW fighter_fight_history AS"
+    f"{_side_sql('fighter1_id', 'fighter2_id')}"
+    "UNION ALL"
+    f"{_side_sql('fighter2_id', 'fighter1_id')}"
+)
+
+
+def upgrade() -> None:
+    op.create_index(op.f("ix_fights_fighter1_id"), "fights", ["fighter1_id"])
+    op.create_index(op.f("ix_fights_fighter2_id"), "fights", ["fighter2_id"])
+    op.create_index(op.f("ix_fights_event_id"), "fights", ["event_id"])
+
+    op.execute(VIEW_SQL)
+
+
+def downgrade() -> None:
+    op.execute("DROP VIEW IF EXISTS fighter_fight_history")
+
+    op.drop_index(op.f("ix_fights_event_id"), table_name="fights")
+    op.drop_index(op.f("ix_fights_fighter2_id"), table_name="fights")
+    op.drop_index(op.f("ix_fights_fighter1_id"), table_name="fights")
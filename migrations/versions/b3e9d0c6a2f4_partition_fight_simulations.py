@@ -0,0 +1,150 @@
+"""partition_fight_simulations
+
+Recria fight_simulations como tabela particionada por RANGE (created_at),
+com partições mensais e uma partição DEFAULT.
+
+Revision ID: b3e9d0c6a2f4
+Revises: 8c1f2a4b7d31
+Create Date: 2026-10-19 10:03:27.481902
+
+"""
+
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e9d0c6a2f4"
+down_revision: Union[str, None] = "8c1f2a4b7d31"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = (
+    "id, fighter1_id, fighter2_id, winner_id, result_type, rounds, finish_round, "
+    "fighter1_probability, fighter2_probability, simulation_details, notes, "
+    "created_by, created_at, updated_by, updated_at, deleted_by, deleted_at"
+)
+
+# Partições criadas por esta revisão (SQL congelado aqui, não importado do
+# app): DEFAULT e uma por mês, da simulação mais antiga até 3 meses à frente
+PARTITIONS_AHEAD = 3
+
+
+def _add_months(value: date, months: int) -> date:
+    month_index = value.year * 12 + (value.month - 1) + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _create_partitions(since: date | None) -> None:
+    op.execute(
+        "CREATE TABLE IF NOT EXISTS fight_simulations_default "
+        "PARTITION OF fight_simulations DEFAULT"
+    )
+    current = datetime.now(timezone.utc).date().replace(day=1)
+    month = since.replace(day=1) if since else current
+    last = _add_months(current, PARTITIONS_AHEAD)
+    while month <= last:
+        start = datetime.combine(month, datetime.min.time(), timezone.utc)
+        end = datetime.combine(_add_months(month, 1), datetime.min.time(), timezone.utc)
+        op.execute(
+            f"CREATE TABLE fight_simulations_p{month:%Y%m} "
+            "PARTITION OF fight_simulations "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        month = _add_months(month, 1)
+
+
+def _create_fight_simulations(partitioned: bool) -> None:
+    primary_key = ("id", "created_at") if partitioned else ("id",)
+    op.create_table(
+        "fight_simulations",
+        sa.Column("fighter1_id", sa.UUID(), nullable=False),
+        sa.Column("fighter2_id", sa.UUID(), nullable=False),
+        sa.Column("winner_id", sa.UUID(), nullable=False),
+        sa.Column("result_type", sa.String(length=50), nullable=False),
+        sa.Column("rounds", sa.Integer(), nullable=False),
+        sa.Column("finish_round", sa.Integer(), nullable=True),
+        sa.Column("fighter1_probability", sa.Float(), nullable=False),
+        sa.Column("fighter2_probability", sa.Float(), nullable=False),
+        sa.Column(
+            "simulation_details",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+        ),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("created_by", sa.String(length=150), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(timezone=True), nullable=not partitioned),
+        sa.Column("updated_by", sa.String(length=150), nullable=False),
+        sa.Column("updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("deleted_by", sa.String(length=150), nullable=True),
+        sa.Column("deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["fighter1_id"],
+            ["fighters.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["fighter2_id"],
+            ["fighters.id"],
+        ),
+        sa.PrimaryKeyConstraint(*primary_key),
+        **({"postgresql_partition_by": "RANGE (created_at)"} if partitioned else {}),
+    )
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+
+    op.rename_table("fight_simulations", "fight_simulations_legacy")
+    op.execute(
+        "ALTER TABLE fight_simulations_legacy "
+        "RENAME CONSTRAINT fight_simulations_pkey TO fight_simulations_legacy_pkey"
+    )
+    op.execute(
+        "UPDATE fight_simulations_legacy SET created_at = now() "
+        "WHERE created_at IS NULL"
+    )
+
+    _create_fight_simulations(partitioned=True)
+    op.create_index(
+        op.f("ix_fight_simulations_created_at"),
+        "fight_simulations",
+        ["created_at"],
+        unique=False,
+    )
+
+    # Partições desde a simulação mais antiga até alguns meses à frente
+    oldest = connection.execute(
+        sa.text("SELECT min(created_at) FROM fight_simulations_legacy")
+    ).scalar()
+    _create_partitions(oldest.date() if oldest else None)
+
+    op.execute(
+        f"INSERT INTO fight_simulations ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM fight_simulations_legacy"
+    )
+    op.drop_table("fight_simulations_legacy")
+
+
+def downgrade() -> None:
+    op.rename_table("fight_simulations", "fight_simulations_partitioned")
+    op.execute(
+        "ALTER TABLE fight_simulations_partitioned "
+        "RENAME CONSTRAINT fight_simulations_pkey "
+        "TO fight_simulations_partitioned_pkey"
+    )
+    op.drop_index(
+        op.f("ix_fight_simulations_created_at"),
+        table_name="fight_simulations_partitioned",
+    )
+
+    _create_fight_simulations(partitioned=False)
+    op.execute(
+        f"INSERT INTO fight_simulations ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM fight_simulations_partitioned"
+    )
+    # DROP da tabela particionada remove também todas as partições
+    op.drop_table("fight_simulations_partitioned")
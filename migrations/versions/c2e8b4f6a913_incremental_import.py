@@ -0,0 +1,47 @@
+"""incremental_import
+
+Hash da linha de origem (import_hash) em fighters, events e fights e tabela
+import_checkpoints, usados pela importação incremental do dataset UFC.
+
+Revision ID: c2e8b4f6a913
+Revises: a7d3e91f4c2b
+Create Date: 2026-10-19 18:32:05.117384
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c2e8b4f6a913"
+down_revision: Union[str, None] = "a7d3e91f4c2b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+IMPORTED_TABLES = ("fighters", "events", "fights")
+
+
+def upgrade() -> None:
+    for table in IMPORTED_TABLES:
+        op.add_column(
+            table, sa.Column("import_hash", sa.String(length=32), nullable=True)
+        )
+
+    op.create_table(
+        "import_checkpoints",
+        sa.Column("step", sa.String(length=50), nullable=False),
+        sa.Column("file_hash", sa.String(length=32), nullable=False),
+        sa.Column("rows_done", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("step"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("import_checkpoints")
+
+    for table in IMPORTED_TABLES:
+        op.drop_column(table, "import_hash")
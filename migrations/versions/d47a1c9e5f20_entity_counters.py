@@ -0,0 +1,205 @@
+"""entity_counters
+
+Contadores de registros mantidos por triggers em fighters e fight_simulations,
+usados pelos endpoints de total/estatísticas no lugar de COUNT(*).
+
+Revision ID: d47a1c9e5f20
+Revises: b3e9d0c6a2f4
+Create Date: 2026-10-19 11:42:08.215734
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d47a1c9e5f20"
+down_revision: Union[str, None] = "b3e9d0c6a2f4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# SQL desta revisão (congelado aqui: mudanças posteriores nas funções e
+# triggers vão em novas revisões, não alteram o que esta aplica)
+ALL_DIMENSION = "all"
+
+FIGHTER_DIMENSIONS = ("actual_weight_class", "last_organization_fight", "is_real")
+
+LIVE_FILTER = "deleted_at IS NULL AND deleted_by IS NULL"
+
+BUMP_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION entity_counters_bump(
+    p_entity text, p_dimension text, p_value text, p_delta bigint
+) RETURNS void AS $$
+BEGIN
+    INSERT INTO entity_counters (entity, dimension, value, count, updated_at)
+    VALUES (p_entity, p_dimension, coalesce(p_value, ''), p_delta, now())
+    ON CONFLICT (entity, dimension, value) DO UPDATE
+    SET count = entity_counters.count + EXCLUDED.count,
+        updated_at = EXCLUDED.updated_at;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# Estimativa do planner para consultas arbitrárias (usa pg_class.reltuples
+# e as estatísticas das colunas, sem executar a consulta)
+COUNT_ESTIMATE_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION count_estimate(query text) RETURNS bigint AS $$
+DECLARE
+    plan jsonb;
+BEGIN
+    EXECUTE 'EXPLAIN (FORMAT JSON) ' || query INTO plan;
+    RETURN (plan->0->'Plan'->>'Plan Rows')::bigint;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+FIGHTERS_TRIGGER_FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION fighters_counters_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE')
+       AND OLD.deleted_at IS NULL AND OLD.deleted_by IS NULL THEN
+        PERFORM entity_counters_bump('fighters', '{ALL_DIMENSION}', '', -1);
+        PERFORM entity_counters_bump(
+            'fighters', 'actual_weight_class', OLD.actual_weight_class, -1);
+        PERFORM entity_counters_bump(
+            'fighters', 'last_organization_fight', OLD.last_organization_fight, -1);
+        PERFORM entity_counters_bump('fighters', 'is_real', OLD.is_real::text, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE')
+       AND NEW.deleted_at IS NULL AND NEW.deleted_by IS NULL THEN
+        PERFORM entity_counters_bump('fighters', '{ALL_DIMENSION}', '', 1);
+        PERFORM entity_counters_bump(
+            'fighters', 'actual_weight_class', NEW.actual_weight_class, 1);
+        PERFORM entity_counters_bump(
+            'fighters', 'last_organization_fight', NEW.last_organization_fight, 1);
+        PERFORM entity_counters_bump('fighters', 'is_real', NEW.is_real::text, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+SIMULATIONS_TRIGGER_FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION fight_simulations_counters_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE')
+       AND OLD.deleted_at IS NULL AND OLD.deleted_by IS NULL THEN
+        PERFORM entity_counters_bump('fight_simulations', '{ALL_DIMENSION}', '', -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE')
+       AND NEW.deleted_at IS NULL AND NEW.deleted_by IS NULL THEN
+        PERFORM entity_counters_bump('fight_simulations', '{ALL_DIMENSION}', '', 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# UPDATE só dispara quando alguma coluna contada muda, evitando disputa de lock
+# nas linhas de contador a cada update comum
+TRIGGERS_SQL = [
+    """
+    CREATE TRIGGER fighters_counters_insert_delete
+    AFTER INSERT OR DELETE ON fighters
+    FOR EACH ROW EXECUTE FUNCTION fighters_counters_trigger()
+    """,
+    """
+    CREATE TRIGGER fighters_counters_update
+    AFTER UPDATE ON fighters
+    FOR EACH ROW WHEN (
+        OLD.deleted_at IS DISTINCT FROM NEW.deleted_at
+        OR OLD.deleted_by IS DISTINCT FROM NEW.deleted_by
+        OR OLD.actual_weight_class IS DISTINCT FROM NEW.actual_weight_class
+        OR OLD.last_organization_fight IS DISTINCT FROM NEW.last_organization_fight
+        OR OLD.is_real IS DISTINCT FROM NEW.is_real
+    )
+    EXECUTE FUNCTION fighters_counters_trigger()
+    """,
+    """
+    CREATE TRIGGER fight_simulations_counters_insert_delete
+    AFTER INSERT OR DELETE ON fight_simulations
+    FOR EACH ROW EXECUTE FUNCTION fight_simulations_counters_trigger()
+    """,
+    """
+    CREATE TRIGGER fight_simulations_counters_update
+    AFTER UPDATE ON fight_simulations
+    FOR EACH ROW WHEN (
+        OLD.deleted_at IS DISTINCT FROM NEW.deleted_at
+        OR OLD.deleted_by IS DISTINCT FROM NEW.deleted_by
+    )
+    EXECUTE FUNCTION fight_simulations_counters_trigger()
+    """,
+]
+
+CREATE_SQL = [
+    BUMP_FUNCTION_SQL,
+    COUNT_ESTIMATE_FUNCTION_SQL,
+    FIGHTERS_TRIGGER_FUNCTION_SQL,
+    SIMULATIONS_TRIGGER_FUNCTION_SQL,
+    *TRIGGERS_SQL,
+]
+
+DROP_SQL = [
+    "DROP TRIGGER IF EXISTS fight_simulations_counters_update ON fight_simulations",
+    "DROP TRIGGER IF EXISTS fight_simulations_counters_insert_delete "
+    "ON fight_simulations",
+    "DROP TRIGGER IF EXISTS fighters_counters_update ON fighters",
+    "DROP TRIGGER IF EXISTS fighters_counters_insert_delete ON fighters",
+    "DROP FUNCTION IF EXISTS fight_simulations_counters_trigger()",
+    "DROP FUNCTION IF EXISTS fighters_counters_trigger()",
+    "DROP FUNCTION IF EXISTS count_estimate(text)",
+    "DROP FUNCTION IF EXISTS entity_counters_bump(text, text, text, bigint)",
+]
+
+# Recalcula todos os contadores a partir das tabelas (carga inicial/reparo)
+REBUILD_SQL = [
+    "DELETE FROM entity_counters WHERE entity IN ('fighters', 'fight_simulations')",
+    f"""
+    INSERT INTO entity_counters (entity, dimension, value, count, updated_at)
+    SELECT 'fighters', '{ALL_DIMENSION}', '', count(*), now()
+    FROM fighters WHERE {LIVE_FILTER}
+    """,
+    *[
+        f"""
+        INSERT INTO entity_counters (entity, dimension, value, count, updated_at)
+        SELECT 'fighters', '{dimension}', coalesce({dimension}::text, ''),
+               count(*), now()
+        FROM fighters WHERE {LIVE_FILTER}
+        GROUP BY coalesce({dimension}::text, '')
+        """
+        for dimension in FIGHTER_DIMENSIONS
+    ],
+    f"""
+    INSERT INTO entity_counters (entity, dimension, value, count, updated_at)
+    SELECT 'fight_simulations', '{ALL_DIMENSION}', '', count(*), now()
+    FROM fight_simulations WHERE {LIVE_FILTER}
+    """,
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "entity_counters",
+        sa.Column("entity", sa.String(length=50), nullable=False),
+        sa.Column("dimension", sa.String(length=50), nullable=False),
+        sa.Column("value", sa.String(length=150), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False),
+        sa.Column("updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("entity", "dimension", "value"),
+    )
+
+    # Bloqueia escritas enquanto os contadores são carregados, para que
+    # nenhuma linha fique fora da carga inicial nem seja contada em dobro
+    op.execute("LOCK TABLE fighters, fight_simulations IN SHARE MODE")
+    for statement in CREATE_SQL:
+        op.execute(statement)
+    for statement in REBUILD_SQL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for statement in DROP_SQL:
+        op.execute(statement)
+    op.drop_table("entity_counters")
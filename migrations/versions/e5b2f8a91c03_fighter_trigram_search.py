@@ -0,0 +1,63 @@
+"""fighter_trigram_search
+
+Índices GIN (pg_trgm) sobre nome/apelido dos lutadores e nome dos eventos,
+normalizados com f_unaccent(lower(...)) para busca por similaridade
+sem diferenciar acentos.
+
+Revision ID: e5b2f8a91c03
+Revises: d47a1c9e5f20
+Create Date: 2026-10-19 14:18:51.604127
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b2f8a91c03"
+down_revision: Union[str, None] = "d47a1c9e5f20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# SQL desta revisão (congelado aqui, não importado do app)
+EXTENSIONS_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+]
+
+# unaccent() é apenas STABLE; o wrapper IMMUTABLE pode ser usado em índices
+F_UNACCENT_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text AS $$
+    SELECT public.unaccent('public.unaccent'::regdictionary, $1)
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+"""
+
+TRIGRAM_INDEXES = [
+    ("ix_fighters_name_trgm", "fighters", "name"),
+    ("ix_fighters_nickname_trgm", "fighters", "nickname"),
+    ("ix_events_name_trgm", "events", "name"),
+]
+
+
+def upgrade() -> None:
+    for statement in EXTENSIONS_SQL:
+        op.execute(statement)
+    op.execute(F_UNACCENT_FUNCTION_SQL)
+
+    for index_name, table_name, column in TRIGRAM_INDEXES:
+        op.create_index(
+            index_name,
+            table_name,
+            [sa.text(f"f_unaccent(lower({column})) gin_trgm_ops")],
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    for index_name, table_name, _ in TRIGRAM_INDEXES:
+        op.drop_index(index_name, table_name=table_name)
+
+    # As extensões são mantidas: podem estar em uso por outros objetos
+    op.execute("DROP FUNCTION IF EXISTS f_unaccent(text)")
@@ -0,0 +1,72 @@
+"""entity_versions
+
+Linhas de versão em entity_counters, incrementadas por triggers de statement
+em fighters, events e fights, usadas como ETag/Last-Modified das leituras.
+
+Revision ID: f1c4a7d2e8b6
+Revises: e5b2f8a91c03
+Create Date: 2026-10-19 15:37:12.908416
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f1c4a7d2e8b6"
+down_revision: Union[str, None] = "e5b2f8a91c03"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# SQL desta revisão (congelado aqui, não importado do app)
+VERSION_DIMENSION = "version"
+
+VERSIONED_TABLES = ("fighters", "events", "fights")
+
+VERSION_TRIGGER_FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION entity_versions_trigger() RETURNS trigger AS $$
+BEGIN
+    PERFORM entity_counters_bump(TG_TABLE_NAME, '{VERSION_DIMENSION}', '', 1);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+VERSION_CREATE_SQL = [
+    VERSION_TRIGGER_FUNCTION_SQL,
+    *[
+        f"""
+        CREATE TRIGGER {table}_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+        FOR EACH STATEMENT EXECUTE FUNCTION entity_versions_trigger()
+        """
+        for table in VERSIONED_TABLES
+    ],
+]
+
+VERSION_DROP_SQL = [
+    *[
+        f"DROP TRIGGER IF EXISTS {table}_version ON {table}"
+        for table in VERSIONED_TABLES
+    ],
+    "DROP FUNCTION IF EXISTS entity_versions_trigger()",
+    f"DELETE FROM entity_counters WHERE dimension = '{VERSION_DIMENSION}'",
+]
+
+
+def upgrade() -> None:
+    for statement in VERSION_CREATE_SQL:
+        op.execute(statement)
+
+    for table in VERSIONED_TABLES:
+        op.execute(
+            "INSERT INTO entity_counters (entity, dimension, value, count, updated_at) "
+            f"VALUES ('{table}', '{VERSION_DIMENSION}', '', 1, now()) "
+            "ON CONFLICT (entity, dimension, value) DO NOTHING"
+        )
+
+
+def downgrade() -> None:
+    for statement in VERSION_DROP_SQL:
+        op.execute(statement)
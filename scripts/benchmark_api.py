@@ -0,0 +1,458 @@
+"""
+Benchmark de carga e latência da API
+
+Gera carga em processo (httpx + ASGI, sem servidor HTTP) contra o app real e
+um Postgres local, e mede por endpoint: vazão, latências p50/p95/p99 e
+quantidade de queries por requisição. O resultado sai em JSON para ser
+comparado entre commits (--compare).
+
+Endpoints medidos:
+    simulate        POST /simulations/
+    predict         GET  /simulations/predict
+    search          GET  /fighters/?name=...
+    top             GET  /fighters/rankings/top
+    event_simulate  POST /events/{id}/simulate   (um evento novo por requisição)
+    history         GET  /simulations/history/{fighter_id}
+
+Com --seed o banco é populado a partir de datasets/*.csv (mesmo importador
+de scripts/import_ufc_dataset.py; etapas já importadas são puladas). Os
+eventos simulados no benchmark são criados a cada execução com
+organization="Benchmark" e removidos na execução seguinte, então use um
+banco descartável.
+
+    python scripts/benchmark_api.py --seed --requests 500 --concurrency 8 \\
+        --output bench/api-$(git rev-parse --short HEAD).json
+    python scripts/benchmark_api.py --requests 500 --compare bench/api-base.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+import httpx
+from sqlalchemy import create_engine, delete, event, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.settings import Settings
+from app.database.models.base import Event, Fight, Fighter, User
+
+settings = Settings()
+
+API = "/api/v1"
+BENCHMARK_ORGANIZATION = "Benchmark"
+BENCHMARK_EMAIL = "benchmark@fightbase.com"
+FIGHTS_PER_EVENT = 5
+ENDPOINTS = ("simulate", "predict", "search", "top", "event_simulate", "history")
+
+
+class QueryCounter:
+    """Conta as queries enviadas ao banco por qualquer engine do processo"""
+
+    def __init__(self):
+        self.count = 0
+        event.listen(Engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+
+def seed_database(datasets_dir: str) -> None:
+    """Popula lutadores, eventos e lutas reais a partir dos CSVs"""
+    from scripts.import_ufc_dataset import UFCDatasetImporter
+
+    datasets = Path(datasets_dir)
+    engine = create_engine(settings.DATABASE_URL_SYNC)
+    try:
+        with Session(engine) as session:
+            importer = UFCDatasetImporter(session)
+            system_user = importer.get_or_create_system_user()
+            importer.import_fighters(str(datasets / "fighter_details.csv"), system_user)
+            importer.import_events(str(datasets / "event_details.csv"), system_user)
+            # fight_details.csv é opcional: sem ele ficam só lutadores e eventos
+            if (datasets / "fight_details.csv").exists():
+                importer.import_fights(str(datasets / "fight_details.csv"))
+    finally:
+        engine.dispose()
+
+
+def prepare_fixtures(events: int, rng: random.Random) -> tuple[list, list]:
+    """
+    Cria o usuário do benchmark e `events` eventos agendados
+
+    Returns:
+        (ids dos lutadores usados na carga, ids dos eventos agendados)
+    """
+    engine = create_engine(settings.DATABASE_URL_SYNC)
+    try:
+        with Session(engine) as session:
+            # Eventos da execução anterior (lutas primeiro por causa da FK)
+            old_events = select(Event.id).filter(
+                Event.organization == BENCHMARK_ORGANIZATION
+            )
+            session.execute(delete(Fight).filter(Fight.event_id.in_(old_events)))
+            session.execute(
+                delete(Event).filter(Event.organization == BENCHMARK_ORGANIZATION)
+            )
+
+            user = session.scalar(select(User).filter_by(email=BENCHMARK_EMAIL))
+            if user is None:
+                user = User(
+                    email=BENCHMARK_EMAIL,
+                    password="benchmark_no_login",
+                    name="Benchmark",
+                    is_active=False,
+                )
+                session.add(user)
+                session.flush()
+
+            # Lutadores com estatísticas (os que a simulação usa de verdade)
+            fighter_ids = list(
+                session.scalars(
+                    select(Fighter.id)
+                    .filter(Fighter.deleted_at.is_(None), Fighter.slpm.is_not(None))
+                    .order_by(Fighter.id)
+                    .limit(500)
+                )
+            ) or list(
+                session.scalars(
+                    select(Fighter.id)
+                    .filter(Fighter.deleted_at.is_(None))
+                    .order_by(Fighter.id)
+                    .limit(500)
+                )
+            )
+            if len(fighter_ids) < 2:
+                raise RuntimeError("Banco sem lutadores suficientes (use --seed)")
+
+            event_ids = []
+            now = datetime.now(timezone.utc)
+            for number in range(events):
+                card = Event(
+                    name=f"Benchmark Event {number + 1}",
+                    date=now,
+                    organization=BENCHMARK_ORGANIZATION,
+                    status="scheduled",
+                    creator_id=user.id,
+                )
+                for order in range(1, FIGHTS_PER_EVENT + 1):
+                    fighter1_id, fighter2_id = rng.sample(fighter_ids, 2)
+                    card.fights.append(
+                        Fight(
+                            fighter1_id=fighter1_id,
+                            fighter2_id=fighter2_id,
+                            fight_order=order,
+                            rounds=5 if order == 1 else 3,
+                        )
+                    )
+                session.add(card)
+                session.flush()
+                event_ids.append(card.id)
+            session.commit()
+            return fighter_ids, event_ids
+    finally:
+        engine.dispose()
+
+
+def build_requests(
+    fighter_ids: list, event_ids: list, names: list[str], rng: random.Random
+) -> dict[str, Callable[[int], tuple]]:
+    """Gerador de (método, url, corpo) da i-ésima requisição de cada endpoint"""
+
+    def pair() -> tuple[str, str]:
+        fighter1_id, fighter2_id = rng.sample(fighter_ids, 2)
+        return str(fighter1_id), str(fighter2_id)
+
+    def simulate(_):
+        fighter1_id, fighter2_id = pair()
+        body = {"fighter1_id": fighter1_id, "fighter2_id": fighter2_id, "rounds": 3}
+        return "POST", f"{API}/simulations/", body
+
+    def predict(_):
+        fighter1_id, fighter2_id = pair()
+        url = (
+            f"{API}/simulations/predict"
+            f"?fighter1_id={fighter1_id}&fighter2_id={fighter2_id}"
+        )
+        return "GET", url, None
+
+    def search(_):
+        return "GET", f"{API}/fighters/?name={rng.choice(names)}", None
+
+    def top(_):
+        return "GET", f"{API}/fighters/rankings/top", None
+
+    def event_simulate(index):
+        return "POST", f"{API}/events/{event_ids[index]}/simulate", None
+
+    def history(_):
+        return "GET", f"{API}/simulations/history/{rng.choice(fighter_ids)}", None
+
+    return {
+        "simulate": simulate,
+        "predict": predict,
+        "search": search,
+        "top": top,
+        "event_simulate": event_simulate,
+        "history": history,
+    }
+
+
+def summarize(samples: list[float], errors: int, elapsed: float, queries: int):
+    """Vazão, percentis (ms) e queries por requisição de um endpoint"""
+    requests = len(samples) + errors
+    cuts = statistics.quantiles(samples, n=100) if len(samples) > 1 else samples * 99
+    return {
+        "requests": requests,
+        "errors": errors,
+        "throughput_rps": round(requests / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(samples) * 1e3, 3) if samples else None,
+        "p50_ms": round(cuts[49] * 1e3, 3) if cuts else None,
+        "p95_ms": round(cuts[94] * 1e3, 3) if cuts else None,
+        "p99_ms": round(cuts[98] * 1e3, 3) if cuts else None,
+        "queries_per_request": round(queries / requests, 2) if requests else 0.0,
+    }
+
+
+async def run_endpoint(
+    client: httpx.AsyncClient,
+    make_request: Callable[[int], tuple],
+    total: int,
+    concurrency: int,
+    counter: QueryCounter,
+    headers: dict,
+    offset: int = 0,
+) -> dict:
+    """Dispara `total` requisições com `concurrency` clientes simultâneos"""
+    samples: list[float] = []
+    statuses: Counter = Counter()
+    next_index = iter(range(offset, offset + total))
+
+    async def worker():
+        for index in next_index:
+            method, url, body = make_request(index)
+            start = time.perf_counter()
+            response = await client.request(method, url, json=body, headers=headers)
+            elapsed = time.perf_counter() - start
+            statuses[response.status_code] += 1
+            if response.status_code < 400:
+                samples.append(elapsed)
+
+    queries_before = counter.count
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    result = summarize(
+        samples,
+        total - len(samples),
+        elapsed,
+        counter.count - queries_before,
+    )
+    result["statuses"] = {str(code): count for code, count in sorted(statuses.items())}
+    return result
+
+
+async def run_benchmark(
+    endpoints: list[str],
+    requests: int,
+    concurrency: int,
+    warmup: int,
+    seed: int,
+    ml_fallback: bool = False,
+) -> dict:
+    rng = random.Random(seed)
+    fighter_ids, event_ids = prepare_fixtures(
+        (requests + warmup) if "event_simulate" in endpoints else 0, rng
+    )
+
+    # Importa o app só agora: settings (ex: cache de respostas) vêm do ambiente
+    from app.main import app
+    from app.services.auth.authentication import AuthService
+    from app.services.ml.model_loader import MLModelLoader
+    from app.services.warmup import readiness
+
+    if ml_fallback:
+        # Sem modelo: o loader tentaria o GCS de novo a cada predição
+        MLModelLoader.load_model = classmethod(lambda cls, force_reload=False: None)
+
+    engine = create_engine(settings.DATABASE_URL_SYNC)
+    try:
+        with Session(engine) as session:
+            names = list(
+                session.scalars(
+                    select(Fighter.name)
+                    .filter(Fighter.id.in_(fighter_ids[:100]))
+                    .order_by(Fighter.name)
+                )
+            )
+    finally:
+        engine.dispose()
+    # Prefixos de nome, como digitados numa busca
+    names = [name.split()[0][:4] for name in names if name.strip()] or ["a"]
+
+    token = await AuthService().create_access_token(BENCHMARK_EMAIL)
+    headers = {"Authorization": f"Bearer {token}"}
+    make = build_requests(fighter_ids, event_ids, names, rng)
+    counter = QueryCounter()
+    results = {}
+
+    async with app.router.lifespan_context(app):
+        # Mede o worker já pronto, como atrás do load balancer (/api/readyz)
+        while not readiness.ready:
+            await asyncio.sleep(0.05)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark", timeout=60
+        ) as client:
+            for name in endpoints:
+                # Aquecimento (não medido): pool de conexões, modelo ML, caches
+                if warmup:
+                    await run_endpoint(
+                        client, make[name], warmup, concurrency, counter, headers
+                    )
+                results[name] = await run_endpoint(
+                    client,
+                    make[name],
+                    requests,
+                    concurrency,
+                    counter,
+                    headers,
+                    offset=warmup,
+                )
+                print(f"✓ {name}: {results[name]['throughput_rps']} req/s")
+    return results
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _ms(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.2f}"
+
+
+def print_results(results: dict, baseline: Optional[dict] = None) -> None:
+    print(
+        f"\n{'endpoint':<16} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'p99 ms':>9} {'queries':>8} {'erros':>6}"
+    )
+    for name, result in results.items():
+        print(
+            f"{name:<16} {result['throughput_rps']:>8.1f} "
+            f"{_ms(result['p50_ms']):>9} {_ms(result['p95_ms']):>9} "
+            f"{_ms(result['p99_ms']):>9} {result['queries_per_request']:>8.2f} "
+            f"{result['errors']:>6}"
+        )
+        previous = (baseline or {}).get(name)
+        if not previous:
+            continue
+        deltas = []
+        for key in ("throughput_rps", "p50_ms", "p95_ms", "p99_ms"):
+            if previous.get(key) and result.get(key) is not None:
+                change = (result[key] - previous[key]) / previous[key] * 100
+                deltas.append(f"{key.removesuffix('_ms')} {change:+.1f}%")
+        delta_queries = result["queries_per_request"] - previous["queries_per_request"]
+        deltas.append(f"queries {delta_queries:+.2f}")
+        print(f"{'':<16} vs base: " + ", ".join(deltas))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de carga da API")
+    parser.add_argument(
+        "endpoints",
+        nargs="*",
+        help="Endpoints medidos (padrão: todos): " + ", ".join(ENDPOINTS),
+    )
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--seed", dest="seed_db", action="store_true")
+    parser.add_argument("--datasets-dir", default="datasets")
+    parser.add_argument("--random-seed", type=int, default=42)
+    parser.add_argument(
+        "--no-response-cache",
+        action="store_true",
+        help="Desliga o cache de respostas (mede sempre o caminho até o banco)",
+    )
+    parser.add_argument(
+        "--ml-fallback",
+        action="store_true",
+        help="Não carrega o modelo ML (mede o cálculo legado de probabilidades)",
+    )
+    parser.add_argument("--output", type=Path, help="Grava o resultado em JSON")
+    parser.add_argument("--compare", type=Path, help="JSON de uma execução anterior")
+    args = parser.parse_args()
+
+    if args.no_response_cache:
+        os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+    endpoints = args.endpoints or list(ENDPOINTS)
+    unknown = set(endpoints) - set(ENDPOINTS)
+    if unknown:
+        parser.error(f"Endpoints desconhecidos: {', '.join(sorted(unknown))}")
+
+    print("⏱️  BENCHMARK DA API")
+    print("=" * 60)
+    if args.seed_db:
+        seed_database(args.datasets_dir)
+
+    results = asyncio.run(
+        run_benchmark(
+            endpoints,
+            args.requests,
+            args.concurrency,
+            args.warmup,
+            args.random_seed,
+            args.ml_fallback,
+        )
+    )
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["endpoints"]
+    print_results(results, baseline)
+
+    if args.output:
+        report = {
+            "meta": {
+                "commit": git_commit(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "requests": args.requests,
+                "concurrency": args.concurrency,
+                "warmup": args.warmup,
+                "random_seed": args.random_seed,
+                "response_cache": not args.no_response_cache,
+                "ml_fallback": args.ml_fallback,
+            },
+            "endpoints": results,
+        }
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nResultado salvo em: {args.output}")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
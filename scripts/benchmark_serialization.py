@@ -0,0 +1,210 @@
+"""
+Benchmark da serialização das respostas de simulação
+
+Compara, para payloads típicos de /simulations (simulação com detalhes round
+a round, histórico e recentes), o caminho antigo e o atual:
+
+    antes:   dict com str()/isoformat() -> validação/serialização do
+             response_model=dict -> json.dumps (JSONResponse)
+    depois:  dict nativo (UUID/datetime) -> orjson (ORJSONResponse)
+    cache:   bytes já serializados -> ORJSONResponse sem serializar
+
+Também mede a latência de uma requisição em processo (ASGI) com cada caminho
+para mostrar a fatia da serialização no tempo total.
+
+    python scripts/benchmark_serialization.py --iterations 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.api.responses import ORJSONResponse, dumps
+from app.services.domain.fight_simulation import FightSimulationService
+
+
+def _fighter(name: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        name=name,
+        slpm=4.5,
+        sapm=3.1,
+        str_acc=48,
+        str_def=57,
+        td_avg=1.8,
+        td_acc=40,
+        td_def=70,
+        sub_avg=0.9,
+        striking=85,
+        grappling=78,
+        defense=80,
+        stamina=82,
+        speed=84,
+        strategy=88,
+    )
+
+
+def build_payloads() -> dict[str, object]:
+    """Payloads nativos (como os services retornam agora)"""
+    service = FightSimulationService(None, None)
+    fighter1, fighter2 = _fighter("Islam Makhachev"), _fighter("Charles Oliveira")
+    now = datetime.now(timezone.utc)
+    simulation = {
+        "id": uuid4(),
+        "fighter1_id": fighter1.id,
+        "fighter2_id": fighter2.id,
+        "fighter1_name": fighter1.name,
+        "fighter2_name": fighter2.name,
+        "winner_id": fighter1.id,
+        "winner_name": fighter1.name,
+        "result_type": "Decision",
+        "rounds": 5,
+        "finish_round": None,
+        "fighter1_probability": 61.3,
+        "fighter2_probability": 38.7,
+        "simulation_details": {
+            "rounds": [
+                service._simulate_round(fighter1, fighter2, n) for n in range(1, 6)
+            ]
+        },
+        "notes": None,
+        "created_at": now,
+    }
+    history = {
+        "fighter_id": fighter1.id,
+        "fighter_name": fighter1.name,
+        "statistics": {"total_fights": 100, "wins": 70, "losses": 30},
+        "recent_fights": [
+            {
+                "id": uuid4(),
+                "fighter1_name": fighter1.name,
+                "fighter2_name": fighter2.name,
+                "winner_name": fighter1.name,
+                "result_type": "KO",
+                "rounds": 3,
+                "finish_round": 2,
+                "created_at": now,
+            }
+            for _ in range(100)
+        ],
+        "pagination": {"limit": 100, "offset": 0, "total": 100},
+    }
+    recent = history["recent_fights"][:50]
+    return {"simulation": simulation, "history(100)": history, "recent(50)": recent}
+
+
+def legacy(value):
+    """Formato antigo: ids e datas convertidos manualmente para string"""
+    if isinstance(value, dict):
+        return {key: legacy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [legacy(item) for item in value]
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _timeit(fn, iterations: int) -> float:
+    """Mediana em microssegundos"""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e6
+
+
+def serialization_benchmark(payloads: dict, iterations: int) -> dict:
+    adapter = TypeAdapter(object)
+    results = {}
+    for name, payload in payloads.items():
+        cached = dumps(payload)
+
+        def before():
+            # Formatter antigo + response_model + JSONResponse (json.dumps)
+            content = adapter.dump_python(
+                adapter.validate_python(legacy(payload)), mode="json"
+            )
+            return JSONResponse(content).body
+
+        results[name] = {
+            "bytes": len(cached),
+            "before_us": _timeit(before, iterations),
+            "after_us": _timeit(lambda: ORJSONResponse(payload).body, iterations),
+            "cached_us": _timeit(lambda: ORJSONResponse(cached).body, iterations),
+        }
+    return results
+
+
+def request_benchmark(payloads: dict, iterations: int) -> dict:
+    """Latência de requisição em processo com cada caminho de resposta"""
+    app = FastAPI()
+
+    @app.get("/before/{name}", response_model=object)
+    async def before(name: str):
+        return legacy(payloads[name])
+
+    @app.get("/after/{name}", response_class=ORJSONResponse)
+    async def after(name: str):
+        return ORJSONResponse(payloads[name])
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        results = {}
+        async with httpx.AsyncClient(transport=transport, base_url="http://b") as c:
+            for name in payloads:
+                results[name] = {}
+                for path in ("before", "after"):
+                    samples = []
+                    for _ in range(iterations):
+                        start = time.perf_counter()
+                        await c.get(f"/{path}/{name}")
+                        samples.append(time.perf_counter() - start)
+                    results[name][path] = statistics.median(samples) * 1e6
+        return results
+
+    return asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de serialização JSON")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    payloads = build_payloads()
+    serialization = serialization_benchmark(payloads, args.iterations)
+    requests = request_benchmark(payloads, max(args.iterations // 10, 50))
+
+    print(
+        f"{'payload':<14} {'bytes':>7} {'antes µs':>9} {'depois µs':>10} "
+        f"{'cache µs':>9} {'req antes µs':>13} {'req depois µs':>14} "
+        f"{'fatia antes':>12} {'fatia depois':>13}"
+    )
+    for name, result in serialization.items():
+        request = requests[name]
+        print(
+            f"{name:<14} {result['bytes']:>7} {result['before_us']:>9.1f} "
+            f"{result['after_us']:>10.1f} {result['cached_us']:>9.1f} "
+            f"{request['before']:>13.1f} {request['after']:>14.1f} "
+            f"{result['before_us'] / request['before']:>12.0%} "
+            f"{result['after_us'] / request['after']:>13.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""
+Microbenchmarks da simulação e do ML, com baseline versionado
+
+Mede os caminhos quentes da simulação sem banco, com lutadores reais
+montados em memória a partir de datasets/fighter_details.csv:
+
+    simulate_round            FightSimulationService._simulate_round
+    predict_result_type       FightSimulationService.predict_result_type
+    win_probability_ml        calculate_win_probability com modelo
+    win_probability_fallback  calculate_win_probability sem modelo (legado)
+    feature_differences       MLPredictionService._calculate_feature_differences
+    estimate_ml_stats         _estimate_ml_stats_from_attributes
+    event_card                EventService._simulate_fight num card de 12 lutas
+
+Cada caso é calibrado (como o timeit) e repetido em vários rounds; a mediana
+por operação é comparada com o baseline (scripts/baselines/simulation.json) e
+tempos acima de --threshold contam como regressão (exit code 1). Sem --model
+o caminho ML usa um modelo substituto treinado com o próprio dataset: mede o
+custo do caminho (features, DataFrame, predict_proba), não o do modelo real.
+Logs abaixo de ERROR ficam desligados durante a medição.
+
+Baselines dependem da máquina: gere com --save-baseline no mesmo ambiente em
+que a comparação roda (ex: o runner do CI).
+
+    python scripts/benchmark_simulation.py
+    python scripts/benchmark_simulation.py simulate_round event_card --rounds 30
+    python scripts/benchmark_simulation.py --save-baseline
+"""
+
+import argparse
+import json
+import logging
+import platform
+import random
+import statistics
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+import joblib
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+
+from app.database.models.base import Fight, Fighter
+from app.services.domain.event import EventService
+from app.services.domain.fight_simulation import FightSimulationService
+from app.services.domain.fighter import _estimate_ml_stats_from_attributes
+from app.services.ml.model_loader import MLModelLoader
+from app.services.ml.prediction_service import MLPredictionService
+from scripts.parse_ufc_dataset import parse_fighters, read_csv
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "simulation.json"
+CARD_SIZE = 12
+PAIRS = 256
+MIN_ROUND_SECONDS = 0.02
+
+
+def load_fighters(csv_path: str) -> list[Fighter]:
+    """Lutadores do CSV como objetos Fighter em memória (ids estáveis)"""
+    fighters = []
+    for data in parse_fighters(read_csv(csv_path)):
+        data.pop("import_hash")
+        fighter_id = uuid.uuid5(uuid.NAMESPACE_URL, data["ufcstats_id"])
+        fighters.append(Fighter(id=fighter_id, **data))
+    return fighters
+
+
+def train_stand_in_model(fighters: list[Fighter], rng: random.Random):
+    """Modelo substituto com as mesmas 11 features do modelo real"""
+    rows, labels = [], []
+    for _ in range(2000):
+        fighter1, fighter2 = rng.sample(fighters, 2)
+        features = MLPredictionService._calculate_feature_differences(
+            fighter1, fighter2
+        )
+        rows.append(features)
+        labels.append(int(features["wins_diff"] + rng.gauss(0, 5) > 0))
+    frame = pd.DataFrame(rows, columns=MLPredictionService.FEATURES)
+    return LogisticRegression(max_iter=1000).fit(frame, labels)
+
+
+@contextmanager
+def using_model(model):
+    """Fixa o modelo do loader (None = caminho legado), sem acessar o GCS"""
+    load_model = MLModelLoader.__dict__["load_model"]
+    previous = MLModelLoader._model
+    MLModelLoader._model = model
+    MLModelLoader.load_model = classmethod(lambda cls, force_reload=False: model)
+    try:
+        yield
+    finally:
+        MLModelLoader._model = previous
+        MLModelLoader.load_model = load_model
+
+
+def build_cases(fighters: list[Fighter], model, seed: int) -> dict[str, Callable]:
+    """Casos do benchmark: cada chamada executa uma operação"""
+    rng = random.Random(seed)
+    pairs = [tuple(rng.sample(fighters, 2)) for _ in range(PAIRS)]
+    service = FightSimulationService(None, None)
+    event_service = EventService(None, service)
+    card = [
+        Fight(
+            id=uuid.uuid4(),
+            fighter1=fighter1,
+            fighter1_id=fighter1.id,
+            fighter2=fighter2,
+            fighter2_id=fighter2.id,
+            fight_order=order,
+            rounds=5 if order == 1 else 3,
+        )
+        for order, (fighter1, fighter2) in enumerate(pairs[:CARD_SIZE], start=1)
+    ]
+    cursor = iter(range(sys.maxsize))
+
+    def next_pair() -> tuple[Fighter, Fighter]:
+        return pairs[next(cursor) % PAIRS]
+
+    def win_probability(pair_model):
+        def case():
+            with using_model(pair_model):
+                service.calculate_win_probability(*next_pair())
+
+        return case
+
+    def estimate_ml_stats():
+        fighter = next_pair()[0]
+        _estimate_ml_stats_from_attributes(
+            fighter.striking,
+            fighter.grappling,
+            fighter.defense,
+            fighter.stamina,
+            fighter.speed,
+            fighter.submission_wins or 0,
+            (fighter.wins or 0) + (fighter.losses or 0),
+        )
+
+    def event_card():
+        with using_model(model):
+            for fight in card:
+                event_service._simulate_fight(fight)
+
+    return {
+        "simulate_round": lambda: service._simulate_round(*next_pair(), 1),
+        "predict_result_type": lambda: service.predict_result_type(*next_pair()),
+        "win_probability_ml": win_probability(model),
+        "win_probability_fallback": win_probability(None),
+        "feature_differences": lambda: (
+            MLPredictionService._calculate_feature_differences(*next_pair())
+        ),
+        "estimate_ml_stats": estimate_ml_stats,
+        "event_card": event_card,
+    }
+
+
+def calibrate(case: Callable) -> int:
+    """Quantidade de operações por round para que ele dure MIN_ROUND_SECONDS"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            case()
+        if time.perf_counter() - start >= MIN_ROUND_SECONDS:
+            return number
+        number *= 2
+
+
+def run_case(case: Callable, rounds: int) -> dict:
+    """Estatísticas por operação (µs) de `rounds` rounds calibrados"""
+    number = calibrate(case)
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            case()
+        samples.append((time.perf_counter() - start) / number * 1e6)
+    return {
+        "min_us": round(min(samples), 3),
+        "median_us": round(statistics.median(samples), 3),
+        "mean_us": round(statistics.fmean(samples), 3),
+        "stdev_us": round(statistics.stdev(samples), 3) if rounds > 1 else 0.0,
+        "ops_per_round": number,
+        "rounds": rounds,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> dict[str, float]:
+    """
+    Variação da mediana em relação ao baseline
+
+    Returns:
+        {caso: variação} apenas dos casos acima de `threshold` (0.2 = +20%)
+    """
+    regressions = {}
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        change = result["median_us"] / previous["median_us"] - 1
+        if change > threshold:
+            regressions[name] = change
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmarks da simulação")
+    parser.add_argument("cases", nargs="*", help="Casos medidos (padrão: todos)")
+    parser.add_argument("--rounds", type=int, default=15)
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument(
+        "--model", type=Path, help="Modelo .joblib (padrão: substituto)"
+    )
+    parser.add_argument("--datasets-dir", default="datasets")
+    parser.add_argument("--random-seed", type=int, default=42)
+    args = parser.parse_args()
+
+    fighters = load_fighters(str(Path(args.datasets_dir) / "fighter_details.csv"))
+    random.seed(args.random_seed)
+    if args.model:
+        model = joblib.load(args.model)
+    else:
+        model = train_stand_in_model(fighters, random.Random(args.random_seed))
+    cases = build_cases(fighters, model, args.random_seed)
+
+    unknown = set(args.cases) - set(cases)
+    if unknown:
+        parser.error(f"Casos desconhecidos: {', '.join(sorted(unknown))}")
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["cases"]
+
+    print(f"🔬 MICROBENCHMARKS ({len(fighters)} lutadores em memória)")
+    print("=" * 72)
+    print(
+        f"{'caso':<26} {'mediana µs':>11} {'mín µs':>9} {'desvio µs':>10} "
+        f"{'baseline µs':>12}"
+    )
+
+    results = {}
+    logging.disable(logging.WARNING)
+    try:
+        for name in args.cases or list(cases):
+            results[name] = result = run_case(cases[name], args.rounds)
+            previous = baseline.get(name)
+            versus = ""
+            if previous:
+                change = result["median_us"] / previous["median_us"] - 1
+                versus = f"{previous['median_us']:>12.2f} ({change:+.1%})"
+            print(
+                f"{name:<26} {result['median_us']:>11.2f} {result['min_us']:>9.2f} "
+                f"{result['stdev_us']:>10.2f} {versus}"
+            )
+    finally:
+        logging.disable(logging.NOTSET)
+
+    if args.save_baseline:
+        report = {
+            "meta": {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "model": str(args.model) if args.model else "stand-in",
+            },
+            "cases": {**baseline, **results},
+        }
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nBaseline salvo em: {args.baseline}")
+        return True
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n❌ Regressões acima de {args.threshold:.0%}:")
+        for name, change in regressions.items():
+            print(f"   {name}: {change:+.1%}")
+        return False
+    if baseline:
+        print(f"\n✅ Nenhuma regressão acima de {args.threshold:.0%}")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
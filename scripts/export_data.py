@@ -0,0 +1,117 @@
+"""
+Exporta tabelas em streaming (NDJSON ou CSV), com memória constante
+
+Lê com cursor no servidor, em lotes, e grava um arquivo por tabela. Com
+--since exporta apenas o que mudou desde a data; o cursor impresso no final
+é o --since da próxima execução. Use --database-url (ou EXPORT_DATABASE_URL)
+para ler de uma réplica.
+
+    python scripts/export_data.py fighters fights --format csv
+    python scripts/export_data.py simulations --since 2026-10-01T00:00:00+00:00
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.settings import Settings
+from app.database.exports import ExportEntity, ExportFormat, TableExport
+
+settings = Settings()
+
+
+async def export_tables(
+    entities: list[ExportEntity],
+    export_format: ExportFormat = ExportFormat.ndjson,
+    output_dir: Path = Path("exports"),
+    since: Optional[datetime] = None,
+    database_url: Optional[str] = None,
+    batch_size: Optional[int] = None,
+) -> dict[str, datetime]:
+    """
+    Exporta as tabelas para `output_dir/<tabela>.<formato>`
+
+    Returns:
+        Cursor (próximo `since`) de cada tabela exportada
+    """
+    engine = create_async_engine(
+        database_url or settings.EXPORT_DATABASE_URL or settings.DATABASE_URL
+    )
+    output_dir.mkdir(parents=True, exist_ok=True)
+    cursors = {}
+    try:
+        for entity in entities:
+            path = output_dir / f"{entity.value}.{export_format.value}"
+            async with TableExport(
+                entity, since=since, batch_size=batch_size, engine=engine
+            ) as export:
+                with open(path, "wb") as file:
+                    async for chunk in export.encode(export_format):
+                        file.write(chunk)
+            cursors[entity.value] = export.cursor
+            print(f"✓ {entity.value}: {export.rows} linhas -> {path}")
+    finally:
+        await engine.dispose()
+    return cursors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exportação em streaming")
+    parser.add_argument(
+        "entities",
+        nargs="*",
+        type=ExportEntity,
+        help="Tabelas exportadas (padrão: todas): "
+        + ", ".join(entity.value for entity in ExportEntity),
+    )
+    parser.add_argument(
+        "--format",
+        choices=[export_format.value for export_format in ExportFormat],
+        default=ExportFormat.ndjson.value,
+    )
+    parser.add_argument("--output-dir", type=Path, default=Path("exports"))
+    parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        help="Exporta apenas linhas criadas/alteradas a partir desta data (ISO)",
+    )
+    parser.add_argument(
+        "--database-url", help="URL asyncpg (ex: réplica de leitura)", default=None
+    )
+    parser.add_argument("--batch-size", type=int, default=settings.EXPORT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    entities = args.entities or list(ExportEntity)
+
+    print("📦 EXPORTAÇÃO EM STREAMING")
+    print("=" * 60)
+    try:
+        cursors = asyncio.run(
+            export_tables(
+                entities,
+                export_format=ExportFormat(args.format),
+                output_dir=args.output_dir,
+                since=args.since,
+                database_url=args.database_url,
+                batch_size=args.batch_size,
+            )
+        )
+    except Exception as e:
+        print(f"\n❌ Erro ao exportar dados: {str(e)}")
+        return False
+
+    print("=" * 60)
+    print(f"Próximo --since: {min(cursors.values()).isoformat()}")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,117 @@
+"""
+Relatório de tempo de import (python -X importtime) e orçamento de startup
+
+Importa o módulo em um interpretador novo (várias vezes, fica o menor
+tempo), mostra os módulos com maior tempo acumulado e os pacotes de
+terceiros mais caros, e falha (exit 1) se o import passar do orçamento ou
+carregar algum pacote proibido. Sem CI: rode antes de abrir o PR.
+
+    python scripts/import_time_report.py                  # app.main
+    python scripts/import_time_report.py app.core.settings --top 15
+    python scripts/import_time_report.py --budget-ms 2500 --forbid pandas,gcsfs
+    make import-budget
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Dependências pesadas que só devem ser importadas sob demanda
+DEFAULT_FORBIDDEN = ("pandas", "gcsfs", "joblib", "sklearn", "alembic")
+
+
+def measure(module: str) -> tuple[list[tuple[str, int, int, int]], set[str]]:
+    """
+    Importa `module` num processo novo
+
+    Returns:
+        (linhas, módulos carregados); cada linha é (nome, profundidade,
+        self_us, acumulado_us), na ordem do -X importtime
+    """
+    code = f"import sys, {module}; print('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"Falha ao importar {module}:\n{result.stderr[-2000:]}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return rows, set(result.stdout.split())
+
+
+def total_ms(rows) -> float:
+    return sum(cumulative for _, depth, _, cumulative in rows if depth == 0) / 1000
+
+
+def packages(rows) -> dict[str, int]:
+    """Tempo próprio somado por pacote de topo (us)"""
+    totals: dict[str, int] = defaultdict(int)
+    for name, _, self_us, _ in rows:
+        totals[name.split(".")[0]] += self_us
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Auditoria do tempo de import")
+    parser.add_argument("module", nargs="?", default="app.main")
+    parser.add_argument("--runs", type=int, default=3, help="Fica a mais rápida")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument(
+        "--budget-ms", type=float, default=0, help="Falha acima disso (0 = sem)"
+    )
+    parser.add_argument(
+        "--forbid",
+        default=",".join(DEFAULT_FORBIDDEN),
+        help="Pacotes que não podem ser carregados no import (vírgula)",
+    )
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(max(args.runs, 1))]
+    rows, loaded = min(runs, key=lambda run: total_ms(run[0]))
+    elapsed = total_ms(rows)
+
+    print(f"⏱️  import {args.module}: {elapsed:.0f} ms ({len(rows)} módulos)")
+    print("=" * 60)
+    print(f"{'acumulado':>10} {'próprio':>9}  módulo")
+    for name, depth, self_us, cumulative in sorted(
+        rows, key=lambda row: row[3], reverse=True
+    )[: args.top]:
+        print(f"{cumulative / 1000:>8.1f}ms {self_us / 1000:>7.1f}ms  {name}")
+
+    print("\nPacotes (tempo próprio somado):")
+    for name, self_us in sorted(
+        packages(rows).items(), key=lambda item: item[1], reverse=True
+    )[:10]:
+        print(f"  {self_us / 1000:>8.1f}ms  {name}")
+
+    ok = True
+    forbidden = [name for name in args.forbid.split(",") if name]
+    loaded_forbidden = sorted(name for name in forbidden if name in loaded)
+    if loaded_forbidden:
+        ok = False
+        print(f"\n❌ Pacotes carregados no import: {', '.join(loaded_forbidden)}")
+    if args.budget_ms and elapsed > args.budget_ms:
+        ok = False
+        print(f"\n❌ Acima do orçamento: {elapsed:.0f} ms > {args.budget_ms:.0f} ms")
+    if ok:
+        print("\n✅ Dentro do orçamento")
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -1,32 +1,68 @@
 """
 Script de importação do dataset UFC completo
 Importa dados de events, fights e fighters mantendo relacionamentos via IDs
+
+A importação é incremental: cada linha guarda um hash do conteúdo
+(`import_hash`) ao lado do `ufcstats_id`, e só é regravada quando o hash
+muda. O progresso de cada etapa fica em `import_checkpoints`; se a importação
+falhar, a próxima execução com o mesmo arquivo retoma do último bloco gravado.
+
+    python scripts/import_ufc_dataset.py
+    python scripts/import_ufc_dataset.py --report import_diff.json
+    python scripts/import_ufc_dataset.py --force
 """
 
-import csv
+import argparse
+import json
 import sys
 import uuid
 from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterable, Iterator, Optional, Set, Tuple
 
 # Adicionar o diretório raiz ao path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from sqlalchemy import create_engine
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, func
 from sqlalchemy.orm import sessionmaker
 
+from app.core.metrics import IMPORT_PROGRESS, IMPORT_ROWS
 from app.core.settings import Settings
-from app.database.models.base import Event, Fight, Fighter, User
+from app.database.models.base import Event, Fight, Fighter, ImportCheckpoint, User
+from scripts.parse_ufc_dataset import (
+    column,
+    file_hash,
+    latest_weight_classes,
+    parse_events,
+    parse_fighters,
+    parse_fights,
+    read_batches,
+    read_csv,
+)
 
 settings = Settings()
 
+# Linhas gravadas entre dois checkpoints (um commit por bloco)
+CHECKPOINT_EVERY = 500
+
+CREATED = "created"
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+COMPLETED = "completed"
+
 
 class UFCDatasetImporter:
     """Importador do dataset UFC com mapeamento de IDs"""
 
-    def __init__(self, db_session):
+    def __init__(self, db_session, force: bool = False, workers: int = 0):
         self.session = db_session
+        # Ignora hashes e checkpoints (reimporta tudo)
+        self.force = force
+        # Processos de parse dos CSVs (0: parse numa thread, à frente da gravação)
+        self.workers = workers
 
         # Mapas para converter IDs do ufcstats para UUIDs do banco
         self.fighter_id_map: Dict[str, uuid.UUID] = {}
@@ -35,12 +71,22 @@ class UFCDatasetImporter:
 
         # Estatísticas de importação
         self.stats = {
-            "fighters_created": 0,
-            "fighters_updated": 0,
-            "events_created": 0,
-            "fights_created": 0,
-            "errors": [],
+            f"{entity}_{change}": 0
+            for entity in ("fighters", "events", "fights")
+            for change in (CREATED, UPDATED, UNCHANGED)
         }
+        self.stats.update({"skipped_steps": [], "errors": []})
+
+        # Relatório de diferenças: ufcstats_id criados/alterados por entidade
+        self.diff = {
+            entity: {CREATED: [], UPDATED: []}
+            for entity in ("fighters", "events", "fights")
+        }
+        self.changed: Dict[str, Set[str]] = {entity: set() for entity in self.diff}
+        # Lutadores cujo cartel precisa ser recalculado
+        self.changed_fighter_ids: Set[uuid.UUID] = set()
+        # Retomando uma importação que falhou: etapas derivadas rodam completas
+        self.interrupted = False
 
     def get_or_create_system_user(self) -> User:
         """Obtém ou cria usuário do sistema para criação de lutadores reais"""
@@ -60,429 +106,384 @@ class UFCDatasetImporter:
             print("✓ Usuário do sistema criado")
         return user
 
-    def parse_date(self, date_str: str) -> Optional[datetime]:
-        """Converte string de data para datetime"""
-        if not date_str or date_str.strip() == "":
-            return None
+    def _read_rows(self, csv_path: str, parse: Callable) -> Iterator[dict]:
+        """Linhas tipadas do CSV, convertidas em lotes à frente da gravação"""
+        batches = read_batches(csv_path, parse, workers=self.workers)
+        return chain.from_iterable(batches)
+
+    def _known(self, model) -> Dict[str, Tuple[uuid.UUID, Optional[str]]]:
+        """
+        ufcstats_id -> (id, import_hash) dos registros já importados
+
+        Com `force`, o hash volta vazio e toda linha é regravada.
+        """
+        rows = self.session.query(
+            model.ufcstats_id, model.id, model.import_hash
+        ).filter(model.ufcstats_id.isnot(None))
+        return {
+            ufcstats_id: (id, None if self.force else digest)
+            for ufcstats_id, id, digest in rows
+        }
 
-        try:
-            # Formato: "September 06, 2025" ou "May 08, 1982"
-            return datetime.strptime(date_str.strip(), "%B %d, %Y").replace(
-                tzinfo=timezone.utc
-            )
-        except ValueError:
-            try:
-                # Tentar outros formatos comuns
-                return datetime.strptime(date_str.strip(), "%Y-%m-%d").replace(
-                    tzinfo=timezone.utc
-                )
-            except ValueError:
+    def _record(self, entity: str, ufcstats_id: str, change: str):
+        """Registra o resultado de uma linha no relatório de diferenças"""
+        self.stats[f"{entity}_{change}"] += 1
+        IMPORT_ROWS.labels(entity, change).inc()
+        if change == UNCHANGED:
+            return
+        self.diff[entity][change].append(ufcstats_id)
+        self.changed[entity].add(ufcstats_id)
+
+    def _start_step(self, step: str, csv_path: str) -> Optional[int]:
+        """
+        Inicia (ou retoma) uma etapa com checkpoint
+
+        Returns:
+            Quantidade de linhas já gravadas a pular, ou None se o arquivo
+            não mudou desde a última importação completa da etapa
+        """
+        digest = file_hash(csv_path)
+        checkpoint = self.session.get(ImportCheckpoint, step)
+        if checkpoint and checkpoint.status != COMPLETED:
+            # As mudanças da execução interrompida não estão em self.changed
+            self.interrupted = True
+        if checkpoint and checkpoint.file_hash == digest and not self.force:
+            if checkpoint.status == COMPLETED:
+                print(f"  ⏭️  {csv_path} inalterado desde a última importação")
+                self.stats["skipped_steps"].append(step)
                 return None
-
-    def safe_float(self, value: str) -> Optional[float]:
-        """Converte string para float com tratamento de erros"""
-        if not value or value.strip() == "" or value.strip() == "--":
-            return None
-        try:
-            return float(value.strip())
-        except (ValueError, AttributeError):
+            print(f"  ↩️  Retomando a partir da linha {checkpoint.rows_done + 1}")
+            return checkpoint.rows_done
+
+        if checkpoint is None:
+            checkpoint = ImportCheckpoint(step=step)
+            self.session.add(checkpoint)
+        checkpoint.file_hash = digest
+        checkpoint.rows_done = 0
+        checkpoint.status = "running"
+        self.session.commit()
+        return 0
+
+    def _save_checkpoint(self, step: str, rows_done: int, completed: bool = False):
+        """Grava o progresso da etapa na mesma transação das linhas"""
+        checkpoint = self.session.get(ImportCheckpoint, step)
+        checkpoint.rows_done = rows_done
+        if completed:
+            checkpoint.status = COMPLETED
+        self.session.commit()
+        IMPORT_PROGRESS.labels(step).set(rows_done)
+
+    def _derived_scope(
+        self, step: str, csv_path: Optional[str], has_changes: bool
+    ) -> Optional[bool]:
+        """
+        Escopo de uma etapa derivada (vencedores, nomes, cartéis, categorias)
+
+        Returns:
+            True para reprocessar tudo (arquivo mudou, --force ou execução
+            anterior interrompida), False para processar só o que mudou nesta
+            importação, None para pular a etapa
+        """
+        digest = file_hash(csv_path) if csv_path else ""
+        checkpoint = self.session.get(ImportCheckpoint, step)
+        full = (
+            self.force
+            or self.interrupted
+            or not (
+                checkpoint
+                and checkpoint.status == COMPLETED
+                and checkpoint.file_hash == digest
+            )
+        )
+        if not full and not has_changes:
+            self.stats["skipped_steps"].append(step)
             return None
 
-    def safe_int(self, value: str) -> Optional[int]:
-        """Converte string para int com tratamento de erros"""
-        if not value or value.strip() == "" or value.strip() == "--":
-            return None
-        try:
-            return int(float(value.strip()))
-        except (ValueError, AttributeError):
-            return None
+        if checkpoint is None:
+            checkpoint = ImportCheckpoint(step=step)
+            self.session.add(checkpoint)
+        checkpoint.file_hash = digest
+        checkpoint.rows_done = 0
+        checkpoint.status = "running"
+        self.session.commit()
+        return full
+
+    def _import_rows(
+        self, step: str, csv_path: str, rows: Iterable[dict], handle_row: Callable
+    ):
+        """
+        Processa as linhas de uma etapa com checkpoint a cada CHECKPOINT_EVERY
+
+        Linhas já gravadas numa execução interrompida (mesmo arquivo) são
+        puladas. Cada linha roda num savepoint: uma linha com erro não desfaz
+        as demais, e a etapa não é marcada como concluída (a próxima execução
+        tenta de novo as linhas que falharam).
+        """
+        offset = self._start_step(step, csv_path)
+        if offset is None:
+            return
+
+        rows_done = 0
+        # Primeira linha com erro: o checkpoint não avança além dela
+        failed_at: Optional[int] = None
+        for rows_done, row in enumerate(rows, start=1):
+            if rows_done <= offset:
+                continue
+            try:
+                with self.session.begin_nested():
+                    handle_row(row)
+            except Exception as e:
+                error_msg = f"Erro ao importar {step} (linha {rows_done}): {str(e)}"
+                self.stats["errors"].append(error_msg)
+                print(f"  ⚠️  {error_msg}")
+                if failed_at is None:
+                    failed_at = rows_done
+                continue
 
-    def parse_time_to_seconds(self, time_str: str) -> Optional[int]:
-        """Converte tempo MM:SS para segundos totais"""
-        if not time_str or time_str.strip() == "":
-            return None
-        try:
-            parts = time_str.split(":")
-            if len(parts) == 2:
-                minutes = int(parts[0])
-                seconds = int(parts[1])
-                return minutes * 60 + seconds
-        except Exception:
-            return None
-        return None
+            if rows_done % CHECKPOINT_EVERY == 0:
+                checkpoint = rows_done if failed_at is None else failed_at - 1
+                self._save_checkpoint(step, checkpoint)
+                print(f"  ⏳ Processadas {rows_done} linhas...")
+
+        if failed_at is None:
+            self._save_checkpoint(step, rows_done, completed=True)
+        else:
+            self._save_checkpoint(step, failed_at - 1)
 
     def import_fighters(self, csv_path: str, system_user: User):
         """Importa lutadores do fighter_details.csv"""
         print(f"\n📥 Importando lutadores de {csv_path}...")
 
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                try:
-                    ufcstats_id = row["id"].strip()
-
-                    # Verificar se já existe
-                    existing = (
-                        self.session.query(Fighter)
-                        .filter_by(ufcstats_id=ufcstats_id)
-                        .first()
-                    )
+        known = self._known(Fighter)
+        self.fighter_id_map.update(
+            {ufcstats_id: id for ufcstats_id, (id, _) in known.items()}
+        )
 
-                    # Converter altura e alcance de cm
-                    height_cm = self.safe_float(row.get("height"))
-                    reach_cm = self.safe_float(row.get("reach"))
-
-                    # Calcular atributos baseados nas estatísticas
-                    slpm = self.safe_float(row.get("splm"))
-                    str_acc = self.safe_float(row.get("str_acc"))
-                    sapm = self.safe_float(row.get("sapm"))
-                    str_def = self.safe_float(row.get("str_def"))
-                    td_avg = self.safe_float(row.get("td_avg"))
-                    td_acc = self.safe_float(row.get("td_avg_acc"))
-                    td_def = self.safe_float(row.get("td_def"))
-                    sub_avg = self.safe_float(row.get("sub_avg"))
-
-                    # Calcular atributos de 0-100 baseados nas stats
-                    striking = min(100, int((slpm or 0) * 10 + (str_acc or 50)))
-                    grappling = min(
-                        100, int((td_avg or 0) * 20 + (sub_avg or 0) * 30 + 30)
-                    )
-                    defense = min(100, int((str_def or 50) + (td_def or 50)) // 2)
-
-                    wins = self.safe_int(row.get("wins")) or 0
-                    losses = self.safe_int(row.get("losses")) or 0
-                    total_fights = wins + losses
-
-                    # Estimar stamina baseado no histórico
-                    stamina = min(100, 50 + total_fights)
-                    speed = min(100, int((slpm or 3) * 15))
-                    strategy = min(100, 50 + total_fights // 2)
-
-                    fighter_data = {
-                        "ufcstats_id": ufcstats_id,
-                        "name": row["name"].strip(),
-                        "nickname": row.get("nick_name", "").strip() or None,
-                        "date_of_birth": self.parse_date(row.get("dob")),
-                        "stance": row.get("stance", "").strip() or None,
-                        "height_cm": height_cm,
-                        "reach_cm": reach_cm,
-                        "weight_lbs": self.safe_float(row.get("weight")),
-                        "wins": wins,
-                        "losses": losses,
-                        "draws": self.safe_int(row.get("draws")) or 0,
-                        "slpm": slpm,
-                        "str_acc": str_acc,
-                        "sapm": sapm,
-                        "str_def": str_def,
-                        "td_avg": td_avg,
-                        "td_acc": td_acc,
-                        "td_def": td_def,
-                        "sub_avg": sub_avg,
-                        "striking": striking,
-                        "grappling": grappling,
-                        "defense": defense,
-                        "stamina": stamina,
-                        "speed": speed,
-                        "strategy": strategy,
-                        "is_real": True,
-                        "last_organization_fight": "UFC",
-                        "creator_id": system_user.id,
-                        "updated_by": "import_script",
-                    }
+        def handle_row(fighter_data: dict):
+            ufcstats_id = fighter_data["ufcstats_id"]
+            existing_id, existing_hash = known.get(ufcstats_id, (None, None))
+            if existing_id and existing_hash == fighter_data["import_hash"]:
+                self._record("fighters", ufcstats_id, UNCHANGED)
+                return
+
+            fighter_data.update(
+                is_real=True,
+                last_organization_fight="UFC",
+                updated_by="import_script",
+            )
 
-                    if existing:
-                        # Atualizar lutador existente
-                        for key, value in fighter_data.items():
-                            if key != "creator_id":  # Não alterar o criador
-                                setattr(existing, key, value)
-                        self.fighter_id_map[ufcstats_id] = existing.id
-                        self.stats["fighters_updated"] += 1
-                    else:
-                        # Criar novo lutador
-                        fighter = Fighter(**fighter_data)
-                        self.session.add(fighter)
-                        self.session.flush()
-                        self.fighter_id_map[ufcstats_id] = fighter.id
-                        self.stats["fighters_created"] += 1
-
-                    if (
-                        self.stats["fighters_created"] + self.stats["fighters_updated"]
-                    ) % 100 == 0:
-                        print(
-                            f"  ⏳ Processados {self.stats['fighters_created'] + self.stats['fighters_updated']} lutadores..."
-                        )
-                        self.session.commit()
-
-                except Exception as e:
-                    error_msg = f"Erro ao importar lutador {row.get('name', 'Unknown')}: {str(e)}"
-                    self.stats["errors"].append(error_msg)
-                    print(f"  ⚠️  {error_msg}")
-                    continue
+            if existing_id:
+                # Atualizar lutador existente (sem alterar o criador)
+                fighter = self.session.get(Fighter, existing_id)
+                for key, value in fighter_data.items():
+                    setattr(fighter, key, value)
+                self._record("fighters", ufcstats_id, UPDATED)
+            else:
+                # Criar novo lutador
+                fighter = Fighter(**fighter_data, creator_id=system_user.id)
+                self.session.add(fighter)
+                self.session.flush()
+                self.fighter_id_map[ufcstats_id] = fighter.id
+                self._record("fighters", ufcstats_id, CREATED)
+            self.changed_fighter_ids.add(fighter.id)
 
-            self.session.commit()
+        rows = self._read_rows(csv_path, parse_fighters)
+        self._import_rows("fighters", csv_path, rows, handle_row)
 
         print(
-            f"✓ Lutadores importados: {self.stats['fighters_created']} criados, {self.stats['fighters_updated']} atualizados"
+            f"✓ Lutadores importados: {self.stats['fighters_created']} criados, "
+            f"{self.stats['fighters_updated']} atualizados, "
+            f"{self.stats['fighters_unchanged']} inalterados"
         )
 
     def import_events(self, csv_path: str, system_user: User):
         """Importa eventos do event_details.csv"""
         print(f"\n📥 Importando eventos de {csv_path}...")
 
-        events_data = {}
-
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                try:
-                    event_id = row["event_id"].strip()
-
-                    # Agrupar por evento
-                    if event_id not in events_data:
-                        events_data[event_id] = {
-                            "location": row.get("location", "").strip(),
-                            "date": self.parse_date(row.get("date")),
-                            "fights": [],
-                        }
-
-                    # Adicionar luta ao evento
-                    events_data[event_id]["fights"].append(
-                        {
-                            "fight_id": row["fight_id"].strip(),
-                            "winner_id": row.get("winner_id", "").strip(),
-                        }
-                    )
-
-                except Exception as e:
-                    error_msg = f"Erro ao processar evento {row.get('event_id', 'Unknown')}: {str(e)}"
-                    self.stats["errors"].append(error_msg)
-                    print(f"  ⚠️  {error_msg}")
-                    continue
-
-        # Criar eventos
-        for event_id, event_data in events_data.items():
-            try:
-                existing = (
-                    self.session.query(Event).filter_by(ufcstats_id=event_id).first()
-                )
-
-                if not existing:
-                    event = Event(
-                        ufcstats_id=event_id,
-                        name=f"UFC Event {event_id[:8]}",  # Nome temporário
-                        date=event_data["date"] or datetime.now(timezone.utc),
-                        location=event_data["location"],
-                        organization="UFC",
-                        status="completed",
-                        creator_id=system_user.id,
-                        created_by="import_script",
-                        updated_by="import_script",
-                    )
-                    self.session.add(event)
-                    self.session.flush()
-                    self.event_id_map[event_id] = event.id
-                    self.stats["events_created"] += 1
-                else:
-                    self.event_id_map[event_id] = existing.id
+        known = self._known(Event)
+        self.event_id_map.update(
+            {ufcstats_id: id for ufcstats_id, (id, _) in known.items()}
+        )
 
-            except Exception as e:
-                error_msg = f"Erro ao criar evento {event_id}: {str(e)}"
-                self.stats["errors"].append(error_msg)
-                print(f"  ⚠️  {error_msg}")
-                continue
+        def handle_event(event_data: dict):
+            event_id = event_data["event_id"]
+            digest = event_data["import_hash"]
+            existing_id, existing_hash = known.get(event_id, (None, None))
+            if existing_id and existing_hash == digest:
+                self._record("events", event_id, UNCHANGED)
+                return
+
+            date = event_data["date"] or datetime.now(timezone.utc)
+            if existing_id:
+                event = self.session.get(Event, existing_id)
+                event.date = date
+                event.location = event_data["location"]
+                event.import_hash = digest
+                event.updated_by = "import_script"
+                self._record("events", event_id, UPDATED)
+                return
+
+            event = Event(
+                ufcstats_id=event_id,
+                name=f"UFC Event {event_id[:8]}",  # Nome temporário
+                date=date,
+                location=event_data["location"],
+                organization="UFC",
+                status="completed",
+                creator_id=system_user.id,
+                import_hash=digest,
+                created_by="import_script",
+                updated_by="import_script",
+            )
+            self.session.add(event)
+            self.session.flush()
+            self.event_id_map[event_id] = event.id
+            self._record("events", event_id, CREATED)
+
+        # Uma linha por luta: agrupa por evento antes de importar
+        events = parse_events(
+            read_csv(csv_path, usecols=["event_id", "location", "date"])
+        )
+        self._import_rows("events", csv_path, events, handle_event)
 
-        self.session.commit()
-        print(f"✓ Eventos importados: {self.stats['events_created']}")
+        print(
+            f"✓ Eventos importados: {self.stats['events_created']} criados, "
+            f"{self.stats['events_updated']} atualizados, "
+            f"{self.stats['events_unchanged']} inalterados"
+        )
 
     def import_fights(self, csv_path: str):
         """Importa lutas do fight_details.csv"""
         print(f"\n📥 Importando lutas de {csv_path}...")
 
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-
-            fight_order = {}  # Para rastrear ordem das lutas por evento
-
-            for row in reader:
-                try:
-                    fight_id = row["fight_id"].strip()
-                    event_id = row["event_id"].strip()
+        known = self._known(Fight)
+        self.fight_id_map.update(
+            {ufcstats_id: id for ufcstats_id, (id, _) in known.items()}
+        )
 
-                    # Verificar se já existe
-                    existing = (
-                        self.session.query(Fight)
-                        .filter_by(ufcstats_id=fight_id)
-                        .first()
-                    )
+        # Próxima posição no card de cada evento (lutas novas vão para o fim)
+        fight_order = dict(
+            self.session.query(Fight.event_id, func.max(Fight.fight_order)).group_by(
+                Fight.event_id
+            )
+        )
 
-                    if existing:
-                        continue
-
-                    # Mapear IDs
-                    r_id = row.get("r_id", "").strip()
-                    b_id = row.get("b_id", "").strip()
-
-                    if (
-                        r_id not in self.fighter_id_map
-                        or b_id not in self.fighter_id_map
-                    ):
-                        continue
-
-                    if event_id not in self.event_id_map:
-                        continue
-
-                    fighter1_uuid = self.fighter_id_map[r_id]
-                    fighter2_uuid = self.fighter_id_map[b_id]
-                    event_uuid = self.event_id_map[event_id]
-
-                    # Determinar ordem da luta no evento
-                    if event_uuid not in fight_order:
-                        fight_order[event_uuid] = 1
-                    else:
-                        fight_order[event_uuid] += 1
-
-                    # Obter método da luta
-                    method = row.get("method", "").strip()
-
-                    # Normalizar método
-                    result_type = None
-                    if "KO" in method or "TKO" in method:
-                        result_type = "KO/TKO"
-                    elif "Submission" in method or "Sub" in method:
-                        result_type = "Submission"
-                    elif "Decision" in method:
-                        result_type = "Decision"
-                    elif "Draw" in method:
-                        result_type = "Draw"
-
-                    fight_data = {
-                        "ufcstats_id": fight_id,
-                        "event_id": event_uuid,
-                        "fighter1_id": fighter1_uuid,
-                        "fighter2_id": fighter2_uuid,
-                        "fight_order": fight_order[event_uuid],
-                        "weight_class": row.get("division", "").strip() or None,
-                        "rounds": self.safe_int(row.get("total_rounds")) or 3,
-                        "is_title_fight": bool(self.safe_int(row.get("title_fight"))),
-                        "result_type": result_type,
-                        "finish_round": self.safe_int(row.get("finish_round")),
-                        "match_time_seconds": self.safe_int(row.get("match_time_sec")),
-                        "referee": row.get("referee", "").strip() or None,
-                        "method_details": method,
-                        "status": "completed",
-                        # Estatísticas Red Corner (fighter1)
-                        "r_kd": self.safe_int(row.get("r_kd")),
-                        "r_sig_str_landed": self.safe_int(row.get("r_sig_str_landed")),
-                        "r_sig_str_attempted": self.safe_int(
-                            row.get("r_sig_str_atmpted")
-                        ),
-                        "r_total_str_landed": self.safe_int(
-                            row.get("r_total_str_landed")
-                        ),
-                        "r_total_str_attempted": self.safe_int(
-                            row.get("r_total_str_atmpted")
-                        ),
-                        "r_td_landed": self.safe_int(row.get("r_td_landed")),
-                        "r_td_attempted": self.safe_int(row.get("r_td_atmpted")),
-                        "r_sub_att": self.safe_int(row.get("r_sub_att")),
-                        "r_ctrl_seconds": self.parse_time_to_seconds(
-                            row.get("r_ctrl", "")
-                        ),
-                        # Estatísticas Blue Corner (fighter2)
-                        "b_kd": self.safe_int(row.get("b_kd")),
-                        "b_sig_str_landed": self.safe_int(row.get("b_sig_str_landed")),
-                        "b_sig_str_attempted": self.safe_int(
-                            row.get("b_sig_str_atmpted")
-                        ),
-                        "b_total_str_landed": self.safe_int(
-                            row.get("b_total_str_landed")
-                        ),
-                        "b_total_str_attempted": self.safe_int(
-                            row.get("b_total_str_atmpted")
-                        ),
-                        "b_td_landed": self.safe_int(row.get("b_td_landed")),
-                        "b_td_attempted": self.safe_int(row.get("b_td_atmpted")),
-                        "b_sub_att": self.safe_int(row.get("b_sub_att")),
-                        "b_ctrl_seconds": self.parse_time_to_seconds(
-                            row.get("b_ctrl", "")
-                        ),
-                        "created_by": "import_script",
-                        "updated_by": "import_script",
-                    }
+        def handle_row(fight_data: dict):
+            fight_id = fight_data["ufcstats_id"]
+            existing_id, existing_hash = known.get(fight_id, (None, None))
+            if existing_id and existing_hash == fight_data["import_hash"]:
+                self._record("fights", fight_id, UNCHANGED)
+                return
+
+            # Mapear IDs
+            r_id = fight_data.pop("r_id")
+            b_id = fight_data.pop("b_id")
+            event_id = fight_data.pop("event_id")
+
+            if r_id not in self.fighter_id_map or b_id not in self.fighter_id_map:
+                return
+
+            if event_id not in self.event_id_map:
+                return
+
+            fight_data.update(
+                event_id=self.event_id_map[event_id],
+                fighter1_id=self.fighter_id_map[r_id],
+                fighter2_id=self.fighter_id_map[b_id],
+                status="completed",
+                updated_by="import_script",
+            )
 
-                    fight = Fight(**fight_data)
-                    self.session.add(fight)
-                    self.fight_id_map[fight_id] = fight.id
-                    self.stats["fights_created"] += 1
+            if existing_id:
+                fight = self.session.get(Fight, existing_id)
+                for key, value in fight_data.items():
+                    setattr(fight, key, value)
+                self._record("fights", fight_id, UPDATED)
+            else:
+                # Determinar ordem da luta no evento
+                event_uuid = fight_data["event_id"]
+                fight_order[event_uuid] = (fight_order.get(event_uuid) or 0) + 1
+                fight = Fight(
+                    **fight_data,
+                    fight_order=fight_order[event_uuid],
+                    created_by="import_script",
+                )
+                self.session.add(fight)
+                self.session.flush()
+                self.fight_id_map[fight_id] = fight.id
+                self._record("fights", fight_id, CREATED)
+            self.changed_fighter_ids.update((fight.fighter1_id, fight.fighter2_id))
 
-                    if self.stats["fights_created"] % 100 == 0:
-                        print(
-                            f"  ⏳ Processadas {self.stats['fights_created']} lutas..."
-                        )
-                        self.session.commit()
+        rows = self._read_rows(csv_path, parse_fights)
+        self._import_rows("fights", csv_path, rows, handle_row)
 
-                except Exception as e:
-                    error_msg = f"Erro ao importar luta {row.get('fight_id', 'Unknown')}: {str(e)}"
-                    self.stats["errors"].append(error_msg)
-                    print(f"  ⚠️  {error_msg}")
-                    continue
+        print(
+            f"✓ Lutas importadas: {self.stats['fights_created']} criadas, "
+            f"{self.stats['fights_updated']} atualizadas, "
+            f"{self.stats['fights_unchanged']} inalteradas"
+        )
 
-            self.session.commit()
+    def populate_fight_winners(
+        self, csv_path: str = "UFC.csv", fight_ids: Optional[Set[str]] = None
+    ) -> bool:
+        """
+        Popula o campo winner_id das lutas baseado no UFC.csv
 
-        print(f"✓ Lutas importadas: {self.stats['fights_created']}")
+        Com `fight_ids` (ufcstats_id), atualiza apenas essas lutas.
 
-    def populate_fight_winners(self, csv_path: str = "UFC.csv"):
-        """Popula o campo winner_id das lutas baseado no UFC.csv"""
+        Returns:
+            Se os vencedores foram populados
+        """
         print(f"\n🏆 Populando vencedores das lutas de {csv_path}...")
 
         try:
-            import pandas as pd
-
-            df = pd.read_csv(csv_path)
-
-            updated_count = 0
-            no_winner_count = 0
-            not_found_count = 0
-
-            for _, row in df.iterrows():
-                fight_id = str(row.get("fight_id", "")).strip()
-                winner_name = str(row.get("winner", "")).strip()
-                r_name = str(row.get("r_name", "")).strip()  # Red corner (fighter1)
-                b_name = str(row.get("b_name", "")).strip()  # Blue corner (fighter2)
-
-                if not fight_id or fight_id == "nan":
-                    continue
-
-                # Buscar luta no banco
-                fight = (
-                    self.session.query(Fight).filter_by(ufcstats_id=fight_id).first()
-                )
-
-                if not fight:
-                    not_found_count += 1
-                    continue
-
-                # Determinar winner_id baseado no nome do vencedor
-                if winner_name and winner_name != "nan":
-                    if winner_name == r_name:
-                        # Red corner (fighter1) venceu
-                        fight.winner_id = fight.fighter1_id
-                        updated_count += 1
-                    elif winner_name == b_name:
-                        # Blue corner (fighter2) venceu
-                        fight.winner_id = fight.fighter2_id
-                        updated_count += 1
-                    else:
-                        # Nome não bate - pode ser empate ou NC
-                        no_winner_count += 1
-                else:
-                    # Sem vencedor - empate ou NC
-                    no_winner_count += 1
-
-                if (updated_count + no_winner_count) % 500 == 0:
-                    self.session.commit()
+            frame = read_csv(
+                csv_path, usecols=["fight_id", "winner", "r_name", "b_name"]
+            )
+            results = pd.DataFrame(
+                {
+                    "fight_id": column(frame, "fight_id"),
+                    "winner": column(frame, "winner"),
+                }
+            )
+            # Corner vencedor: red (fighter1), blue (fighter2) ou nenhum
+            # (sem vencedor ou nome que não bate: empate/NC)
+            results["corner"] = np.select(
+                [
+                    (results["winner"] != "")
+                    & (results["winner"] == column(frame, "r_name")),
+                    (results["winner"] != "")
+                    & (results["winner"] == column(frame, "b_name")),
+                ],
+                ["r", "b"],
+                default="",
+            )
+            results = results[results["fight_id"] != ""]
+            if fight_ids is not None:
+                results = results[results["fight_id"].isin(fight_ids)]
+
+            # Lutas já no banco, carregadas de uma vez (evita uma query por linha)
+            query = self.session.query(Fight).filter(Fight.ufcstats_id.isnot(None))
+            if fight_ids is not None:
+                query = query.filter(Fight.ufcstats_id.in_(fight_ids))
+            fights = {fight.ufcstats_id: fight for fight in query}
+
+            found = results["fight_id"].isin(fights.keys())
+            not_found_count = int((~found).sum())
+            results = results[found]
+            updated_count = int((results["corner"] != "").sum())
+            no_winner_count = len(results) - updated_count
+
+            winners = results.loc[results["corner"] != "", ["fight_id", "corner"]]
+            for fight_id, corner in winners.itertuples(index=False, name=None):
+                fight = fights[fight_id]
+                winner_id = fight.fighter1_id if corner == "r" else fight.fighter2_id
+                if fight.winner_id != winner_id:
+                    fight.winner_id = winner_id
+                    # O cartel dos dois lutadores muda junto
+                    self.changed_fighter_ids.update(
+                        (fight.fighter1_id, fight.fighter2_id)
+                    )
 
             self.session.commit()
 
@@ -491,21 +492,25 @@ class UFCDatasetImporter:
             print(f"  • {no_winner_count} lutas sem vencedor (empate/NC)")
             if not_found_count > 0:
                 print(f"  ⚠️  {not_found_count} lutas não encontradas no banco")
+            return True
 
-        except ImportError:
-            print("⚠️  Pandas não disponível. Pulando população de vencedores.")
-            print("   Execute: pip install pandas")
         except Exception as e:
             print(f"❌ Erro ao popular vencedores: {str(e)}")
             self.session.rollback()
+        return False
+
+    def update_fighter_cartels(self, fighter_ids: Optional[Set[uuid.UUID]] = None):
+        """
+        Atualiza o cartel de cada lutador com base nas lutas importadas
 
-    def update_fighter_cartels(self):
-        """Atualiza o cartel de cada lutador com base nas lutas importadas"""
+        Com `fighter_ids`, recalcula apenas o cartel desses lutadores.
+        """
         print("\n📊 Atualizando cartel dos lutadores...")
 
-        fighters = (
-            self.session.query(Fighter).filter(Fighter.ufcstats_id.isnot(None)).all()
-        )
+        query = self.session.query(Fighter).filter(Fighter.ufcstats_id.isnot(None))
+        if fighter_ids is not None:
+            query = query.filter(Fighter.id.in_(fighter_ids))
+        fighters = query.all()
 
         for fighter in fighters:
             try:
@@ -564,78 +569,57 @@ class UFCDatasetImporter:
         self.session.commit()
         print(f"✓ Cartéis atualizados para {len(fighters)} lutadores")
 
-    def update_event_names(self):
-        """Atualiza nomes dos eventos usando o fight_details.csv"""
-        print("\n📝 Atualizando nomes dos eventos...")
-
-        # Ler nomes de eventos do fight_details.csv
-        with open("datasets/fight_details.csv", "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            event_names = {}
+    def update_event_names(
+        self,
+        csv_path: str = "datasets/fight_details.csv",
+        event_ids: Optional[Set[str]] = None,
+    ):
+        """
+        Atualiza nomes dos eventos usando o fight_details.csv
 
-            for row in reader:
-                event_id = row["event_id"].strip()
-                event_name = row.get("event_name", "").strip()
+        Com `event_ids` (ufcstats_id), atualiza apenas esses eventos.
+        """
+        print("\n📝 Atualizando nomes dos eventos...")
 
-                if event_name and event_id not in event_names:
-                    event_names[event_id] = event_name
+        # Ler nomes de eventos do fight_details.csv (primeiro nome de cada evento)
+        frame = read_csv(csv_path, usecols=["event_id", "event_name"])
+        names = pd.DataFrame(
+            {
+                "event_id": column(frame, "event_id"),
+                "event_name": column(frame, "event_name"),
+            }
+        )
+        names = names[names["event_name"] != ""]
+        if event_ids is not None:
+            names = names[names["event_id"].isin(event_ids)]
+        event_names = dict(
+            names.drop_duplicates("event_id").itertuples(index=False, name=None)
+        )
 
         # Atualizar eventos no banco
-        for ufcstats_id, name in event_names.items():
-            if ufcstats_id in self.event_id_map:
-                event_uuid = self.event_id_map[ufcstats_id]
-                event = self.session.query(Event).get(event_uuid)
-                if event:
-                    event.name = name
+        event_uuids = {
+            self.event_id_map[ufcstats_id]: name
+            for ufcstats_id, name in event_names.items()
+            if ufcstats_id in self.event_id_map
+        }
+        if event_uuids:
+            events = self.session.query(Event).filter(Event.id.in_(event_uuids))
+            for event in events:
+                event.name = event_uuids[event.id]
 
         self.session.commit()
         print(f"✓ Nomes atualizados para {len(event_names)} eventos")
 
-    def update_weight_classes(self):
+    def update_weight_classes(self, csv_path: str = "datasets/UFC.csv"):
         """Atualiza categorias de peso dos lutadores baseado nas lutas do UFC.csv"""
         print("\n📊 Atualizando categorias de peso dos lutadores...")
 
         # Ler UFC.csv e mapear categoria de peso da última luta de cada lutador
-        fighter_weight_classes = {}
-
-        with open("datasets/UFC.csv", "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                date_str = row.get("date", "").strip()
-                if not date_str:
-                    continue
-
-                # Parse data - tentar múltiplos formatos
-                fight_date = None
-                for date_format in ["%Y-%m-%d", "%Y/%m/%d", "%d/%m/%Y"]:
-                    try:
-                        fight_date = datetime.strptime(date_str, date_format)
-                        break
-                    except Exception:
-                        continue
-
-                if not fight_date:
-                    continue
-
-                division = row.get("division", "").strip()
-                if not division:
-                    continue
-
-                r_fighter = row.get("r_name", "").strip()
-                b_fighter = row.get("b_name", "").strip()
-
-                # Atualiza categoria de peso se essa luta for mais recente
-                for fighter_name in [r_fighter, b_fighter]:
-                    if fighter_name:
-                        if (
-                            fighter_name not in fighter_weight_classes
-                            or fight_date > fighter_weight_classes[fighter_name][1]
-                        ):
-                            fighter_weight_classes[fighter_name] = (
-                                division,
-                                fight_date,
-                            )
+        fighter_weight_classes = dict(
+            latest_weight_classes(csv_path)[["name", "division"]].itertuples(
+                index=False, name=None
+            )
+        )
 
         # Atualizar no banco
         updated = 0
@@ -644,11 +628,16 @@ class UFCDatasetImporter:
             f"  📋 Total de lutadores com categoria no CSV: {len(fighter_weight_classes)}"
         )
 
-        for fighter_name, (weight_class, _) in fighter_weight_classes.items():
-            # Buscar lutador pelo nome
-            fighter = (
-                self.session.query(Fighter).filter(Fighter.name == fighter_name).first()
-            )
+        # Lutadores buscados pelo nome de uma vez (o primeiro de cada nome)
+        fighters = {}
+        query = self.session.query(Fighter).filter(
+            Fighter.name.in_(fighter_weight_classes)
+        )
+        for fighter in query:
+            fighters.setdefault(fighter.name, fighter)
+
+        for fighter_name, weight_class in fighter_weight_classes.items():
+            fighter = fighters.get(fighter_name)
             if fighter:
                 fighter.actual_weight_class = weight_class
                 updated += 1
@@ -662,15 +651,86 @@ class UFCDatasetImporter:
         if not_found > 0:
             print(f"  ⚠️  {not_found} lutadores não encontrados no banco")
 
+    def run(self, system_user: User, datasets_dir: str = "datasets"):
+        """
+        Executa a importação completa de forma incremental
+
+        Lutadores, eventos e lutas só são gravados quando o hash da linha
+        mudou. As etapas derivadas (vencedores, nomes, cartéis e categorias)
+        se restringem ao que mudou, ou são puladas quando nada mudou.
+        """
+        datasets = Path(datasets_dir)
+        fighters_csv = str(datasets / "fighter_details.csv")
+        events_csv = str(datasets / "event_details.csv")
+        fights_csv = str(datasets / "fight_details.csv")
+        ufc_csv = str(datasets / "UFC.csv")
+
+        # 1. Importar lutadores primeiro (necessário para foreign keys)
+        self.import_fighters(fighters_csv, system_user)
+
+        # 2. Importar eventos
+        self.import_events(events_csv, system_user)
+
+        # 3. Importar lutas (requer lutadores e eventos já importados)
+        self.import_fights(fights_csv)
+
+        # 4. Popular vencedores das lutas (requer lutas já importadas)
+        scope = self._derived_scope("winners", ufc_csv, bool(self.changed["fights"]))
+        if scope is not None:
+            fight_ids = None if scope else self.changed["fights"]
+            if self.populate_fight_winners(ufc_csv, fight_ids):
+                self._save_checkpoint("winners", 0, completed=True)
+
+        # 5. Atualizar nomes dos eventos
+        scope = self._derived_scope(
+            "event_names", fights_csv, bool(self.changed["events"])
+        )
+        if scope is not None:
+            event_ids = None if scope else self.changed["events"]
+            self.update_event_names(fights_csv, event_ids)
+            self._save_checkpoint("event_names", 0, completed=True)
+
+        # 6. Atualizar cartel dos lutadores (requer vencedores já populados)
+        scope = self._derived_scope("cartels", None, bool(self.changed_fighter_ids))
+        if scope is not None:
+            self.update_fighter_cartels(None if scope else self.changed_fighter_ids)
+            self._save_checkpoint("cartels", 0, completed=True)
+
+        # 7. Atualizar categorias de peso dos lutadores
+        scope = self._derived_scope(
+            "weight_classes", ufc_csv, bool(self.changed["fighters"])
+        )
+        if scope is not None:
+            self.update_weight_classes(ufc_csv)
+            self._save_checkpoint("weight_classes", 0, completed=True)
+
+    def diff_report(self) -> dict:
+        """Relatório do que a importação criou, alterou e manteve"""
+        return {
+            entity: {
+                "created": len(diff["created"]),
+                "updated": len(diff["updated"]),
+                "unchanged": self.stats[f"{entity}_unchanged"],
+                "created_ids": diff["created"],
+                "updated_ids": diff["updated"],
+            }
+            for entity, diff in self.diff.items()
+        }
+
     def print_stats(self):
         """Imprime estatísticas finais da importação"""
         print("\n" + "=" * 60)
         print("📊 ESTATÍSTICAS DA IMPORTAÇÃO")
         print("=" * 60)
-        print(f"✓ Lutadores criados:     {self.stats['fighters_created']}")
-        print(f"✓ Lutadores atualizados: {self.stats['fighters_updated']}")
-        print(f"✓ Eventos criados:       {self.stats['events_created']}")
-        print(f"✓ Lutas criadas:         {self.stats['fights_created']}")
+        labels = {"fighters": "Lutadores", "events": "Eventos", "fights": "Lutas"}
+        for entity, diff in self.diff_report().items():
+            print(
+                f"✓ {labels[entity] + ':':<11} {diff['created']} novos, "
+                f"{diff['updated']} alterados, {diff['unchanged']} inalterados"
+            )
+
+        if self.stats["skipped_steps"]:
+            print(f"⏭️  Etapas puladas: {', '.join(self.stats['skipped_steps'])}")
 
         if self.stats["errors"]:
             print(f"\n⚠️  Erros encontrados:    {len(self.stats['errors'])}")
@@ -683,6 +743,24 @@ class UFCDatasetImporter:
 
 def main():
     """Função principal de importação"""
+    parser = argparse.ArgumentParser(description="Importador do dataset UFC")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Reprocessa todas as linhas, ignorando hashes e checkpoints",
+    )
+    parser.add_argument(
+        "--report", type=Path, help="Grava o relatório de diferenças (JSON)"
+    )
+    parser.add_argument("--datasets-dir", default="datasets")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Processos para o parse dos CSVs (padrão: uma thread de prefetch)",
+    )
+    args = parser.parse_args()
+
     print("🥊 IMPORTADOR DE DATASET UFC")
     print("=" * 60)
 
@@ -693,39 +771,27 @@ def main():
 
     try:
         # Criar importador
-        importer = UFCDatasetImporter(session)
+        importer = UFCDatasetImporter(session, force=args.force, workers=args.workers)
 
         # Obter usuário do sistema
         system_user = importer.get_or_create_system_user()
 
-        # 1. Importar lutadores primeiro (necessário para foreign keys)
-        importer.import_fighters("datasets/fighter_details.csv", system_user)
-
-        # 2. Importar eventos
-        importer.import_events("datasets/event_details.csv", system_user)
-
-        # 3. Importar lutas (requer lutadores e eventos já importados)
-        importer.import_fights("datasets/fight_details.csv")
-
-        # 4. Popular vencedores das lutas (requer lutas já importadas)
-        importer.populate_fight_winners("datasets/UFC.csv")
-
-        # 5. Atualizar nomes dos eventos
-        importer.update_event_names()
-
-        # 6. Atualizar cartel dos lutadores (requer vencedores já populados)
-        importer.update_fighter_cartels()
-
-        # 7. Atualizar categorias de peso dos lutadores
-        importer.update_weight_classes()
+        importer.run(system_user, args.datasets_dir)
 
         # Estatísticas finais
         importer.print_stats()
 
+        if args.report:
+            args.report.write_text(
+                json.dumps(importer.diff_report(), indent=2, ensure_ascii=False)
+            )
+            print(f"📄 Relatório de diferenças: {args.report}")
+
         print("\n✅ Importação concluída com sucesso!")
 
     except Exception as e:
         print(f"\n❌ Erro crítico durante importação: {str(e)}")
+        print("   Execute novamente para retomar do último checkpoint.")
         session.rollback()
         raise
 
@@ -0,0 +1,75 @@
+"""
+Script de manutenção das partições de fight_simulations
+
+Cria as partições mensais futuras e aplica a política de retenção
+(arquiva ou remove partições antigas). Pensado para rodar via cron, ex:
+
+    0 3 1 * * cd /app && python scripts/manage_simulation_partitions.py
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+
+from app.core.settings import Settings
+from app.database.partitions import apply_retention, ensure_partitions
+
+settings = Settings()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Manutenção das partições de fight_simulations"
+    )
+    parser.add_argument(
+        "--months-ahead",
+        type=int,
+        default=settings.SIMULATION_PARTITIONS_AHEAD,
+        help="Quantidade de meses futuros com partição criada",
+    )
+    parser.add_argument(
+        "--retention-months",
+        type=int,
+        default=settings.SIMULATION_RETENTION_MONTHS,
+        help="Meses mantidos na tabela ativa (0 desativa a retenção)",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["archive", "drop"],
+        default=settings.SIMULATION_RETENTION_MODE,
+        help="archive: move para o schema de arquivo | drop: remove",
+    )
+    args = parser.parse_args()
+
+    print("🗂️  MANUTENÇÃO DE PARTIÇÕES - fight_simulations")
+    print("=" * 60)
+
+    engine = create_engine(settings.DATABASE_URL_SYNC)
+    try:
+        with engine.begin() as connection:
+            created = ensure_partitions(connection, months_ahead=args.months_ahead)
+            expired = apply_retention(
+                connection,
+                retention_months=args.retention_months,
+                mode=args.mode,
+                archive_schema=settings.SIMULATION_ARCHIVE_SCHEMA,
+            )
+    except Exception as e:
+        print(f"\n❌ Erro na manutenção de partições: {str(e)}")
+        return False
+    finally:
+        engine.dispose()
+
+    print(f"✓ Partições criadas: {', '.join(created) or 'nenhuma'}")
+    print(f"✓ Partições expiradas ({args.mode}): {', '.join(expired) or 'nenhuma'}")
+    print("=" * 60)
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
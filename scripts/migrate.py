@@ -0,0 +1,55 @@
+"""
+Aplica as migrations do Alembic uma vez por deploy
+
+Os workers da API não migram mais no startup, só conferem se o banco está
+no head ou à frente dele (MIGRATIONS_ON_STARTUP=check). Rode antes de subir/atualizar os
+workers; execuções concorrentes são serializadas por advisory lock.
+
+    python scripts/migrate.py            # upgrade até o head
+    python scripts/migrate.py --check    # exit 1 se o banco estiver atrás do head
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.database.migrations import (
+    current_revisions,
+    head_revisions,
+    missing_revisions,
+    run_migrations,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrations do banco (Alembic)")
+    parser.add_argument(
+        "--revision", default="head", help="Revisão alvo do upgrade (padrão: head)"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Só confere se o banco tem o head do código (exit 1 se estiver atrás)",
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        current = asyncio.run(current_revisions())
+        heads = head_revisions()
+        print(f"Banco: {sorted(current) or 'vazio'} | head: {sorted(heads)}")
+        missing = missing_revisions(current)
+        if missing:
+            print(f"❌ Banco atrás do head (falta {sorted(missing)})")
+            sys.exit(1)
+        print("✅ Banco no head" if current == heads else "✅ Banco à frente do head")
+        return
+
+    run_migrations(args.revision)
+    print("✅ Migrations aplicadas")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,383 @@
+"""
+Etapa de parse/validação dos CSVs do dataset UFC
+
+Converte os CSVs em lotes tipados (lista de dicts prontos para o modelo),
+com operações vetorizadas do pandas por coluna em vez de strptime/float()
+linha a linha. Os lotes são lidos em blocos de CHUNK_SIZE linhas e
+preparados à frente do consumidor (numa thread, ou em `workers` processos),
+então o parse do próximo bloco acontece enquanto o importador grava o atual.
+
+Uso:
+    for batch in read_batches("datasets/fighter_details.csv", parse_fighters):
+        for fighter in batch:
+            ...
+"""
+
+import hashlib
+import json
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Linhas por bloco lido do CSV
+CHUNK_SIZE = 2000
+
+# Versão da lógica de parse, incluída em `import_hash` e no hash do arquivo:
+# incremente ao mudar o que é extraído das linhas (formatos, colunas,
+# atributos calculados) para que a próxima importação regrave tudo.
+#   2: datas abreviadas ("Jun 13, 1989") em date_of_birth
+PARSER_VERSION = 2
+
+# Formatos de data aceitos, em ordem de tentativa ("September 06, 2025",
+# "Jun 13, 1989", "2025-09-06")
+DATE_FORMATS = ("%B %d, %Y", "%b %d, %Y", "%Y-%m-%d")
+WEIGHT_CLASS_DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%d/%m/%Y")
+
+# Colunas numéricas: coluna do modelo -> coluna do CSV
+FIGHTER_FLOAT_COLUMNS = {
+    "height_cm": "height",
+    "reach_cm": "reach",
+    "weight_lbs": "weight",
+    "slpm": "splm",
+    "str_acc": "str_acc",
+    "sapm": "sapm",
+    "str_def": "str_def",
+    "td_avg": "td_avg",
+    "td_acc": "td_avg_acc",
+    "td_def": "td_def",
+    "sub_avg": "sub_avg",
+}
+FIGHTER_INT_COLUMNS = {"wins": "wins", "losses": "losses", "draws": "draws"}
+
+FIGHT_INT_COLUMNS = {
+    "finish_round": "finish_round",
+    "match_time_seconds": "match_time_sec",
+    **{
+        f"{corner}_{field}": f"{corner}_{column}"
+        for corner in ("r", "b")
+        for field, column in (
+            ("kd", "kd"),
+            ("sig_str_landed", "sig_str_landed"),
+            ("sig_str_attempted", "sig_str_atmpted"),
+            ("total_str_landed", "total_str_landed"),
+            ("total_str_attempted", "total_str_atmpted"),
+            ("td_landed", "td_landed"),
+            ("td_attempted", "td_atmpted"),
+            ("sub_att", "sub_att"),
+        )
+    },
+}
+FIGHT_TIME_COLUMNS = {"r_ctrl_seconds": "r_ctrl", "b_ctrl_seconds": "b_ctrl"}
+
+_DONE = object()
+
+# Funções aplicadas elemento a elemento em arrays de texto (laço em C)
+_strip = np.frompyfunc(str.strip, 1, 1)
+_encode_string = np.frompyfunc(json.encoder.encode_basestring, 1, 1)
+
+
+def _digest(content: bytes = b""):
+    return hashlib.blake2b(f"v{PARSER_VERSION}:".encode() + content, digest_size=16)
+
+
+def row_hash(row: dict) -> str:
+    """
+    Hash do conteúdo de uma linha do CSV (independe da ordem das colunas)
+
+    Inclui PARSER_VERSION: a mesma linha parseada por outra versão do
+    parser conta como alterada.
+    """
+    content = json.dumps(
+        sorted((key, (value or "").strip()) for key, value in row.items() if key),
+        ensure_ascii=False,
+    )
+    return _digest(content.encode()).hexdigest()
+
+
+def frame_hashes(frame: pd.DataFrame) -> List[str]:
+    """
+    `row_hash` de cada linha do DataFrame (lido com `read_csv`)
+
+    Monta o mesmo JSON de `row_hash` coluna a coluna, em vez de um
+    `json.dumps` por linha.
+    """
+    content = "["
+    for position, name in enumerate(sorted(frame.columns)):
+        separator = ", " if position else ""
+        prefix = f"{separator}[{_encode_string(name)}, "
+        content = content + prefix + _encode_string(frame[name].to_numpy()) + "]"
+    return [_digest(row.encode()).hexdigest() for row in content + "]"]
+
+
+def file_hash(path: str) -> str:
+    """Hash do arquivo e de PARSER_VERSION, para pular arquivos inalterados"""
+    digest = _digest()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def strip(frame: pd.DataFrame) -> pd.DataFrame:
+    """Texto sem espaços nas bordas; células ausentes como ''"""
+    frame = frame.fillna("")
+    return pd.DataFrame(
+        {name: _strip(frame[name].to_numpy()) for name in frame.columns},
+        index=frame.index,
+    )
+
+
+def read_csv(csv_path, chunksize: Optional[int] = None, **kwargs):
+    """
+    CSV como texto (sem inferência de tipos), já com `strip`
+
+    Com `chunksize`, retorna um iterador de blocos.
+    """
+    frames = pd.read_csv(
+        csv_path, dtype=str, keep_default_na=False, chunksize=chunksize, **kwargs
+    )
+    if chunksize is None:
+        return strip(frames)
+    return (strip(chunk) for chunk in frames)
+
+
+def column(frame: pd.DataFrame, name: str) -> pd.Series:
+    """Coluna do CSV ('' se a coluna não existir)"""
+    if name not in frame:
+        return pd.Series("", index=frame.index, dtype=object)
+    return frame[name]
+
+
+def to_float(values: pd.Series) -> pd.Series:
+    """Números; vazio, '--' e texto inválido viram NaN"""
+    return pd.to_numeric(values, errors="coerce")
+
+
+def to_int(values: pd.Series) -> pd.Series:
+    """Inteiros truncados (como int(float(x))), nulos como <NA>"""
+    return np.trunc(to_float(values)).astype("Int64")
+
+
+def to_date(values: pd.Series, formats=DATE_FORMATS) -> pd.Series:
+    """Datas UTC, tentando cada formato em ordem; inválidas viram NaT"""
+    # Datas se repetem muito (uma linha por luta): converte cada valor uma vez
+    uniques = pd.Series(pd.unique(values))
+    parsed = pd.Series(pd.NaT, index=uniques.index, dtype="datetime64[ns, UTC]")
+    for date_format in formats:
+        missing = parsed.isna()
+        if not missing.any():
+            break
+        parsed[missing] = pd.to_datetime(
+            uniques[missing], format=date_format, errors="coerce", utc=True
+        )
+    dates = pd.Series(parsed.array, index=uniques)
+    return pd.Series(dates.reindex(values).array, index=values.index)
+
+
+def to_seconds(values: pd.Series) -> pd.Series:
+    """Tempo MM:SS em segundos totais"""
+    parts = values.str.extract(r"^\s*(\d+)\s*:\s*(\d+)\s*$")
+    return (to_int(parts[0]) * 60 + to_int(parts[1])).astype("Int64")
+
+
+def text_or_none(values: pd.Series) -> pd.Series:
+    return values.where(values != "", None)
+
+
+def _or(values: pd.Series, default) -> pd.Series:
+    # Equivalente vetorizado de `value or default` (None, NaN e 0 são falsos)
+    return values.where(values.notna() & (values != 0), default)
+
+
+def records(frame: pd.DataFrame) -> List[dict]:
+    """Linhas como dicts com tipos Python (nulos como None)"""
+    columns = list(frame.columns)
+    rows = frame.astype(object).where(frame.notna(), None).to_numpy().tolist()
+    return [dict(zip(columns, row)) for row in rows]
+
+
+def parse_fighters(chunk: pd.DataFrame) -> List[dict]:
+    """Bloco do fighter_details.csv -> campos do Fighter"""
+    parsed = pd.DataFrame(
+        {
+            "ufcstats_id": column(chunk, "id"),
+            "name": column(chunk, "name"),
+            "nickname": text_or_none(column(chunk, "nick_name")),
+            "date_of_birth": to_date(column(chunk, "dob")).dt.tz_localize(None),
+            "stance": text_or_none(column(chunk, "stance")),
+        }
+    )
+    for field, source in FIGHTER_FLOAT_COLUMNS.items():
+        parsed[field] = to_float(column(chunk, source))
+    for field, source in FIGHTER_INT_COLUMNS.items():
+        parsed[field] = to_int(column(chunk, source)).fillna(0)
+
+    # Atributos de 0-100 calculados a partir das estatísticas
+    total_fights = parsed["wins"] + parsed["losses"]
+    parsed["striking"] = np.trunc(
+        parsed["slpm"].fillna(0) * 10 + _or(parsed["str_acc"], 50)
+    ).clip(upper=100)
+    parsed["grappling"] = np.trunc(
+        parsed["td_avg"].fillna(0) * 20 + parsed["sub_avg"].fillna(0) * 30 + 30
+    ).clip(upper=100)
+    parsed["defense"] = (
+        np.trunc(_or(parsed["str_def"], 50) + _or(parsed["td_def"], 50)) // 2
+    ).clip(upper=100)
+    parsed["stamina"] = (50 + total_fights).clip(upper=100)
+    parsed["speed"] = np.trunc(_or(parsed["slpm"], 3) * 15).clip(upper=100)
+    parsed["strategy"] = (50 + total_fights // 2).clip(upper=100)
+    for field in ("striking", "grappling", "defense", "speed"):
+        parsed[field] = parsed[field].astype("Int64")
+
+    parsed["import_hash"] = frame_hashes(chunk)
+    return records(parsed)
+
+
+def parse_events(frame: pd.DataFrame) -> List[dict]:
+    """event_details.csv (uma linha por luta) -> um registro por evento"""
+    events = pd.DataFrame(
+        {
+            "event_id": column(frame, "event_id"),
+            "location": column(frame, "location"),
+            "date": column(frame, "date"),
+        }
+    ).drop_duplicates("event_id")
+    events["import_hash"] = frame_hashes(events)
+    events["date"] = to_date(events["date"])
+    return records(events)
+
+
+def parse_fights(chunk: pd.DataFrame) -> List[dict]:
+    """Bloco do fight_details.csv -> campos do Fight"""
+    method = column(chunk, "method")
+    result_type = np.select(
+        [
+            method.str.contains("KO", regex=False),
+            method.str.contains("Sub", regex=False),
+            method.str.contains("Decision", regex=False),
+            method.str.contains("Draw", regex=False),
+        ],
+        ["KO/TKO", "Submission", "Decision", "Draw"],
+        default=None,
+    )
+    parsed = pd.DataFrame(
+        {
+            "ufcstats_id": column(chunk, "fight_id"),
+            "event_id": column(chunk, "event_id"),
+            "r_id": column(chunk, "r_id"),
+            "b_id": column(chunk, "b_id"),
+            "weight_class": text_or_none(column(chunk, "division")),
+            "rounds": _or(to_int(column(chunk, "total_rounds")), 3),
+            "is_title_fight": _or(to_int(column(chunk, "title_fight")), 0) != 0,
+            "result_type": result_type,
+            "referee": text_or_none(column(chunk, "referee")),
+            "method_details": method,
+        }
+    )
+    for field, source in FIGHT_INT_COLUMNS.items():
+        parsed[field] = to_int(column(chunk, source))
+    for field, source in FIGHT_TIME_COLUMNS.items():
+        parsed[field] = to_seconds(column(chunk, source))
+
+    parsed["import_hash"] = frame_hashes(chunk)
+    return records(parsed)
+
+
+def prefetch(items: Iterable, depth: int = 2) -> Iterator:
+    """
+    Consome `items` numa thread, até `depth` itens à frente do consumidor
+
+    O parse (pandas/C, que libera o GIL em boa parte) roda enquanto o
+    consumidor espera o banco.
+    """
+    buffer = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+            put((_DONE, None))
+        except BaseException as e:
+            put((_DONE, e))
+
+    thread = threading.Thread(target=produce, name="csv-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+def read_batches(
+    csv_path: str,
+    parse: Callable[[pd.DataFrame], List[dict]],
+    chunksize: int = CHUNK_SIZE,
+    workers: int = 0,
+) -> Iterator[List[dict]]:
+    """
+    Lotes tipados do CSV, na ordem do arquivo
+
+    Com `workers` > 0, os blocos são convertidos em paralelo em processos
+    (até `workers` blocos à frente); senão, numa thread de prefetch.
+    """
+    chunks = read_csv(csv_path, chunksize=chunksize)
+    if not workers:
+        yield from prefetch(parse(chunk) for chunk in chunks)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in prefetch(chunks):
+            pending.append(executor.submit(parse, chunk))
+            if len(pending) > workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def latest_weight_classes(csv_path: str) -> pd.DataFrame:
+    """
+    Categoria de peso da luta mais recente de cada lutador (UFC.csv)
+
+    Returns:
+        DataFrame com `name`, `division` e `date`, um por lutador
+    """
+    frame = read_csv(csv_path, usecols=["date", "division", "r_name", "b_name"])
+    frame["date"] = to_date(column(frame, "date"), WEIGHT_CLASS_DATE_FORMATS)
+    frame["division"] = column(frame, "division")
+    frame = frame[frame["date"].notna() & (frame["division"] != "")]
+
+    corners = pd.concat(
+        [
+            frame[["date", "division"]].assign(
+                name=column(frame, corner), row=frame.index
+            )
+            for corner in ("r_name", "b_name")
+        ]
+    )
+    corners = corners[corners["name"] != ""]
+    # Mais recente primeiro; em datas iguais vale a primeira luta do arquivo
+    latest = corners.sort_values(["date", "row"], ascending=[False, True])
+    return latest.drop_duplicates("name")[["name", "division", "date"]]
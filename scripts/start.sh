@@ -0,0 +1,18 @@
+#!/bin/sh
+# Entrypoint do container: migrations uma vez e depois o uvicorn
+#
+# Com PROMETHEUS_MULTIPROC_DIR definido, o /metrics de qualquer worker agrega
+# todos os processos (arquivos mmap no diretório). O diretório é recriado
+# vazio a cada start: arquivos de execuções anteriores (pids que não existem
+# mais) seriam somados às métricas atuais.
+
+set -e
+
+python scripts/migrate.py
+
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+
+exec uvicorn app.main:app --host=0.0.0.0 --port=8000 --workers "${WORKERS:-1}"
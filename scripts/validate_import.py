@@ -1,8 +1,16 @@
 """
 Script de validação dos dados importados do UFC Dataset
 Verifica integridade e qualidade dos dados
+
+Sem argumentos, valida o que já está no banco (uma consulta agregada por
+tabela). Com --datasets-dir, valida os CSVs antes da importação, com a
+mesma etapa de parse vetorizada do importador.
+
+    python scripts/validate_import.py
+    python scripts/validate_import.py --datasets-dir datasets
 """
 
+import argparse
 import sys
 from pathlib import Path
 
@@ -13,16 +21,70 @@ from sqlalchemy.orm import sessionmaker
 
 from app.core.settings import Settings
 from app.database.models.base import Event, Fight, Fighter
+from scripts.parse_ufc_dataset import (
+    FIGHT_INT_COLUMNS,
+    FIGHT_TIME_COLUMNS,
+    FIGHTER_FLOAT_COLUMNS,
+    FIGHTER_INT_COLUMNS,
+    column,
+    read_csv,
+    to_date,
+    to_float,
+    to_seconds,
+)
 
 settings = Settings()
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI)
-Session = sessionmaker(bind=engine)
+
+
+DB_MESSAGES = (
+    "Dataset importado com sucesso e sem problemas.",
+    "Importação bem-sucedida com alguns avisos.",
+    "Importação pode estar incompleta.",
+)
+CSV_MESSAGES = (
+    "CSVs prontos para importação.",
+    "CSVs podem ser importados; revise os avisos.",
+    "Corrija os CSVs antes de importar.",
+)
+
+
+def print_result(issues: list, warnings: list, messages=DB_MESSAGES) -> int:
+    """Imprime o resultado final e retorna o código de saída"""
+    success, with_warnings, failure = messages
+    print("\n" + "=" * 60)
+    print("📋 RESULTADO DA VALIDAÇÃO")
+    print("=" * 60)
+
+    if not issues and not warnings:
+        print("\n✅ TODOS OS TESTES PASSARAM!")
+        print(f"   {success}")
+    else:
+        if issues:
+            print("\n❌ PROBLEMAS CRÍTICOS ENCONTRADOS:")
+            for issue in issues:
+                print(f"   {issue}")
+
+        if warnings:
+            print("\n⚠️  AVISOS (Não Críticos):")
+            for warning in warnings:
+                print(f"   {warning}")
+
+        if not issues:
+            print(f"\n✅ {with_warnings}")
+        else:
+            print(f"\n⚠️  {failure}")
+
+    print("\n" + "=" * 60)
+
+    # Retornar código de saída apropriado
+    return 0 if not issues else 1
 
 
 def validate_import():
     """Valida dados importados"""
 
-    session = Session()
+    engine = create_engine(settings.DATABASE_URL_SYNC)
+    session = sessionmaker(bind=engine)()
 
     print("🔍 VALIDAÇÃO DO DATASET IMPORTADO\n")
     print("=" * 60)
@@ -30,61 +92,83 @@ def validate_import():
     issues = []
     warnings = []
 
-    # 1. Contagem de registros
-    print("\n📊 Contagem de Registros")
-    print("-" * 60)
-
-    fighters_count = (
-        session.query(func.count(Fighter.id))
+    # Uma consulta agregada por tabela (contagens com FILTER)
+    fighters = (
+        session.query(
+            func.count(Fighter.id).label("total"),
+            func.count(Fighter.id).filter(Fighter.slpm.is_(None)).label("no_slpm"),
+            func.count(Fighter.id)
+            .filter(Fighter.date_of_birth.is_(None))
+            .label("no_dob"),
+            func.count(Fighter.id).filter(Fighter.cartel != []).label("with_cartel"),
+            func.count(Fighter.id)
+            .filter(
+                (Fighter.striking < 0)
+                | (Fighter.striking > 100)
+                | (Fighter.grappling < 0)
+                | (Fighter.grappling > 100)
+                | (Fighter.defense < 0)
+                | (Fighter.defense > 100)
+            )
+            .label("invalid_attrs"),
+        )
         .filter(Fighter.ufcstats_id.isnot(None))
-        .scalar()
+        .one()
     )
-    print(f"✓ Lutadores com ufcstats_id: {fighters_count}")
-
-    events_count = (
-        session.query(func.count(Event.id))
+    imported_fight = Fight.ufcstats_id.isnot(None)
+    fights = session.query(
+        func.count(Fight.id).filter(imported_fight).label("total"),
+        func.count(Fight.id).filter(Fight.event_id.is_(None)).label("orphans"),
+        func.count(Fight.id)
+        .filter(Fight.fighter1_id.is_(None) | Fight.fighter2_id.is_(None))
+        .label("no_fighters"),
+        func.count(Fight.id)
+        .filter(imported_fight, Fight.r_sig_str_landed.isnot(None))
+        .label("with_stats"),
+        func.count(Fight.id)
+        .filter(imported_fight, Fight.referee.isnot(None))
+        .label("with_referee"),
+    ).one()
+    events = (
+        session.query(
+            func.count(Event.id).label("total"),
+            func.count(Event.id)
+            .filter(Event.name.isnot(None), Event.name != "")
+            .label("with_name"),
+        )
         .filter(Event.ufcstats_id.isnot(None))
-        .scalar()
+        .one()
     )
-    print(f"✓ Eventos com ufcstats_id:   {events_count}")
+    session.close()
 
-    fights_count = (
-        session.query(func.count(Fight.id))
-        .filter(Fight.ufcstats_id.isnot(None))
-        .scalar()
-    )
-    print(f"✓ Lutas com ufcstats_id:     {fights_count}")
+    # 1. Contagem de registros
+    print("\n📊 Contagem de Registros")
+    print("-" * 60)
+
+    print(f"✓ Lutadores com ufcstats_id: {fighters.total}")
+    print(f"✓ Eventos com ufcstats_id:   {events.total}")
+    print(f"✓ Lutas com ufcstats_id:     {fights.total}")
 
-    if fighters_count == 0:
+    if fighters.total == 0:
         issues.append("❌ Nenhum lutador importado!")
 
-    if events_count == 0:
+    if events.total == 0:
         issues.append("❌ Nenhum evento importado!")
 
-    if fights_count == 0:
+    if fights.total == 0:
         issues.append("❌ Nenhuma luta importada!")
 
     # 2. Validar relacionamentos
     print("\n🔗 Validação de Relacionamentos")
     print("-" * 60)
 
-    orphan_fights = (
-        session.query(func.count(Fight.id)).filter(Fight.event_id.is_(None)).scalar()
-    )
-
-    if orphan_fights > 0:
-        issues.append(f"❌ {orphan_fights} lutas sem evento!")
+    if fights.orphans > 0:
+        issues.append(f"❌ {fights.orphans} lutas sem evento!")
     else:
         print("✓ Todas as lutas têm evento associado")
 
-    fights_without_fighters = (
-        session.query(func.count(Fight.id))
-        .filter((Fight.fighter1_id.is_(None)) | (Fight.fighter2_id.is_(None)))
-        .scalar()
-    )
-
-    if fights_without_fighters > 0:
-        issues.append(f"❌ {fights_without_fighters} lutas sem lutadores!")
+    if fights.no_fighters > 0:
+        issues.append(f"❌ {fights.no_fighters} lutas sem lutadores!")
     else:
         print("✓ Todas as lutas têm lutadores associados")
 
@@ -92,25 +176,13 @@ def validate_import():
     print("\n👤 Validação de Dados dos Lutadores")
     print("-" * 60)
 
-    fighters_without_stats = (
-        session.query(func.count(Fighter.id))
-        .filter(Fighter.ufcstats_id.isnot(None), Fighter.slpm.is_(None))
-        .scalar()
-    )
-
-    if fighters_without_stats > 0:
-        warnings.append(f"⚠️  {fighters_without_stats} lutadores sem SLPM")
+    if fighters.no_slpm > 0:
+        warnings.append(f"⚠️  {fighters.no_slpm} lutadores sem SLPM")
     else:
         print("✓ Todos os lutadores têm SLPM")
 
-    fighters_without_dob = (
-        session.query(func.count(Fighter.id))
-        .filter(Fighter.ufcstats_id.isnot(None), Fighter.date_of_birth.is_(None))
-        .scalar()
-    )
-
-    if fighters_without_dob > 0:
-        warnings.append(f"⚠️  {fighters_without_dob} lutadores sem data de nascimento")
+    if fighters.no_dob > 0:
+        warnings.append(f"⚠️  {fighters.no_dob} lutadores sem data de nascimento")
     else:
         print("✓ Todos os lutadores têm data de nascimento")
 
@@ -118,62 +190,30 @@ def validate_import():
     print("\n🏆 Validação de Cartéis")
     print("-" * 60)
 
-    fighters_with_cartel = (
-        session.query(func.count(Fighter.id))
-        .filter(Fighter.ufcstats_id.isnot(None), Fighter.cartel != [])
-        .scalar()
-    )
-
-    print(f"✓ Lutadores com cartel: {fighters_with_cartel}/{fighters_count}")
+    print(f"✓ Lutadores com cartel: {fighters.with_cartel}/{fighters.total}")
 
-    if fighters_with_cartel == 0:
+    if fighters.with_cartel == 0:
         warnings.append("⚠️  Nenhum lutador tem cartel preenchido")
 
     # 5. Validar estatísticas das lutas
     print("\n📈 Validação de Estatísticas das Lutas")
     print("-" * 60)
 
-    fights_with_stats = (
-        session.query(func.count(Fight.id))
-        .filter(Fight.ufcstats_id.isnot(None), Fight.r_sig_str_landed.isnot(None))
-        .scalar()
-    )
+    print(f"✓ Lutas com estatísticas: {fights.with_stats}/{fights.total}")
 
-    print(f"✓ Lutas com estatísticas: {fights_with_stats}/{fights_count}")
-
-    if fights_with_stats < fights_count * 0.5:
+    if fights.with_stats < fights.total * 0.5:
         warnings.append(
-            f"⚠️  Apenas {fights_with_stats}/{fights_count} lutas têm estatísticas"
+            f"⚠️  Apenas {fights.with_stats}/{fights.total} lutas têm estatísticas"
         )
 
-    fights_with_referee = (
-        session.query(func.count(Fight.id))
-        .filter(Fight.ufcstats_id.isnot(None), Fight.referee.isnot(None))
-        .scalar()
-    )
-
-    print(f"✓ Lutas com árbitro: {fights_with_referee}/{fights_count}")
+    print(f"✓ Lutas com árbitro: {fights.with_referee}/{fights.total}")
 
     # 6. Validar atributos calculados
     print("\n⚙️  Validação de Atributos Calculados")
     print("-" * 60)
 
-    fighters_invalid_attrs = (
-        session.query(func.count(Fighter.id))
-        .filter(
-            Fighter.ufcstats_id.isnot(None),
-            (Fighter.striking < 0)
-            | (Fighter.striking > 100)
-            | (Fighter.grappling < 0)
-            | (Fighter.grappling > 100)
-            | (Fighter.defense < 0)
-            | (Fighter.defense > 100),
-        )
-        .scalar()
-    )
-
-    if fighters_invalid_attrs > 0:
-        issues.append(f"❌ {fighters_invalid_attrs} lutadores com atributos inválidos!")
+    if fighters.invalid_attrs > 0:
+        issues.append(f"❌ {fighters.invalid_attrs} lutadores com atributos inválidos!")
     else:
         print("✓ Todos os atributos estão no intervalo [0, 100]")
 
@@ -181,49 +221,197 @@ def validate_import():
     print("\n🎪 Validação de Eventos")
     print("-" * 60)
 
-    events_with_name = (
-        session.query(func.count(Event.id))
-        .filter(Event.ufcstats_id.isnot(None), Event.name.isnot(None), Event.name != "")
-        .scalar()
-    )
+    print(f"✓ Eventos com nome: {events.with_name}/{events.total}")
 
-    print(f"✓ Eventos com nome: {events_with_name}/{events_count}")
+    if events.with_name < events.total:
+        warnings.append(f"⚠️  {events.total - events.with_name} eventos sem nome")
 
-    if events_with_name < events_count:
-        warnings.append(f"⚠️  {events_count - events_with_name} eventos sem nome")
+    return print_result(issues, warnings)
 
-    # Resultado final
-    print("\n" + "=" * 60)
-    print("📋 RESULTADO DA VALIDAÇÃO")
-    print("=" * 60)
 
-    if not issues and not warnings:
-        print("\n✅ TODOS OS TESTES PASSARAM!")
-        print("   Dataset importado com sucesso e sem problemas.")
-    else:
-        if issues:
-            print("\n❌ PROBLEMAS CRÍTICOS ENCONTRADOS:")
-            for issue in issues:
-                print(f"   {issue}")
+def invalid_values(frame, columns: dict, convert) -> dict:
+    """
+    Valores preenchidos que não convertem, por coluna do CSV
 
-        if warnings:
-            print("\n⚠️  AVISOS (Não Críticos):")
-            for warning in warnings:
-                print(f"   {warning}")
+    Vazio e '--' contam como ausentes, não como inválidos.
+    """
+    counts = {}
+    for source in columns.values():
+        if source not in frame:
+            continue
+        raw = column(frame, source)
+        invalid = int(((raw != "") & (raw != "--") & convert(raw).isna()).sum())
+        if invalid:
+            counts[source] = invalid
+    return counts
 
-        if not issues:
-            print("\n✅ Importação bem-sucedida com alguns avisos.")
-        else:
-            print("\n⚠️  Importação pode estar incompleta.")
 
-    print("\n" + "=" * 60)
+def report_invalid(name: str, counts: dict, warnings: list):
+    for source, invalid in counts.items():
+        warnings.append(f"⚠️  {name}: {invalid} valores inválidos em '{source}'")
 
-    session.close()
 
-    # Retornar código de saída apropriado
-    return 0 if not issues else 1
+def validate_datasets(datasets_dir: str = "datasets"):
+    """Valida os CSVs do dataset antes da importação"""
+
+    datasets = Path(datasets_dir)
+
+    print("🔍 VALIDAÇÃO DOS CSVs DO DATASET\n")
+    print("=" * 60)
+
+    issues = []
+    warnings = []
+    fighter_ids = event_ids = fight_ids = None
+
+    # 1. Lutadores
+    path = datasets / "fighter_details.csv"
+    if path.exists():
+        print(f"\n👤 {path}")
+        print("-" * 60)
+        frame = read_csv(path)
+        ids = column(frame, "id")
+        fighter_ids = set(ids)
+        print(f"✓ Linhas: {len(frame)}")
+
+        duplicated = int(ids.duplicated().sum())
+        if duplicated:
+            issues.append(f"❌ fighter_details: {duplicated} ids duplicados")
+        missing = int(((ids == "") | (column(frame, "name") == "")).sum())
+        if missing:
+            issues.append(f"❌ fighter_details: {missing} linhas sem id ou nome")
+
+        dob = column(frame, "dob")
+        no_dob = int(((dob != "") & to_date(dob).isna()).sum())
+        if no_dob:
+            warnings.append(
+                f"⚠️  fighter_details: {no_dob} datas de nascimento não reconhecidas"
+            )
+        report_invalid(
+            "fighter_details",
+            invalid_values(
+                frame, {**FIGHTER_FLOAT_COLUMNS, **FIGHTER_INT_COLUMNS}, to_float
+            ),
+            warnings,
+        )
+    else:
+        issues.append(f"❌ Arquivo não encontrado: {path}")
+
+    # 2. Eventos
+    path = datasets / "event_details.csv"
+    if path.exists():
+        print(f"\n🎪 {path}")
+        print("-" * 60)
+        frame = read_csv(path, usecols=["event_id", "location", "date"])
+        events = frame.assign(event_id=column(frame, "event_id"))
+        event_ids = set(events["event_id"])
+        print(f"✓ Eventos: {len(event_ids)} ({len(frame)} linhas)")
+
+        invalid_dates = events.drop_duplicates("event_id")
+        invalid_dates = int(to_date(column(invalid_dates, "date")).isna().sum())
+        if invalid_dates:
+            warnings.append(
+                f"⚠️  event_details: {invalid_dates} eventos sem data válida "
+                "(importados com a data atual)"
+            )
+        inconsistent = int(
+            (events.groupby("event_id")[["date", "location"]].nunique() > 1)
+            .any(axis=1)
+            .sum()
+        )
+        if inconsistent:
+            warnings.append(
+                f"⚠️  event_details: {inconsistent} eventos com data/local "
+                "diferentes entre linhas (vale a primeira)"
+            )
+    else:
+        issues.append(f"❌ Arquivo não encontrado: {path}")
+
+    # 3. Lutas
+    path = datasets / "fight_details.csv"
+    if path.exists():
+        print(f"\n🥊 {path}")
+        print("-" * 60)
+        frame = read_csv(path)
+        ids = column(frame, "fight_id")
+        fight_ids = set(ids)
+        print(f"✓ Linhas: {len(frame)}")
+
+        duplicated = int(ids.duplicated().sum())
+        if duplicated:
+            issues.append(f"❌ fight_details: {duplicated} fight_id duplicados")
+
+        if fighter_ids is not None:
+            unknown = ~column(frame, "r_id").isin(fighter_ids) | ~column(
+                frame, "b_id"
+            ).isin(fighter_ids)
+            if unknown.any():
+                warnings.append(
+                    f"⚠️  fight_details: {int(unknown.sum())} lutas com lutador "
+                    "fora do fighter_details (não serão importadas)"
+                )
+        if event_ids is not None:
+            unknown = ~column(frame, "event_id").isin(event_ids)
+            if unknown.any():
+                warnings.append(
+                    f"⚠️  fight_details: {int(unknown.sum())} lutas com evento "
+                    "fora do event_details (não serão importadas)"
+                )
+
+        report_invalid(
+            "fight_details",
+            {
+                **invalid_values(frame, FIGHT_INT_COLUMNS, to_float),
+                **invalid_values(frame, FIGHT_TIME_COLUMNS, to_seconds),
+            },
+            warnings,
+        )
+    else:
+        issues.append(f"❌ Arquivo não encontrado: {path}")
+
+    # 4. Resultados (vencedores e categorias de peso)
+    path = datasets / "UFC.csv"
+    if path.exists():
+        print(f"\n🏆 {path}")
+        print("-" * 60)
+        frame = read_csv(path, usecols=["fight_id", "winner", "r_name", "b_name"])
+        print(f"✓ Linhas: {len(frame)}")
+
+        if fight_ids is not None:
+            unknown = int((~column(frame, "fight_id").isin(fight_ids)).sum())
+            if unknown:
+                warnings.append(
+                    f"⚠️  UFC.csv: {unknown} lutas fora do fight_details "
+                    "(vencedor não será populado)"
+                )
+        winner = column(frame, "winner")
+        mismatched = int(
+            (
+                (winner != "")
+                & (winner != column(frame, "r_name"))
+                & (winner != column(frame, "b_name"))
+            ).sum()
+        )
+        if mismatched:
+            warnings.append(
+                f"⚠️  UFC.csv: {mismatched} vencedores que não batem com os "
+                "nomes dos corners (tratados como empate/NC)"
+            )
+    else:
+        warnings.append(f"⚠️  Arquivo não encontrado: {path}")
+
+    return print_result(issues, warnings, CSV_MESSAGES)
 
 
 if __name__ == "__main__":
-    exit_code = validate_import()
+    parser = argparse.ArgumentParser(description="Validação do dataset UFC")
+    parser.add_argument(
+        "--datasets-dir",
+        help="Valida os CSVs deste diretório (antes da importação), não o banco",
+    )
+    args = parser.parse_args()
+
+    if args.datasets_dir:
+        exit_code = validate_datasets(args.datasets_dir)
+    else:
+        exit_code = validate_import()
     sys.exit(exit_code)
@@ -0,0 +1,41 @@
+"""Testes do harness de microbenchmarks da simulação"""
+
+import io
+
+from scripts.benchmark_simulation import build_cases, compare, run_case
+from scripts.parse_ufc_dataset import parse_fighters, read_csv
+from app.database.models.base import Fighter
+
+FIGHTERS_CSV = """id,name,nick_name,wins,losses,draws,height,weight,reach,stance,dob,splm,str_acc,sapm,str_def,td_avg,td_avg_acc,td_def,sub_avg
+8f382b3baa954d2a,Jessica Aguilar,Jag,20,8,0,160.02,52.16,160.02,Orthodox,"May 08, 1982",4.93,50,7.19,53,0.94,25,50,0.2
+483a953b18d73bb3,Deron Winn,,7,3,0,165.1,83.91,,Orthodox,"Jun 13, 1989",3.1,44,6.21,46,4.28,52,40,0.5
+"""
+
+
+def test_compare_flags_only_regressions_above_threshold():
+    baseline = {"a": {"median_us": 10.0}, "b": {"median_us": 10.0}}
+    results = {
+        "a": {"median_us": 12.5},
+        "b": {"median_us": 11.0},
+        "new": {"median_us": 1.0},
+    }
+
+    regressions = compare(results, baseline, threshold=0.2)
+
+    assert list(regressions) == ["a"]
+    assert round(regressions["a"], 2) == 0.25
+
+
+def test_event_card_case_runs_without_database():
+    fighters = [
+        Fighter(id=index, **{k: v for k, v in data.items() if k != "import_hash"})
+        for index, data in enumerate(
+            parse_fighters(read_csv(io.StringIO(FIGHTERS_CSV)))
+        )
+    ]
+
+    cases = build_cases(fighters, model=None, seed=1)
+    result = run_case(cases["event_card"], rounds=2)
+
+    assert result["rounds"] == 2
+    assert result["median_us"] > 0
@@ -0,0 +1,81 @@
+"""Testes do middleware de compressão"""
+
+import asyncio
+import gzip
+import zlib
+
+import brotli
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+from app.middlewares.compression import CompressionMiddleware, negotiate_encoding
+
+
+def _app():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/small")
+    async def small():
+        return ORJSONResponse({"ok": True})
+
+    @app.get("/large")
+    async def large():
+        return ORJSONResponse({"fighters": ["Charles Oliveira"] * 200})
+
+    @app.get("/stream")
+    async def stream():
+        async def rows():
+            for number in range(100):
+                yield f'{{"row": {number}}}\n'.encode()
+
+        return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+    return app
+
+
+def _get(app, path, accept_encoding):
+    """Retorna a resposta e o corpo ainda comprimido"""
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            headers = {"accept-encoding": accept_encoding}
+            async with c.stream("GET", path, headers=headers) as response:
+                raw = b"".join([chunk async for chunk in response.aiter_raw()])
+        return response, raw
+
+    return asyncio.run(run())
+
+
+def test_negotiate_encoding():
+    assert negotiate_encoding("gzip, deflate, br") == "br"
+    assert negotiate_encoding("gzip;q=1.0, br;q=0.5") == "gzip"
+    assert negotiate_encoding("br;q=0, gzip") == "gzip"
+    assert negotiate_encoding("*") == "br"
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("") is None
+
+
+def test_threshold_one_shot_and_streaming():
+    app = _app()
+
+    response, raw = _get(app, "/small", "gzip")
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+
+    response, raw = _get(app, "/large", "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert int(response.headers["content-length"]) == len(raw)
+    assert b"Charles Oliveira" in gzip.decompress(raw)
+
+    response, raw = _get(app, "/large", "br")
+    assert response.headers["content-encoding"] == "br"
+    assert b"Charles Oliveira" in brotli.decompress(raw)
+
+    response, raw = _get(app, "/stream", "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    body = zlib.decompress(raw, 16 + zlib.MAX_WBITS)
+    assert body.count(b"\n") == 100
@@ -0,0 +1,59 @@
+"""Testes dos validadores de GET condicional"""
+
+from datetime import datetime, timezone
+
+from fastapi import Response
+from starlette.requests import Request
+
+from app.api.conditional import build_validators, not_modified, set_validators
+
+
+def _request(**headers):
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "headers": [
+                (k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()
+            ],
+        }
+    )
+
+
+def test_if_none_match_returns_304_with_validators():
+    modified = datetime(2024, 5, 1, 12, 0, 30, 500, tzinfo=timezone.utc)
+    validators = build_validators("fighter", 1, 42, last_modified=modified)
+
+    assert validators.etag.startswith('W/"')
+    assert build_validators("fighter", 1, 43).etag != validators.etag
+
+    cached = not_modified(_request(if_none_match=f'"x", {validators.etag}'), validators)
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == validators.etag
+    assert cached.headers["last-modified"] == "Wed, 01 May 2024 12:00:30 GMT"
+
+    assert not_modified(_request(if_none_match='W/"outro"'), validators) is None
+    assert not_modified(_request(), validators) is None
+
+
+def test_if_modified_since_only_without_if_none_match():
+    modified = datetime(2024, 5, 1, 12, 0, 30, tzinfo=timezone.utc)
+    validators = build_validators("events", 7, last_modified=modified)
+    response = Response()
+    set_validators(response, validators)
+    header = response.headers["last-modified"]
+
+    assert not_modified(_request(if_modified_since=header), validators) is not None
+    assert (
+        not_modified(
+            _request(if_modified_since="Wed, 01 May 2024 12:00:29 GMT"), validators
+        )
+        is None
+    )
+    # If-None-Match tem precedência
+    assert (
+        not_modified(
+            _request(if_none_match='W/"outro"', if_modified_since=header), validators
+        )
+        is None
+    )
@@ -0,0 +1,25 @@
+"""Testes dos contadores e da estimativa de contagem"""
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.database.models.base import EntityCounter, Fighter
+from app.database.models.counters import BUMP_FUNCTION_SQL, COUNTER_SHARDS
+from app.database.models.explain import ExplainJson
+
+
+def test_counters_are_sharded_per_transaction():
+    primary_key = [column.key for column in EntityCounter.__table__.primary_key]
+    assert primary_key == ["entity", "dimension", "value", "shard"]
+    assert f"txid_current() % {COUNTER_SHARDS}" in BUMP_FUNCTION_SQL
+    assert "ON CONFLICT (entity, dimension, value, shard)" in BUMP_FUNCTION_SQL
+
+
+def test_explain_binds_filter_values():
+    term = "x'); DROP TABLE fighters; --"
+    query = select(Fighter.id).filter(Fighter.name == term)
+    compiled = ExplainJson(query).compile(dialect=postgresql.asyncpg.dialect())
+
+    assert str(compiled).startswith("EXPLAIN (FORMAT JSON) SELECT fighters.id")
+    assert term not in str(compiled)
+    assert term in compiled.params.values()
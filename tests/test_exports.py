@@ -0,0 +1,46 @@
+"""Testes das exportações em streaming"""
+
+from datetime import datetime, timezone
+from uuid import UUID
+
+import orjson
+
+from app.database.exports import (
+    ExportEntity,
+    build_export_query,
+    encode_csv,
+    encode_ndjson,
+    export_columns,
+)
+
+
+def test_export_query():
+    assert "password" not in [c.key for c in export_columns(ExportEntity.users)]
+
+    since = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    fighters = str(build_export_query(ExportEntity.fighters, since))
+    assert "greatest(fighters.created_at, fighters.updated_at" in fighters
+    assert "WHERE" in fighters
+
+    simulations = str(build_export_query(ExportEntity.simulations))
+    assert "WHERE" not in simulations
+    assert "ORDER BY fight_simulations.created_at" in simulations
+
+
+def test_encoders():
+    row = {
+        "id": UUID(int=1),
+        "name": "Amanda Nunes",
+        "cartel": [{"result": "W"}],
+        "created_at": datetime(2026, 1, 2, tzinfo=timezone.utc),
+        "bio": None,
+    }
+    (line,) = encode_ndjson([row]).splitlines()
+    assert orjson.loads(line)["id"] == str(UUID(int=1))
+
+    csv = encode_csv([row.keys(), row.values()]).decode().splitlines()
+    assert csv[0] == "id,name,cartel,created_at,bio"
+    assert csv[1] == (
+        "00000000-0000-0000-0000-000000000001,Amanda Nunes,"
+        '"[{""result"":""W""}]",2026-01-02T00:00:00+00:00,'
+    )
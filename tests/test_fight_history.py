@@ -0,0 +1,98 @@
+"""Testes do histórico de lutas por lutador"""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+from sqlalchemy import select
+
+from app.database.models.base import Fighter
+from app.database.models.fight_history import CREATE_SQL
+from app.services.domain.fighter import FighterService
+
+FIGHTER_ID = UUID(int=1)
+
+
+def test_cartel_is_deferred_from_fighter_loads():
+    assert "cartel" not in str(select(Fighter))
+
+
+def test_view_covers_both_corners():
+    (statement,) = CREATE_SQL
+    assert "f.fighter1_id AS fighter_id" in statement
+    assert "f.fighter2_id AS fighter_id" in statement
+    assert "UNION ALL" in statement
+
+
+def _view_row(fight_id: int, event_date: datetime) -> dict:
+    return {
+        "fighter_id": FIGHTER_ID,
+        "fight_id": UUID(int=fight_id),
+        "event_id": UUID(int=100),
+        "event_name": "UFC 300",
+        "event_date": event_date,
+        "organization": "UFC",
+        "opponent_id": UUID(int=200),
+        "opponent_name": "Zhang Weili",
+        "result": "W",
+        "method": "KO/TKO",
+        "method_details": "Punches",
+        "round": 2,
+        "finish_time": "4:10",
+        "weight_class": "Strawweight",
+        "is_title_fight": True,
+    }
+
+
+def _service(history=([], 0), legacy=([], 0)) -> FighterService:
+    repository = AsyncMock()
+    repository.get_fight_history.return_value = history
+    repository.get_legacy_cartel.return_value = legacy
+    return FighterService(repository)
+
+
+def test_cartel_from_view_uses_cartel_keys():
+    date = datetime(2024, 4, 13, tzinfo=timezone.utc)
+    service = _service(history=([_view_row(1, date)], 7))
+
+    cartel = asyncio.run(service.get_fighter_cartel(FIGHTER_ID, limit=1, offset=3))
+
+    service.fighter_repo.get_fight_history.assert_awaited_once_with(
+        FIGHTER_ID, limit=1, offset=3
+    )
+    service.fighter_repo.get_legacy_cartel.assert_not_awaited()
+    assert (cartel.total, cartel.limit, cartel.offset) == (7, 1, 3)
+    (fight,) = cartel.fights
+    assert fight.opponent == "Zhang Weili"
+    assert fight.date == date
+    assert fight.fight_id == UUID(int=1)
+    assert "fighter_id" not in fight.model_dump()
+
+
+def test_cartel_falls_back_to_legacy_jsonb_with_same_schema():
+    legacy = [
+        {
+            "opponent": "Tom Aspinall",
+            "result": "L",
+            "method": "KO/TKO",
+            "round": 1,
+            "date": "22/07/2023",
+            "organization": "UFC",
+        }
+    ]
+    service = _service(legacy=(legacy, 12))
+
+    cartel = asyncio.run(service.get_fighter_cartel(FIGHTER_ID, limit=5, offset=10))
+
+    service.fighter_repo.get_legacy_cartel.assert_awaited_once_with(
+        FIGHTER_ID, limit=5, offset=10
+    )
+    assert (cartel.total, cartel.limit, cartel.offset) == (12, 5, 10)
+    (fight,) = cartel.fights
+    assert fight.date == datetime(2023, 7, 22, tzinfo=timezone.utc)
+    assert fight.fight_id is None and fight.finish_time is None
+
+    view = _service(history=([_view_row(1, fight.date)], 1))
+    view_fight = asyncio.run(view.get_fighter_cartel(FIGHTER_ID)).fights[0]
+    assert fight.model_dump().keys() == view_fight.model_dump().keys()
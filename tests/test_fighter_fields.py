@@ -0,0 +1,53 @@
+"""Testes dos campos esparsos das listagens de lutadores"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.schemas.domain.fighters.output import (
+    FIGHTER_LIST_FIELDS,
+    fighter_columns,
+    parse_fighter_fields,
+    project_fighter,
+)
+
+
+def test_parse_fighter_fields():
+    assert "cartel" not in FIGHTER_LIST_FIELDS
+    assert "bio" not in FIGHTER_LIST_FIELDS
+    assert parse_fighter_fields(None) == FIGHTER_LIST_FIELDS
+    assert parse_fighter_fields("name, record,name") == ("id", "name", "record")
+    with pytest.raises(ValueError):
+        parse_fighter_fields("name,password")
+
+
+def test_columns_and_projection():
+    fields = parse_fighter_fields("name,record,finish_rate,age")
+    assert fighter_columns(fields) == (
+        "id",
+        "name",
+        "wins",
+        "losses",
+        "draws",
+        "ko_wins",
+        "submission_wins",
+        "date_of_birth",
+    )
+
+    fighter = SimpleNamespace(
+        id=1,
+        name="Alex Pereira",
+        wins=10,
+        losses=2,
+        draws=0,
+        ko_wins=8,
+        submission_wins=0,
+        age=37,
+    )
+    assert project_fighter(fighter, fields) == {
+        "id": 1,
+        "name": "Alex Pereira",
+        "record": "10-2-0",
+        "finish_rate": 80.0,
+        "age": 37,
+    }
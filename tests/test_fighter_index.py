@@ -0,0 +1,68 @@
+"""Testes do índice de autocomplete em memória"""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.services.domain.fighter_index import FighterPrefixIndex
+
+
+def _fighter(name, nickname=None, wins=0):
+    return SimpleNamespace(
+        id=uuid4(),
+        name=name,
+        nickname=nickname,
+        last_organization_fight="UFC",
+        actual_weight_class="Lightweight",
+        wins=wins,
+        losses=0,
+        draws=0,
+        striking=50,
+        grappling=50,
+        defense=50,
+        stamina=50,
+        speed=50,
+        strategy=50,
+    )
+
+
+def test_complete_matches_any_word_accent_insensitive_by_popularity():
+    index = FighterPrefixIndex()
+    aldo = _fighter("José Aldo", "Scarface", wins=31)
+    jose = _fighter("Jose Torres", wins=5)
+    index.load([jose, aldo, _fighter("Islam Makhachev", wins=26)])
+
+    assert [s.name for s in index.complete("JOSÉ")] == ["José Aldo", "Jose Torres"]
+    assert [s.name for s in index.complete("ald")] == ["José Aldo"]
+    assert [s.name for s in index.complete("scar")] == ["José Aldo"]
+    assert index.complete("jose", limit=1)[0].id == aldo.id
+
+
+def test_write_hooks_refresh_results():
+    index = FighterPrefixIndex()
+    fighter = _fighter("Charles Oliveira")
+    index.load([fighter])
+
+    fighter.name = "Charles do Bronx"
+    index.upsert(fighter)
+    assert [s.name for s in index.complete("bronx")] == ["Charles do Bronx"]
+    assert index.complete("oliveira") == []
+
+    index.remove(fighter.id)
+    assert index.complete("charles") == []
+    assert index.stats()["fighters"] == 0
+
+
+def test_write_hooks_keep_keys_sorted_without_rebuild():
+    index = FighterPrefixIndex()
+    index.load([_fighter("Alex Pereira"), _fighter("Israel Adesanya")])
+    index._rebuild = None  # escritas não podem depender de reconstrução
+
+    jiri = _fighter("Jiří Procházka", "Denisa", wins=30)
+    index.upsert(jiri)
+    index.upsert(_fighter("Jan Blachowicz", wins=29))
+    jiri.nickname = None
+    index.upsert(jiri)
+
+    assert index._keys == sorted(index._keys)
+    assert [s.name for s in index.complete("j")] == ["Jiří Procházka", "Jan Blachowicz"]
+    assert index.complete("denisa") == []
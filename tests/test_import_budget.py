@@ -0,0 +1,10 @@
+"""Dependências pesadas não podem voltar para o import do app"""
+
+from scripts.import_time_report import DEFAULT_FORBIDDEN, measure
+
+
+def test_app_main_import_skips_heavy_optional_dependencies():
+    rows, loaded = measure("app.main")
+
+    assert rows
+    assert not [name for name in DEFAULT_FORBIDDEN if name in loaded]
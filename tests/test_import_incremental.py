@@ -0,0 +1,40 @@
+"""Testes da detecção de mudanças da importação incremental"""
+
+from scripts import parse_ufc_dataset
+from scripts.parse_ufc_dataset import file_hash, row_hash
+
+
+def test_row_hash():
+    row = {"id": "8f382b3baa954d2a", "name": "Jessica Aguilar", "wins": "20"}
+
+    # Independe da ordem das colunas e de espaços nas bordas
+    reordered = {"wins": " 20", "name": "Jessica Aguilar ", "id": "8f382b3baa954d2a"}
+    assert row_hash(row) == row_hash(reordered)
+    assert len(row_hash(row)) == 32
+
+    assert row_hash(row) != row_hash({**row, "wins": "21"})
+    # Vazio e ausente (linha curta do DictReader) são equivalentes
+    assert row_hash({**row, "nick_name": ""}) == row_hash({**row, "nick_name": None})
+
+
+def test_file_hash(tmp_path):
+    path = tmp_path / "fighters.csv"
+    path.write_text("id,name\n1,A\n")
+    digest = file_hash(str(path))
+
+    assert file_hash(str(path)) == digest
+    path.write_text("id,name\n1,B\n")
+    assert file_hash(str(path)) != digest
+
+
+def test_parser_version_invalidates_hashes(tmp_path, monkeypatch):
+    path = tmp_path / "fighters.csv"
+    path.write_text('id,dob\n1,"Jun 13, 1989"\n')
+    row = {"id": "1", "dob": "Jun 13, 1989"}
+    before = row_hash(row), file_hash(str(path))
+
+    monkeypatch.setattr(
+        parse_ufc_dataset, "PARSER_VERSION", parse_ufc_dataset.PARSER_VERSION + 1
+    )
+    after = row_hash(row), file_hash(str(path))
+    assert before[0] != after[0] and before[1] != after[1]
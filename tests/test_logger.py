@@ -0,0 +1,51 @@
+"""Testes do pipeline de logging"""
+
+import logging
+
+import orjson
+
+from app.core.logger import (
+    JsonFormatter,
+    ModuleLevelFilter,
+    SamplingFilter,
+    parse_levels,
+)
+
+
+def _record(level=logging.INFO, lineno=10, created=1000.0, **extra):
+    record = logging.LogRecord(
+        "app.core.logger", level, "/app/x.py", lineno, "a=%s", ("b",), None
+    )
+    record.created = created
+    record.__dict__.update(extra)
+    return record
+
+
+def test_sampling_limits_info_per_call_site_and_counts_suppressed():
+    sampler = SamplingFilter(per_second=2)
+
+    kept = [sampler.filter(_record()) for _ in range(5)]
+    assert kept == [True, True, False, False, False]
+    assert sampler.filter(_record(lineno=11))  # outra linha, outra cota
+    assert sampler.filter(_record(level=logging.WARNING))
+
+    record = _record(created=1001.0)  # próximo segundo
+    assert sampler.filter(record)
+    assert record.suppressed == 3
+
+
+def test_module_levels_and_json_output():
+    levels = parse_levels("x=WARNING; sqlalchemy.engine=info, bad=NOPE")
+    assert levels == {"x": logging.WARNING, "sqlalchemy.engine": logging.INFO}
+
+    level_filter = ModuleLevelFilter(logging.INFO, {"x": logging.WARNING})
+    assert not level_filter.filter(_record())
+    assert level_filter.filter(_record(level=logging.ERROR))
+
+    payload = orjson.loads(
+        JsonFormatter().format(_record(trace_id="t-1", status_code=200))
+    )
+    assert payload["message"] == "a=b"
+    assert payload["trace_id"] == "t-1"
+    assert payload["status_code"] == 200
+    assert payload["level"] == "INFO"
@@ -0,0 +1,49 @@
+"""Testes das métricas Prometheus"""
+
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+
+from app.api.metrics import router as metrics_router
+from app.core.metrics import REGISTRY
+from app.middlewares.metrics import MetricsMiddleware
+
+
+def _app():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router)
+
+    @app.get("/fighters/{fighter_id}")
+    async def get_fighter(fighter_id: str):
+        return ORJSONResponse({"id": fighter_id})
+
+    return app
+
+
+def _count(route: str, status: str) -> float:
+    labels = {"method": "GET", "route": route, "status": status}
+    value = REGISTRY.get_sample_value("http_request_duration_seconds_count", labels)
+    return value or 0.0
+
+
+def test_latency_is_labeled_by_route_template():
+    before = _count("/fighters/{fighter_id}", "200")
+    unmatched = _count("unmatched", "404")
+
+    async def run():
+        transport = httpx.ASGITransport(app=_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            await c.get("/fighters/1")
+            await c.get("/fighters/2")
+            await c.get("/missing")
+            return await c.get("/metrics")
+
+    response = asyncio.run(run())
+
+    assert _count("/fighters/{fighter_id}", "200") == before + 2
+    assert _count("unmatched", "404") == unmatched + 1
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "http_requests_in_progress" in response.text
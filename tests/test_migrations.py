@@ -0,0 +1,42 @@
+"""Testes da checagem de schema no startup"""
+
+import asyncio
+
+import pytest
+
+from app.database import migrations
+
+
+def _patch(monkeypatch, current: set[str], mode: str = "check"):
+    async def fake_current_revisions():
+        return current
+
+    monkeypatch.setattr(migrations, "current_revisions", fake_current_revisions)
+    monkeypatch.setattr(migrations.settings, "MIGRATIONS_ON_STARTUP", mode)
+
+
+def test_ensure_schema_accepts_database_at_head(monkeypatch):
+    _patch(monkeypatch, migrations.head_revisions())
+    asyncio.run(migrations.ensure_schema())
+
+
+def test_ensure_schema_refuses_outdated_database(monkeypatch):
+    # Revisão inicial: o banco está atrás do código
+    _patch(monkeypatch, {"5498edf5c956"})
+    with pytest.raises(migrations.SchemaNotAtHeadError):
+        asyncio.run(migrations.ensure_schema())
+
+    _patch(monkeypatch, set())
+    with pytest.raises(migrations.SchemaNotAtHeadError):
+        asyncio.run(migrations.ensure_schema())
+
+    _patch(monkeypatch, {"5498edf5c956"}, mode="off")
+    asyncio.run(migrations.ensure_schema())
+
+
+def test_ensure_schema_accepts_database_ahead_of_code(monkeypatch):
+    # Rolling deploy: o migrate do deploy novo já aplicou uma revisão que
+    # este código não conhece
+    _patch(monkeypatch, {"ffff00newer"})
+    asyncio.run(migrations.ensure_schema())
+    assert migrations.missing_revisions({"ffff00newer"}) == set()
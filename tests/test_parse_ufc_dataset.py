@@ -0,0 +1,91 @@
+"""Testes da etapa de parse vetorizado dos CSVs do dataset UFC"""
+
+import csv
+import io
+from datetime import datetime, timezone
+
+from scripts.parse_ufc_dataset import (
+    frame_hashes,
+    parse_events,
+    parse_fighters,
+    parse_fights,
+    read_batches,
+    read_csv,
+    row_hash,
+)
+
+FIGHTERS_CSV = """id,name,nick_name,wins,losses,draws,height,weight,reach,stance,dob,splm,str_acc,sapm,str_def,td_avg,td_avg_acc,td_def,sub_avg
+8f382b3baa954d2a,Jessica Aguilar,Jag,20,8,0,160.02,52.16,160.02,Orthodox,"May 08, 1982",4.93,50,7.19,53,0.94,25,50,0.2
+483a953b18d73bb3, Deron Winn ,,7,3,0,--,83.91,,Orthodox,"Jun 13, 1989",--,0,6.21,46,4.28,52,40,x
+"""
+
+
+def frame(text: str):
+    return read_csv(io.StringIO(text))
+
+
+def test_parse_fighters():
+    aguilar, winn = parse_fighters(frame(FIGHTERS_CSV))
+
+    assert aguilar["name"] == "Jessica Aguilar"
+    assert aguilar["date_of_birth"] == datetime(1982, 5, 8)
+    assert aguilar["wins"] == 20 and isinstance(aguilar["wins"], int)
+    assert aguilar["striking"] == 99  # int(4.93 * 10 + 50)
+    assert aguilar["defense"] == 51  # int(53 + 50) // 2
+
+    assert winn["name"] == "Deron Winn"
+    assert winn["nickname"] is None
+    assert winn["date_of_birth"] == datetime(1989, 6, 13)
+    # '--', vazio e texto inválido viram None
+    assert winn["height_cm"] is None and winn["reach_cm"] is None
+    assert winn["slpm"] is None and winn["sub_avg"] is None
+    # `str_acc or 50`: zero também cai no padrão
+    assert winn["striking"] == 50
+    assert winn["speed"] == 45
+
+
+def test_hashes_match_csv_rows():
+    chunk = frame(FIGHTERS_CSV)
+    rows = csv.DictReader(io.StringIO(FIGHTERS_CSV))
+    assert frame_hashes(chunk) == [row_hash(row) for row in rows]
+    assert [f["import_hash"] for f in parse_fighters(chunk)] == frame_hashes(chunk)
+
+
+def test_parse_events():
+    (event,) = parse_events(
+        frame(
+            "event_id,fight_id,date,location\n"
+            'e1,f1,"September 06, 2025",Paris\n'
+            'e1,f2,"September 06, 2025",Paris\n'
+        )
+    )
+    assert event["date"] == datetime(2025, 9, 6, tzinfo=timezone.utc)
+    assert event["import_hash"] == row_hash(
+        {"event_id": "e1", "location": "Paris", "date": "September 06, 2025"}
+    )
+
+
+def test_parse_fights():
+    ko, decision = parse_fights(
+        frame(
+            "fight_id,event_id,r_id,b_id,method,total_rounds,title_fight,r_ctrl,b_kd\n"
+            "f1,e1,r,b,TKO - Punches,5,1,2:05,--\n"
+            "f2,e1,r,b,Decision - Split,,0,,1\n"
+        )
+    )
+    assert ko["result_type"] == "KO/TKO"
+    assert ko["rounds"] == 5 and ko["is_title_fight"] is True
+    assert ko["r_ctrl_seconds"] == 125 and ko["b_kd"] is None
+
+    assert decision["result_type"] == "Decision"
+    assert decision["rounds"] == 3 and decision["is_title_fight"] is False
+    assert decision["r_ctrl_seconds"] is None and decision["b_kd"] == 1
+
+
+def test_read_batches(tmp_path):
+    path = tmp_path / "fighter_details.csv"
+    path.write_text(FIGHTERS_CSV)
+
+    batches = list(read_batches(str(path), parse_fighters, chunksize=1))
+    assert [len(batch) for batch in batches] == [1, 1]
+    assert batches[1][0]["name"] == "Deron Winn"
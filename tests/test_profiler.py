@@ -0,0 +1,64 @@
+"""Testes do profiler por amostragem"""
+
+import asyncio
+import threading
+import time
+from collections import Counter
+
+from app.core.profiler import (
+    AWAIT_FRAME,
+    StackSampler,
+    summarize,
+    write_folded,
+)
+
+
+def _busy(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(range(200))
+
+
+def test_sampler_collects_folded_stacks(tmp_path):
+    sampler = StackSampler(thread_id=threading.get_ident(), interval=0.001).start()
+    _busy(0.1)
+    samples = sampler.stop()
+
+    assert sum(samples.values()) > 0
+    top_stack = samples.most_common(1)[0][0]
+    assert top_stack.endswith("_busy (tests/test_profiler.py)")
+
+    path = write_folded(samples, tmp_path / "p.folded")
+    stack, count = path.read_text().splitlines()[0].rsplit(" ", 1)
+    assert samples[stack] == int(count)
+    assert summarize(Counter({"a;b": 3, "c;b": 1}))["top_functions"][0] == {
+        "function": "b",
+        "samples": 4,
+        "percent": 100.0,
+    }
+
+
+def test_sampler_follows_only_its_task():
+    async def profiled():
+        await asyncio.sleep(0.05)
+        _busy(0.05)
+
+    async def other():
+        _busy(0.05)
+
+    async def run():
+        task = asyncio.create_task(profiled())
+        sampler = StackSampler(
+            thread_id=threading.get_ident(),
+            interval=0.001,
+            task=task,
+            loop=asyncio.get_running_loop(),
+        ).start()
+        await asyncio.gather(task, other())
+        return sampler.stop()
+
+    samples = asyncio.run(run())
+
+    assert any(stack.startswith(AWAIT_FRAME) for stack in samples)
+    assert any("profiled" in stack and "_busy" in stack for stack in samples)
+    assert not any("other" in stack for stack in samples)
@@ -0,0 +1,41 @@
+"""Testes da contagem de queries por requisição"""
+
+from sqlalchemy import create_engine, text
+
+from app.core.query_stats import (
+    get_query_stats,
+    instrument_engine,
+    normalize_sql,
+    parameters_shape,
+    track_queries,
+)
+
+
+def test_track_queries_counts_statements_in_context():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    instrument_engine(engine)  # idempotente
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))  # fora do contexto
+        with track_queries() as stats:
+            for value in range(3):
+                connection.execute(text("SELECT :value"), {"value": value})
+            connection.execute(text("SELECT 2"))
+        assert get_query_stats() is None
+
+    assert stats.count == 4
+    assert stats.duration > 0
+    assert stats.repeated(2) == {"SELECT ?": 3}
+    assert stats.repeated(3) == {}
+
+
+def test_normalize_sql_and_parameters_shape():
+    statement = "SELECT *\n  FROM fighters WHERE id IN ($1::UUID, $2::UUID) AND x = $3"
+
+    assert normalize_sql(statement) == (
+        "SELECT * FROM fighters WHERE id IN (...) AND x = $3"
+    )
+    assert parameters_shape(("a", 1)) == "(str, int)"
+    assert parameters_shape({"limit": 10}) == "{limit: int}"
+    assert parameters_shape([(1,), (2,)], executemany=True) == "2 x (int)"
@@ -0,0 +1,89 @@
+"""Testes do middleware de cache de respostas"""
+
+import asyncio
+import gzip
+
+import httpx
+from fastapi import FastAPI
+
+from app.core.response_cache import CachedResponse, response_cache
+from app.middlewares.response_cache import ResponseCacheMiddleware
+
+
+def _app():
+    app = FastAPI()
+    app.add_middleware(ResponseCacheMiddleware)
+    calls = {"count": 0}
+
+    @app.get("/api/v1/fighters/rankings/top")
+    async def top(limit: int = 10):
+        calls["count"] += 1
+        await asyncio.sleep(0.05)
+        return {"limit": limit, "fighters": ["x" * 50] * limit}
+
+    return app, calls
+
+
+def test_concurrent_misses_are_coalesced_and_hits_are_gzipped():
+    app, calls = _app()
+
+    async def run():
+        await response_cache.clear()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            url = "/api/v1/fighters/rankings/top?limit=5"
+            responses = await asyncio.gather(*[c.get(url) for _ in range(10)])
+            assert calls["count"] == 1
+            assert {r.json()["limit"] for r in responses} == {5}
+            assert sorted(r.headers["x-cache"] for r in responses)[0] == "HIT"
+
+            raw = await c.get(url, headers={"accept-encoding": "gzip"})
+            assert raw.headers["content-encoding"] == "gzip"
+            assert raw.json()["limit"] == 5
+
+            plain = await c.get(url, headers={"accept-encoding": "identity"})
+            assert "content-encoding" not in plain.headers
+            assert len(plain.content) > len(gzip.compress(plain.content))
+
+            # Outro valor na query gera outra chave
+            await c.get("/api/v1/fighters/rankings/top?limit=6")
+            assert calls["count"] == 2
+
+    asyncio.run(run())
+
+
+def test_tag_invalidation_and_role_in_key():
+    app, calls = _app()
+
+    async def run():
+        await response_cache.clear()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            url = "/api/v1/fighters/rankings/top"
+            await c.get(url)
+            await c.get(url)
+            assert calls["count"] == 1
+
+            # Token inválido conta como anônimo (mesma chave)
+            await c.get(url, headers={"authorization": "Bearer invalido"})
+            assert calls["count"] == 1
+
+            await response_cache.invalidate("fighters")
+            response = await c.get(url)
+            assert response.headers["x-cache"] == "MISS"
+            assert calls["count"] == 2
+
+            await response_cache.invalidate("events")
+            assert (await c.get(url)).headers["x-cache"] == "HIT"
+
+    asyncio.run(run())
+
+
+def test_cached_entry_keeps_every_encoding_and_round_trips():
+    entry = CachedResponse.build(
+        200, [(b"content-type", b"application/json")], b'{"a": 1}' * 100
+    )
+
+    assert set(entry.bodies) == {"br", "gzip"}
+    assert entry.body(None) == b'{"a": 1}' * 100
+    assert CachedResponse.loads(entry.dumps()) == entry
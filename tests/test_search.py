@@ -0,0 +1,20 @@
+"""Testes da busca por similaridade"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from sqlalchemy.dialects import postgresql
+
+from app.database.models.base import Fighter
+from app.database.repositories.fighter import FighterRepository
+
+
+def test_like_wildcards_in_term_are_literal():
+    repository = FighterRepository(None)
+    condition, _ = asyncio.run(
+        repository._similarity_match(AsyncMock(), [Fighter.name], "100%_a/b")
+    )
+    compiled = condition.compile(dialect=postgresql.asyncpg.dialect())
+
+    assert "ESCAPE '/'" in str(compiled)
+    assert "100/%/_a//b" in compiled.params.values()
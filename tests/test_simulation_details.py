@@ -0,0 +1,61 @@
+"""Testes do formato compacto de simulation_details"""
+
+from app.database.models.simulation_details import (
+    encode_simulation_details,
+    is_compact,
+    render_simulation_details,
+)
+
+LEGACY_DETAILS = {
+    "rounds": [
+        {
+            "round_number": 1,
+            "fighter1_points": 21.37,
+            "fighter2_points": 14.02,
+            "dominant_fighter": "Charles Oliveira",
+            "events": [
+                "Charles Oliveira dominou o round",
+                "Charles Oliveira tentou uma finalização",
+            ],
+        },
+        {
+            "round_number": 2,
+            "fighter1_points": 12.5,
+            "fighter2_points": 18.91,
+            "dominant_fighter": "Islam Makhachev",
+            "events": [
+                "Islam Makhachev conseguiu um takedown",
+                "Evento desconhecido",
+            ],
+        },
+    ],
+    "total_points": {"fighter1": 33.87, "fighter2": 32.93},
+}
+
+
+def test_encode_uses_codes_and_scaled_points():
+    compact = encode_simulation_details(
+        LEGACY_DETAILS, "Charles Oliveira", "Islam Makhachev"
+    )
+
+    assert is_compact(compact)
+    assert compact["r"][0] == [1, 2137, 1402, 1, [1, 4]]
+    assert compact["r"][1] == [2, 1250, 1891, 2, [2, "Evento desconhecido"]]
+    assert compact["t"] == [3387, 3293]
+
+
+def test_render_restores_legacy_shape():
+    compact = encode_simulation_details(
+        LEGACY_DETAILS, "Charles Oliveira", "Islam Makhachev"
+    )
+
+    assert (
+        render_simulation_details(compact, "Charles Oliveira", "Islam Makhachev")
+        == LEGACY_DETAILS
+    )
+
+
+def test_legacy_and_empty_details_pass_through():
+    assert render_simulation_details(LEGACY_DETAILS, "A", "B") is LEGACY_DETAILS
+    assert encode_simulation_details({}, "A", "B") == {}
+    assert render_simulation_details(None, "A", "B") is None
@@ -0,0 +1,68 @@
+"""Testes do single-flight"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.core.single_flight import SingleFlight, single_flight
+
+
+class _Service:
+    executions = 0
+
+    @single_flight("tests.predict")
+    async def predict(self, fighter1_id, fighter2_id, exact: bool = False):
+        _Service.executions += 1
+        await asyncio.sleep(0.02)
+        if fighter1_id == fighter2_id:
+            raise ValueError("mesmo lutador")
+        return {"pair": (str(fighter1_id), str(fighter2_id)), "exact": exact}
+
+
+def test_identical_concurrent_calls_share_one_execution():
+    f1, f2 = uuid4(), uuid4()
+
+    async def run():
+        _Service.executions = 0
+        results = await asyncio.gather(
+            *[_Service().predict(f1, f2) for _ in range(5)],
+            _Service().predict(fighter1_id=f1, fighter2_id=f2, exact=False),
+            _Service().predict(f2, f1),
+        )
+        assert _Service.executions == 2
+        assert results[0] == results[5]
+        # Cada chamada recebe o seu próprio objeto
+        results[5]["exact"] = True
+        assert results[0]["exact"] is False and results[1]["exact"] is False
+        assert results[6]["pair"] == (str(f2), str(f1))
+
+        with pytest.raises(ValueError):
+            await asyncio.gather(_Service().predict(f1, f1), _Service().predict(f1, f1))
+
+    asyncio.run(run())
+    stats = _Service.predict.single_flight.stats()
+    assert stats["deduplicated"] == 6
+    assert stats["failures"] == 1
+    assert stats["inflight"] == 0
+
+
+def test_followers_retry_when_leader_is_cancelled():
+    group = SingleFlight("tests.cancel")
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def run():
+        leader = asyncio.create_task(group.do("k", compute))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(group.do("k", compute))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        assert await follower == 2
+
+    asyncio.run(run())
+    assert group.stats()["executions"] == 2
@@ -0,0 +1,103 @@
+"""Testes do tracing OpenTelemetry"""
+
+import asyncio
+from uuid import uuid4
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from app.core import tracing
+from app.middlewares.trace_id import CreateTraceIdMiddleware
+from app.middlewares.tracing import TracingMiddleware
+
+
+@tracing.traced_methods(exclude=("skipped",))
+class _Service:
+    async def load(self, fighter_id: str) -> dict:
+        return {"id": fighter_id}
+
+    def skipped(self) -> None:
+        pass
+
+
+def test_spans_for_route_and_service_methods(monkeypatch):
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(tracing, "tracer", provider.get_tracer("test"))
+    monkeypatch.setattr("app.middlewares.tracing.tracer", tracing.tracer)
+    monkeypatch.setattr(tracing, "_enabled", True)
+
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware)
+    app.add_middleware(CreateTraceIdMiddleware)
+
+    @app.get("/fighters/{fighter_id}")
+    async def get_fighter(fighter_id: str):
+        service = _Service()
+        service.skipped()
+        return ORJSONResponse(await service.load(fighter_id))
+
+    parent = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            return await c.get("/fighters/1", headers={"traceparent": parent})
+
+    assert asyncio.run(run()).status_code == 200
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    assert set(spans) == {"GET /fighters/{fighter_id}", "_Service.load"}
+    server = spans["GET /fighters/{fighter_id}"]
+    assert server.attributes["http.response.status_code"] == 200
+    assert server.context.trace_id == 0x0AF7651916CD43DD8448EB211C80319C
+    assert server.attributes["app.trace_id"]
+    assert spans["_Service.load"].parent.span_id == server.context.span_id
+
+
+def test_sample_ratio_is_honored_for_requests_with_x_trace_id(monkeypatch):
+    exporter = InMemorySpanExporter()
+    provider = tracing.create_provider(0.25)
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr("app.middlewares.tracing.tracer", provider.get_tracer("t"))
+    monkeypatch.setattr(tracing, "_enabled", True)
+
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware)
+    app.add_middleware(CreateTraceIdMiddleware)
+
+    @app.get("/ping")
+    async def ping():
+        return ORJSONResponse({})
+
+    requests = 2000
+    trace_ids = [str(uuid4()) for _ in range(requests)]
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            for trace_id in trace_ids:
+                await c.get("/ping", headers={"x-trace-id": trace_id})
+
+    asyncio.run(run())
+
+    spans = exporter.get_finished_spans()
+    assert 0.2 < len(spans) / requests < 0.3
+    # O id do cliente não vira o trace id (nem decide a amostragem)
+    assert {span.attributes["app.trace_id"] for span in spans} <= set(trace_ids)
+    client_ids = {int(trace_id.replace("-", ""), 16) for trace_id in trace_ids}
+    assert not {span.context.trace_id for span in spans} & client_ids
+
+
+def test_traced_is_passthrough_when_disabled():
+    assert not tracing.tracing_enabled()
+    assert asyncio.run(_Service().load("1")) == {"id": "1"}
+    assert trace.get_current_span() is trace.INVALID_SPAN
@@ -0,0 +1,41 @@
+"""Testes do warm-up e do /readyz"""
+
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+
+from app.api.health_check import router as health_router
+from app.services import warmup
+
+
+def test_readyz_reports_warm_up_and_survives_failed_steps(monkeypatch):
+    async def broken_index():
+        raise RuntimeError("banco fora")
+
+    monkeypatch.setattr(warmup, "readiness", warmup.Readiness())
+    monkeypatch.setattr("app.api.health_check.readiness", warmup.readiness)
+    monkeypatch.setattr(warmup, "load_fighter_index", broken_index)
+    monkeypatch.setattr(warmup, "_warm_model", lambda batch: batch)
+    monkeypatch.setattr(warmup.settings, "WARMUP_DB_CONNECTIONS", 0)
+    monkeypatch.setattr(warmup.settings, "WARMUP_PRIME_CACHE", False)
+
+    app = FastAPI()
+    app.include_router(health_router)
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            before = await c.get("/readyz")
+            await warmup.run_warm_up(app)
+            return before, await c.get("/readyz"), await c.get("/healthcheck")
+
+    before, after, health = asyncio.run(run())
+
+    assert before.status_code == 503
+    assert health.status_code == 200
+    assert after.status_code == 200
+    steps = after.json()["steps"]
+    assert steps["model"]["result"] == 8
+    assert steps["fighter_index"]["status"] == "error"
+    assert steps["db_pool"]["result"] == 0